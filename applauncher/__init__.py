@@ -0,0 +1,3 @@
+"""
+Claude App Launcher core - discovery and execution helpers shared by the launcher UI
+"""
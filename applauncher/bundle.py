@@ -0,0 +1,247 @@
+"""
+App bundles - one .pyz file holding an app, its pure-Python dependencies and
+wheels for the compiled ones, so it runs with `python app.pyz` and no install
+
+Pure-Python packages are unpacked into the archive and imported from it
+directly. Compiled ones cannot be imported from inside a zip; the bundle
+extracts their wheels once into a cache folder on the recipient's machine.
+"""
+
+import hashlib
+import inspect
+import os
+import shutil
+import tempfile
+import zipapp
+import zipfile
+from pathlib import Path
+
+from applauncher.dependencies import SKIP_DIRS
+from applauncher.envs import install_args, venv_python, venv_python_version
+from applauncher.wheelhouse import WHEEL_SUFFIX, build_wheels
+
+
+# Bundles are written to <app>/dist/<app>.pyz
+BUNDLE_DIR = "dist"
+BUNDLE_SUFFIX = ".pyz"
+
+# Folders inside the archive
+APP_DIR = "_app"
+LIB_DIR = "_lib"
+NATIVE_DIR = "_wheels"
+
+BUNDLE_INTERPRETER = "/usr/bin/env python3"
+
+# The archive's __main__.py - sets up sys.path and runs the app's entry point
+BOOTSTRAP_TEMPLATE = '''"""Bootstrap of a bundle made by the Python App Launcher"""
+
+import io
+import os
+import shutil
+import sys
+import types
+import zipfile
+import zipimport
+
+ENTRY = {entry!r}
+ARGS = {args!r}
+ENV = {env!r}
+BUNDLE_ID = {bundle_id!r}
+# Python the compiled wheels were built for (they only load on that version)
+PYTHON = {python!r}
+NATIVE_WHEELS = {native!r}
+
+ARCHIVE = os.path.dirname(os.path.abspath(__file__))
+
+
+def cache_dir():
+    if sys.platform == "win32":
+        root = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    else:
+        root = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(root, "launcher-bundles", BUNDLE_ID)
+
+
+{wheel_member_path}
+
+def extract_native_wheels():
+    """Unpack the compiled wheels into the cache the first time the bundle runs"""
+    target = cache_dir()
+    if os.path.isdir(target):
+        return target
+    
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    staging = "%s.tmp-%d" % (target, os.getpid())
+    with zipfile.ZipFile(ARCHIVE) as bundle:
+        for wheel_name in NATIVE_WHEELS:
+            data = io.BytesIO(bundle.read("{native_dir}/" + wheel_name))
+            with zipfile.ZipFile(data) as wheel:
+                for member in wheel.infolist():
+                    path = wheel_member_path(member.filename)
+                    if path is None or member.is_dir():
+                        continue
+                    dest = os.path.join(staging, *path.split("/"))
+                    os.makedirs(os.path.dirname(dest), exist_ok=True)
+                    with wheel.open(member) as src, open(dest, "wb") as dst:
+                        shutil.copyfileobj(src, dst)
+                    mode = member.external_attr >> 16
+                    if mode:
+                        os.chmod(dest, mode)
+    
+    try:
+        os.rename(staging, target)
+    except OSError:
+        # Another start of the bundle finished first
+        shutil.rmtree(staging, ignore_errors=True)
+    return target
+
+
+def main():
+    if NATIVE_WHEELS:
+        if PYTHON and tuple(sys.version_info[:2]) != tuple(PYTHON):
+            sys.exit("This bundle needs Python %d.%d (its compiled packages were built for it)"
+                     % tuple(PYTHON))
+        sys.path.insert(0, extract_native_wheels())
+    sys.path.insert(0, os.path.join(ARCHIVE, "{lib_dir}"))
+    
+    entry_dir, _, entry_file = ENTRY.rpartition("/")
+    app_dir = os.path.join(ARCHIVE, "{app_dir}", *entry_dir.split("/")) if entry_dir else \\
+        os.path.join(ARCHIVE, "{app_dir}")
+    sys.path.insert(0, app_dir)
+    
+    os.environ.update(ENV)
+    sys.argv = [ENTRY] + ARGS + sys.argv[1:]
+    
+    # Run the entry point as __main__, read from the archive like any other module
+    code = zipimport.zipimporter(app_dir).get_code(entry_file[:-3])
+    module = types.ModuleType("__main__")
+    module.__file__ = os.path.join(app_dir, entry_file)
+    module.__builtins__ = __builtins__
+    sys.modules["__main__"] = module
+    exec(code, module.__dict__)
+
+
+main()
+'''
+
+
+def is_pure_wheel(name):
+    """True for wheels that work on any platform (abi "none", platform "any")"""
+    tags = name[:-len(WHEEL_SUFFIX)].split("-")
+    return len(tags) >= 5 and tags[-2] == "none" and tags[-1] == "any"
+
+
+def wheel_member_path(name):
+    """Where a file in a wheel goes when installed, or None for scripts and headers"""
+    first, _, rest = name.partition("/")
+    if first.endswith(".data"):
+        kind, _, rest = rest.partition("/")
+        return rest if kind in ("purelib", "platlib") and rest else None
+    return name
+
+
+def unpack_wheel(wheel, target):
+    """Install a pure-Python wheel by unpacking it into target"""
+    with zipfile.ZipFile(wheel) as archive:
+        for member in archive.infolist():
+            path = wheel_member_path(member.filename)
+            if path is None or member.is_dir():
+                continue
+            dest = target.joinpath(*path.split("/"))
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            with archive.open(member) as src, open(dest, 'wb') as dst:
+                shutil.copyfileobj(src, dst)
+
+
+def iter_app_files(folder):
+    """Yield (relative path, absolute path) for every file of the app that goes into a bundle"""
+    pending = [(folder, "")]
+    
+    while pending:
+        directory, prefix = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                entries = sorted(entries, key=lambda entry: entry.name)
+        except OSError:
+            continue
+        
+        for entry in entries:
+            name = entry.name
+            # Hidden files include .venv and the launcher's own files
+            if name.startswith('.'):
+                continue
+            if entry.is_file():
+                yield prefix + name, entry.path
+            elif (entry.is_dir(follow_symlinks=False) and name not in SKIP_DIRS
+                  and not os.path.exists(os.path.join(entry.path, "pyvenv.cfg"))):
+                pending.append((entry.path, prefix + name + "/"))
+
+
+def bundle_path(app_info):
+    """Where the app's bundle is written"""
+    folder = app_info['folder']
+    return folder / BUNDLE_DIR / (folder.name + BUNDLE_SUFFIX)
+
+
+def build_bundle(uv, app_info, venv_path, find_links=None):
+    """Build the app's .pyz bundle from wheels made for its environment's interpreter
+    
+    find_links is a folder of wheels (the wheelhouse) to use before
+    downloading. Returns (bundle path, pure wheel names, compiled wheel names);
+    raises UvNotFoundError or subprocess.CalledProcessError when the wheels
+    cannot be built.
+    """
+    folder = app_info['folder']
+    target = bundle_path(app_info)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=".bundle-", dir=target.parent))
+    
+    try:
+        wheel_dir = staging / "wheels"
+        wheel_dir.mkdir()
+        if install_args(app_info):
+            build_wheels(uv, app_info, venv_python(venv_path), wheel_dir, find_links)
+        
+        root = staging / "root"
+        for rel_path, path in iter_app_files(folder):
+            dest = root.joinpath(APP_DIR, *rel_path.split("/"))
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(path, dest)
+        
+        pure, native = [], []
+        (root / LIB_DIR).mkdir(parents=True, exist_ok=True)
+        for wheel in sorted(wheel_dir.glob("*" + WHEEL_SUFFIX)):
+            if is_pure_wheel(wheel.name):
+                unpack_wheel(wheel, root / LIB_DIR)
+                pure.append(wheel.name)
+            else:
+                (root / NATIVE_DIR).mkdir(exist_ok=True)
+                shutil.copyfile(wheel, root / NATIVE_DIR / wheel.name)
+                native.append(wheel.name)
+        
+        version = venv_python_version(venv_path)
+        python = [int(part) for part in version.split(".")[:2]] if version else None
+        # Bundles with the same compiled wheels (whichever app they are for) share one extracted copy
+        digest = hashlib.sha256("\n".join([str(python)] + native).encode('utf-8')).hexdigest()[:12]
+        
+        bootstrap = BOOTSTRAP_TEMPLATE.format(
+            entry=app_info['entry_point'],
+            args=list(app_info['args']),
+            env=dict(app_info['env']),
+            bundle_id=f"wheels-{digest}",
+            python=python,
+            native=native,
+            # The bootstrap unpacks wheels the way unpack_wheel does, with the same function
+            wheel_member_path=inspect.getsource(wheel_member_path),
+            app_dir=APP_DIR,
+            lib_dir=LIB_DIR,
+            native_dir=NATIVE_DIR,
+        )
+        (root / "__main__.py").write_text(bootstrap, encoding='utf-8')
+        
+        archive = staging / target.name
+        zipapp.create_archive(root, archive, interpreter=BUNDLE_INTERPRETER, compressed=True)
+        os.replace(archive, target)
+        return target, pure, native
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
@@ -0,0 +1,362 @@
+"""
+Headless command line - the launcher's discovery and execution logic without
+the window. Nothing here imports Tk, so it starts quickly and works over SSH;
+modules only one command needs are imported by that command.
+"""
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+from applauncher.config import (load_config, project_roots_from_config, shared_envs_dir_from_config,
+                                wheelhouse_dir_from_config)
+from applauncher.dependencies import package_names
+from applauncher.discovery import (ScanIndex, app_name, merge_root_apps, root_for, scan_folder,
+                                   scan_root)
+
+
+class CliError(Exception):
+    """Raised for problems that end a command with a message instead of a traceback"""
+
+
+class HeadlessLauncher:
+    """Settings, projects roots and scan index shared by the commands"""
+    
+    def __init__(self, base_path, projects_path=None):
+        self.base_path = Path(base_path)
+        self.config = load_config(self.base_path / ".launcher_config.json")
+        if projects_path:
+            projects_path = Path(projects_path)
+            self.roots = [{'path': projects_path, 'enabled': True, 'name': projects_path.name}]
+        else:
+            self.roots = project_roots_from_config(self.config, self.base_path)
+        
+        self.scan_index = ScanIndex(self.base_path / ".launcher_index.json",
+                                    package_names(self.config['import_packages']))
+        self.scan_index.load()
+    
+    def enabled_roots(self):
+        """The enabled roots that exist, in priority order"""
+        roots = [root for root in self.roots if root['enabled']]
+        for root in roots:
+            if not root['path'].is_dir():
+                print(f"launcher.py: skipping missing projects folder {root['path']}", file=sys.stderr)
+        roots = [root for root in roots if root['path'].is_dir()]
+        if not roots:
+            raise CliError("Projects folder not found: "
+                           + ", ".join(str(root['path']) for root in self.roots))
+        return roots
+    
+    def scan(self):
+        """Return {app_name: app_info} for every app in the enabled projects roots"""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        roots = self.enabled_roots()
+        max_depth = self.config['scan_max_depth']
+        
+        def scan_one(root):
+            apps = {}
+            for event in scan_root(root['path'], self.scan_index, max_depth):
+                if event[0] == 'app' and event[2] is not None:
+                    apps[app_name(event[1], root['path'])] = event[2]
+            return apps
+        
+        # Roots are scanned side by side, so a slow mount costs its own time only
+        with ThreadPoolExecutor(max_workers=len(roots), thread_name_prefix="root") as pool:
+            results = dict(zip((str(root['path']) for root in roots), pool.map(scan_one, roots)))
+        
+        merged = merge_root_apps(roots, results)
+        return {name: app_info for name, (root, app_info) in sorted(merged.items())}
+    
+    def find_app(self, name):
+        """Return (app_name, app_info) for an app name, root:name, or a path to an app folder"""
+        roots = self.enabled_roots()
+        root_name, sep, rel_name = name.partition(":")
+        
+        folder = None
+        for root in roots:
+            if sep and root['name'] == root_name:
+                folder = root['path'] / rel_name
+                break
+            if (root['path'] / name).is_dir():
+                folder = root['path'] / name
+                break
+        if folder is None or not folder.is_dir():
+            folder = Path(name).resolve()
+        if not folder.is_dir():
+            raise CliError(f"No app named {name} in " + ", ".join(str(root['path']) for root in roots))
+        
+        # Only the requested folder is analyzed, not the whole projects folder
+        app_info = scan_folder(folder, self.scan_index)
+        self.scan_index.save()
+        
+        if app_info is None:
+            raise CliError(f"{folder} does not contain a Python app")
+        return self.listed_name(folder, roots), app_info
+    
+    def listed_name(self, folder, roots):
+        """The name an app folder is listed under (see merge_root_apps)"""
+        root = root_for(folder, roots)
+        if root is None:
+            return Path(folder).name
+        name = app_name(folder, root['path'])
+        # An earlier root with the same app takes the plain name
+        for other in roots[:roots.index(root)]:
+            if (other['path'] / name).is_dir():
+                return f"{root['name']}:{name}"
+        return name
+    
+    def selected_apps(self, args):
+        """{app_name: app_info} for the app named on the command line, or every app with --all"""
+        if args.all:
+            return self.scan()
+        app_name, app_info = self.find_app(args.app)
+        return {app_name: app_info}
+    
+    def wheelhouse(self, for_vendoring=False):
+        """The wheelhouse installs use, or None when they go to the package index"""
+        if not (for_vendoring or self.config['offline_installs']):
+            return None
+        
+        from applauncher.wheelhouse import Wheelhouse
+        return Wheelhouse(wheelhouse_dir_from_config(self.config, self.base_path),
+                          self.config['offline_network_fallback'])
+
+
+def app_json(app_name, app_info):
+    """app_info as plain JSON types"""
+    data = {'name': app_name}
+    data.update(app_info)
+    data['folder'] = str(app_info['folder'])
+    return data
+
+
+def cmd_list(launcher, args):
+    """Print every app as JSON"""
+    apps = launcher.scan()
+    print(json.dumps([app_json(name, info) for name, info in apps.items()], indent=2))
+    return 0
+
+
+def cmd_run(launcher, args):
+    """Prepare an app's environment and run it attached to this terminal"""
+    import subprocess
+    
+    from applauncher.envs import UvNotFoundError, UvTool, prepare_env, venv_python
+    from applauncher.history import RunHistory
+    from applauncher.limits import AppLimits, LimitsConfigError, limits_for
+    from applauncher.runner import (PHASE_CHECKING_ENV, PHASE_EXITED, PHASE_FAILED, PHASE_LIMITED,
+                                    PHASE_RUNNING, RunRecord, app_command)
+    
+    app_name, app_info = launcher.find_app(args.app)
+    
+    # Terminal runs go into the same history as runs started from the window
+    history = RunHistory(launcher.base_path / ".launcher_history.jsonl")
+    record = RunRecord(0, app_name, app_info)
+    record.enter_phase(PHASE_CHECKING_ENV)
+    
+    def show_phase(phase):
+        record.enter_phase(phase)
+        print(f"[launcher] {app_name}: {phase}...", file=sys.stderr, flush=True)
+    
+    def finish(phase, error=None):
+        record.error = error
+        record.enter_phase(phase)
+        history.append(record.history_entry())
+    
+    # Bad limits in the config stop the launch before any setup work
+    try:
+        run_limits = limits_for(launcher.config, app_name, app_info)
+    except LimitsConfigError as e:
+        finish(PHASE_FAILED, str(e))
+        raise CliError(str(e))
+    
+    try:
+        venv_path = prepare_env(
+            UvTool(),
+            app_info,
+            force_install=args.force_install,
+            on_phase=show_phase,
+            shared_envs_dir=shared_envs_dir_from_config(launcher.config, launcher.base_path),
+            wheelhouse=launcher.wheelhouse(),
+            upgrade=args.upgrade
+        )
+    except UvNotFoundError:
+        finish(PHASE_FAILED, "UV is not installed")
+        raise CliError("UV is not installed. Install it with: pip install uv")
+    except subprocess.CalledProcessError as e:
+        finish(PHASE_FAILED, str(e))
+        details = (e.stderr or b"").decode('utf-8', errors='replace').strip()
+        raise CliError(f"Failed to prepare environment:\n{e}" + (f"\n{details}" if details else ""))
+    
+    limits = AppLimits(run_limits, f"launcher-cli-{os.getpid()}")
+    limits.prepare()
+    if limits.cgroup_error:
+        print(f"[launcher] {app_name}: {limits.cgroup_error}", file=sys.stderr, flush=True)
+    
+    # The app shares this terminal, so its output appears as it is written
+    record.enter_phase(PHASE_RUNNING)
+    try:
+        env = dict(os.environ)
+        env.update(app_info['env'])
+        process = subprocess.Popen(app_command(app_info, venv_python(venv_path)), cwd=app_info['folder'],
+                                   env=env, **limits.popen_kwargs())
+    except Exception:
+        limits.finish(None)
+        raise
+    
+    def time_out():
+        process.terminate()
+        try:
+            process.wait(timeout=launcher.config['stop_timeout'])
+        except subprocess.TimeoutExpired:
+            process.kill()
+    
+    limits.start_timer(time_out)
+    while True:
+        try:
+            record.exit_code = process.wait()
+            break
+        except KeyboardInterrupt:
+            # Ctrl+C reaches the app too - wait for it to finish exiting
+            continue
+    
+    # Output went straight to the terminal, so a MemoryError there is not looked for
+    record.limit = limits.finish(record.exit_code)
+    if record.limit is not None:
+        print(f"[launcher] {app_name}: {record.limit}", file=sys.stderr, flush=True)
+        finish(PHASE_LIMITED)
+    else:
+        finish(PHASE_EXITED)
+    
+    # An app killed by a signal exits with 128 + the signal number, as it would from a shell
+    return record.exit_code if record.exit_code >= 0 else 128 - record.exit_code
+
+
+def cmd_scripts(launcher, args):
+    """Write run.sh / run.bat for one app or for all of them"""
+    from applauncher.scripts import write_launcher_scripts
+    
+    for app_name, app_info in launcher.selected_apps(args).items():
+        for path in write_launcher_scripts(app_name, app_info, launcher.wheelhouse()):
+            print(path)
+    return 0
+
+
+def cmd_vendor(launcher, args):
+    """Put wheels for the dependencies of one app or all apps into the offline wheelhouse"""
+    import subprocess
+    
+    from applauncher.envs import UvNotFoundError, UvTool, prepare_env, venv_python
+    
+    uv = UvTool()
+    wheelhouse = launcher.wheelhouse(for_vendoring=True)
+    shared_envs_dir = shared_envs_dir_from_config(launcher.config, launcher.base_path)
+    
+    for app_name, app_info in launcher.selected_apps(args).items():
+        try:
+            # The app's interpreter decides which wheels fit, so its environment must exist
+            venv_path = prepare_env(uv, app_info, shared_envs_dir=shared_envs_dir)
+            added, present = wheelhouse.vendor(uv, app_info, venv_python(venv_path))
+        except UvNotFoundError:
+            raise CliError("UV is not installed. Install it with: pip install uv")
+        except subprocess.CalledProcessError as e:
+            details = (e.stderr or b"").decode('utf-8', errors='replace').strip()
+            raise CliError(f"Failed to vendor {app_name}:\n{e}" + (f"\n{details}" if details else ""))
+        print(f"{app_name}: {len(added)} wheels added, {len(present)} already present")
+    
+    print(f"Wheelhouse: {wheelhouse.path}")
+    return 0
+
+
+def cmd_bundle(launcher, args):
+    """Build a self-contained .pyz bundle for one app or all apps"""
+    import subprocess
+    
+    from applauncher.bundle import build_bundle
+    from applauncher.envs import UvNotFoundError, UvTool, prepare_env
+    
+    uv = UvTool()
+    wheelhouse = launcher.wheelhouse(for_vendoring=True)
+    find_links = wheelhouse.path if wheelhouse.path.is_dir() else None
+    shared_envs_dir = shared_envs_dir_from_config(launcher.config, launcher.base_path)
+    
+    for app_name, app_info in launcher.selected_apps(args).items():
+        try:
+            # Wheels are built for the app's interpreter, so its environment must exist
+            venv_path = prepare_env(uv, app_info, shared_envs_dir=shared_envs_dir)
+            path, pure, native = build_bundle(uv, app_info, venv_path, find_links)
+        except UvNotFoundError:
+            raise CliError("UV is not installed. Install it with: pip install uv")
+        except subprocess.CalledProcessError as e:
+            details = (e.stderr or b"").decode('utf-8', errors='replace').strip()
+            raise CliError(f"Failed to bundle {app_name}:\n{e}" + (f"\n{details}" if details else ""))
+        print(f"{app_name}: {path} ({len(pure)} pure-Python packages, {len(native)} compiled)")
+    
+    return 0
+
+
+def cmd_gui(launcher, args):
+    """Open the launcher window"""
+    from applauncher.gui import main as gui_main
+    gui_main(launcher.base_path)
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="launcher.py",
+        description="Discover and run the Python apps in the projects folder."
+    )
+    parser.add_argument("--projects", metavar="PATH",
+                        help="projects folder to use instead of the configured roots")
+    commands = parser.add_subparsers(dest="command", metavar="command")
+    commands.required = True
+    
+    list_parser = commands.add_parser("list", help="print every app as JSON")
+    list_parser.set_defaults(func=cmd_list)
+    
+    run_parser = commands.add_parser("run", help="run an app in this terminal")
+    run_parser.add_argument("app", help="app name, e.g. foo, tools/foo or root:foo (or path to an app folder)")
+    run_parser.add_argument("--force-install", action="store_true",
+                            help="reinstall dependencies even if the environment looks current")
+    run_parser.add_argument("--upgrade", action="store_true",
+                            help="install the newest allowed dependency versions and rewrite the lock file")
+    run_parser.set_defaults(func=cmd_run)
+    
+    scripts_parser = commands.add_parser("scripts", help="write run.sh / run.bat launchers")
+    target = scripts_parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("app", nargs="?", help="app name, e.g. foo, tools/foo or root:foo (or path to an app folder)")
+    target.add_argument("--all", action="store_true", help="write launchers for every app")
+    scripts_parser.set_defaults(func=cmd_scripts)
+    
+    vendor_parser = commands.add_parser("vendor", help="fill the offline wheelhouse with an app's wheels")
+    target = vendor_parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("app", nargs="?", help="app name, e.g. foo, tools/foo or root:foo (or path to an app folder)")
+    target.add_argument("--all", action="store_true", help="vendor the dependencies of every app")
+    vendor_parser.set_defaults(func=cmd_vendor)
+    
+    bundle_parser = commands.add_parser("bundle", help="build a self-contained .pyz of an app")
+    target = bundle_parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("app", nargs="?", help="app name, e.g. foo, tools/foo or root:foo (or path to an app folder)")
+    target.add_argument("--all", action="store_true", help="bundle every app")
+    bundle_parser.set_defaults(func=cmd_bundle)
+    
+    gui_parser = commands.add_parser("gui", help="open the launcher window")
+    gui_parser.set_defaults(func=cmd_gui)
+    
+    return parser
+
+
+def main(argv, base_path):
+    """Command line entry point; returns the exit code"""
+    args = build_parser().parse_args(argv)
+    
+    try:
+        launcher = HeadlessLauncher(base_path, args.projects)
+        return args.func(launcher, args)
+    except CliError as e:
+        print(f"launcher.py: {e}", file=sys.stderr)
+        return 1
@@ -0,0 +1,175 @@
+"""
+Launcher settings stored in .launcher_config.json
+"""
+
+import json
+from pathlib import Path
+
+
+# Limits applied to every launched app (0 means no limit); see applauncher.limits
+DEFAULT_LIMITS = {
+    # Seconds an app may run before it is stopped
+    'timeout_seconds': 0,
+    # Address space cap, or a memory.max cap on the app's cgroup when 'cgroup' is on
+    'memory_mb': 0,
+    # CPU time cap (SIGXCPU, then SIGKILL a few seconds later)
+    'cpu_seconds': 0,
+    # Niceness added to the app's priority (on Windows, any positive value means below normal)
+    'nice': 0,
+    # Run the app in its own cgroup v2 scope when the launcher is allowed to create one
+    'cgroup': False,
+}
+
+
+# Settings used when the config file does not mention them
+DEFAULT_CONFIG = {
+    # Folders searched for apps, in priority order, e.g.
+    # [{"path": "/mnt/team", "enabled": true, "name": "team"}]; when empty, just projects_path
+    'projects_roots': [],
+    'watch_projects': True,
+    # Folder levels below the projects folder searched for apps (category folders
+    # like projects/tools/foo need 2; 1 only looks at direct subfolders)
+    'scan_max_depth': 3,
+    # Lines of app output kept in memory (and in the output window) per run
+    'output_buffer_lines': 5000,
+    # Also write the complete output of each run to <app>/.launcher_output.log
+    'output_log_file': False,
+    # Apps allowed to be creating environments / installing at the same time
+    'max_starting_apps': 3,
+    # Seconds Stop waits after SIGTERM before killing an app
+    'stop_timeout': 5,
+    # Share one environment between apps with identical dependency sets
+    'shared_envs': False,
+    # Where shared environments live (default: .launcher_envs next to the launcher)
+    'shared_envs_dir': None,
+    # Build missing or stale environments in the background after each scan
+    'prewarm_envs': True,
+    'prewarm_workers': 1,
+    # Install dependencies offline from a local wheelhouse (filled by "Vendor Dependencies"),
+    # going to the package index only for what it lacks, and only with network fallback on
+    'offline_installs': False,
+    'offline_network_fallback': True,
+    # Where vendored wheels are kept (default: .launcher_wheels next to the launcher)
+    'wheelhouse_dir': None,
+    # Keep every run's output, compressed, in .launcher_logs (or run_logs_dir)
+    'run_logs': True,
+    'run_logs_dir': None,
+    # Stored logs are evicted least recently used first beyond this total size,
+    # and deleted once they have not been opened for this many days
+    'run_logs_max_mb': 200,
+    'run_logs_max_age_days': 30,
+    # Seconds between CPU/memory samples of running apps (0 turns monitoring off; Linux only)
+    'monitor_interval': 1.0,
+    # Defaults for every app, and per-app overrides, e.g. {"my_app": {"timeout_seconds": 600}}
+    'limits': dict(DEFAULT_LIMITS),
+    'app_limits': {},
+    # Extra import name -> package name entries for dependency detection, e.g. {"Image": "pillow"}
+    'import_packages': {},
+}
+
+
+def limits_error(limits, name="limits"):
+    """What is wrong with a table of limits (checked against DEFAULT_LIMITS), or None if nothing"""
+    if not isinstance(limits, dict):
+        return f"{name} must be a table"
+    
+    for key, value in limits.items():
+        if key not in DEFAULT_LIMITS:
+            return f"unknown limit {name}.{key} (known: {', '.join(DEFAULT_LIMITS)})"
+        if isinstance(DEFAULT_LIMITS[key], bool):
+            if not isinstance(value, bool):
+                return f"{name}.{key} must be true or false"
+        elif isinstance(value, bool) or not isinstance(value, (int, float)):
+            return f"{name}.{key} must be a number"
+        elif value < 0:
+            return f"{name}.{key} must not be negative"
+    return None
+
+
+def load_config(config_file):
+    """Load the config file merged over the defaults, ignoring a missing or corrupt file"""
+    config = dict(DEFAULT_CONFIG)
+    
+    try:
+        if config_file.exists():
+            with open(config_file, 'r') as f:
+                saved = json.load(f)
+            if isinstance(saved, dict):
+                config.update(saved)
+    except Exception:
+        pass
+    
+    return config
+
+
+def projects_path_from_config(config, base_path):
+    """Return the saved projects folder, or the projects folder next to the launcher"""
+    if 'projects_path' in config:
+        projects_path = Path(config['projects_path'])
+        if projects_path.exists():
+            return projects_path
+    
+    # Default to projects folder in same directory as launcher
+    return base_path / "projects"
+
+
+def project_roots_from_config(config, base_path):
+    """Return the projects roots as {'path', 'enabled', 'name'} dicts, in priority order
+    
+    Without a 'projects_roots' setting the projects folder is the only root.
+    Root names (shown on cards, and used to tell apps with the same name
+    apart) are made unique.
+    """
+    entries = config.get('projects_roots') or [
+        {'path': str(projects_path_from_config(config, base_path))}
+    ]
+    
+    roots = []
+    names = set()
+    for entry in entries:
+        if isinstance(entry, str):
+            entry = {'path': entry}
+        path = Path(entry['path']).expanduser()
+        name = base_name = entry.get('name') or path.name or str(path)
+        suffix = 2
+        while name in names:
+            name = f"{base_name}-{suffix}"
+            suffix += 1
+        names.add(name)
+        roots.append({'path': path, 'enabled': bool(entry.get('enabled', True)), 'name': name})
+    return roots
+
+
+def project_roots_config(roots):
+    """The 'projects_roots' setting that stores the given roots"""
+    return [{'path': str(root['path']), 'enabled': root['enabled'], 'name': root['name']}
+            for root in roots]
+
+
+def shared_envs_dir_from_config(config, base_path):
+    """Return the shared environment cache, or None when apps use their own .venv"""
+    if not config['shared_envs']:
+        return None
+    if config['shared_envs_dir']:
+        return Path(config['shared_envs_dir'])
+    return base_path / ".launcher_envs"
+
+
+def wheelhouse_dir_from_config(config, base_path):
+    """Return the folder vendored wheels are kept in"""
+    if config['wheelhouse_dir']:
+        return Path(config['wheelhouse_dir'])
+    return base_path / ".launcher_wheels"
+
+
+def run_logs_dir_from_config(config, base_path):
+    """Return the folder that holds the per-app run log directories"""
+    if config['run_logs_dir']:
+        return Path(config['run_logs_dir'])
+    return base_path / ".launcher_logs"
+
+
+def save_config(config_file, config):
+    """Write the whole config to disk (errors are left to the caller)"""
+    with open(config_file, 'w') as f:
+        json.dump(config, f, indent=2)
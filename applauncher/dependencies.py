@@ -0,0 +1,291 @@
+"""
+Dependency analysis - finds the third-party packages an app imports by parsing
+every .py file in it, leaving out the standard library and the app's own
+modules, and translating import names into the names packages are installed by
+"""
+
+import ast
+import hashlib
+import os
+import re
+import sys
+import threading
+
+
+# Standard library modules for Pythons older than 3.10 (no sys.stdlib_module_names)
+STDLIB_FALLBACK = frozenset("""
+    __future__ _thread abc aifc antigravity argparse array ast asynchat asyncio asyncore atexit
+    audioop base64 bdb binascii binhex bisect builtins bz2 cProfile calendar cgi cgitb chunk cmath
+    cmd code codecs codeop collections colorsys compileall concurrent configparser contextlib
+    contextvars copy copyreg crypt csv ctypes curses dataclasses datetime dbm decimal difflib dis
+    distutils doctest dummy_threading email encodings ensurepip enum errno faulthandler fcntl
+    filecmp fileinput fnmatch formatter fractions ftplib functools gc genericpath getopt getpass
+    gettext glob graphlib grp gzip hashlib heapq hmac html http idlelib imaplib imghdr imp
+    importlib inspect io ipaddress itertools json keyword lib2to3 linecache locale logging lzma
+    mailbox mailcap marshal math mimetypes mmap modulefinder msilib msvcrt multiprocessing netrc
+    nis nntplib nt ntpath nturl2path numbers opcode operator optparse os ossaudiodev parser
+    pathlib pdb pickle pickletools pipes pkgutil platform plistlib poplib posix posixpath pprint
+    profile pstats pty pwd py_compile pyclbr pydoc pydoc_data pyexpat queue quopri random re
+    readline reprlib resource rlcompleter runpy sched secrets select selectors shelve shlex
+    shutil signal site smtpd smtplib sndhdr socket socketserver spwd sqlite3 sre_compile
+    sre_constants sre_parse ssl stat statistics string stringprep struct subprocess sunau symbol
+    symtable sys sysconfig syslog tabnanny tarfile telnetlib tempfile termios textwrap this
+    threading time timeit tkinter token tokenize tomllib trace traceback tracemalloc tty turtle
+    turtledemo types typing unicodedata unittest urllib uu uuid venv warnings wave weakref
+    webbrowser winreg winsound wsgiref xdrlib xml xmlrpc zipapp zipfile zipimport zlib zoneinfo
+""".split())
+
+STDLIB_MODULES = frozenset(getattr(sys, 'stdlib_module_names', STDLIB_FALLBACK)) | frozenset(
+    sys.builtin_module_names)
+
+# Import names whose package is published under another name; extend it with
+# the 'import_packages' config setting
+DISTRIBUTION_NAMES = {
+    'attr': 'attrs',
+    'bs4': 'beautifulsoup4',
+    'cairo': 'pycairo',
+    'cv2': 'opencv-python',
+    'Crypto': 'pycryptodome',
+    'dateutil': 'python-dateutil',
+    'discord': 'discord.py',
+    'dns': 'dnspython',
+    'docx': 'python-docx',
+    'dotenv': 'python-dotenv',
+    'faiss': 'faiss-cpu',
+    'fitz': 'PyMuPDF',
+    'gi': 'PyGObject',
+    'git': 'GitPython',
+    'github': 'PyGithub',
+    'jose': 'python-jose',
+    'jwt': 'PyJWT',
+    'Levenshtein': 'python-Levenshtein',
+    'magic': 'python-magic',
+    'markdown': 'Markdown',
+    'multipart': 'python-multipart',
+    'MySQLdb': 'mysqlclient',
+    'nacl': 'PyNaCl',
+    'OpenGL': 'PyOpenGL',
+    'OpenSSL': 'pyOpenSSL',
+    'PIL': 'pillow',
+    'pkg_resources': 'setuptools',
+    'pptx': 'python-pptx',
+    'psycopg2': 'psycopg2-binary',
+    'pyaudio': 'PyAudio',
+    'pywintypes': 'pywin32',
+    'serial': 'pyserial',
+    'skimage': 'scikit-image',
+    'sklearn': 'scikit-learn',
+    'slugify': 'python-slugify',
+    'socks': 'PySocks',
+    'speech_recognition': 'SpeechRecognition',
+    'telegram': 'python-telegram-bot',
+    'usb': 'pyusb',
+    'websocket': 'websocket-client',
+    'win32api': 'pywin32',
+    'win32con': 'pywin32',
+    'win32gui': 'pywin32',
+    'wx': 'wxPython',
+    'yaml': 'pyyaml',
+    'zmq': 'pyzmq',
+}
+
+# Folders inside an app that never hold its own source
+SKIP_DIRS = {'__pycache__', 'node_modules', 'site-packages', 'build', 'dist', 'venv', 'env'}
+
+# Test code may import test-only tools, which the app itself does not need to run
+TEST_DIRS = {'test', 'tests'}
+
+# Stop reading an app after this many files (a vendored library can hold thousands)
+MAX_ANALYZED_FILES = 1000
+
+# Files remembered by the import cache; beyond this, ones not seen since load are dropped
+MAX_CACHED_FILES = 20000
+
+# Used for files that do not parse (e.g. Python 2 code)
+IMPORT_PATTERN = re.compile(r'^\s*(?:from|import)\s+([a-zA-Z0-9_]+)', re.MULTILINE)
+
+# Exceptions whose handlers can mark the imports in their try block as optional
+IMPORT_ERRORS = {'ImportError', 'ModuleNotFoundError'}
+
+
+def package_names(extra=None):
+    """DISTRIBUTION_NAMES with the user's own import -> package entries on top"""
+    names = dict(DISTRIBUTION_NAMES)
+    names.update(extra or {})
+    return names
+
+
+def names_signature(names):
+    """Short digest of a package name table, so results made with another table are not reused"""
+    text = "\n".join(f"{key}={value}" for key, value in sorted(names.items()))
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+
+
+def is_test_file(name):
+    return name.startswith("test_") or name.endswith("_test.py") or name == "conftest.py"
+
+
+def is_source_dir(path, name):
+    """True for a folder whose files belong to the app (not hidden, a cache or a virtualenv)"""
+    return (not name.startswith('.') and name not in SKIP_DIRS
+            and not os.path.exists(os.path.join(path, "pyvenv.cfg")))
+
+
+def iter_source_files(folder):
+    """Yield (relative path, DirEntry) for the app's .py files, skipping environments and caches"""
+    pending = [(folder, "")]
+    count = 0
+    
+    while pending:
+        directory, prefix = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                entries = sorted(entries, key=lambda entry: entry.name)
+        except OSError:
+            continue
+        
+        for entry in entries:
+            name = entry.name
+            if name.endswith('.py') and entry.is_file():
+                yield prefix + name, entry
+                count += 1
+                if count >= MAX_ANALYZED_FILES:
+                    return
+            elif entry.is_dir(follow_symlinks=False) and is_source_dir(entry.path, name):
+                pending.append((entry.path, prefix + name + "/"))
+
+
+class _ImportVisitor(ast.NodeVisitor):
+    """Collects top-level module names of absolute imports, except optional ones"""
+    
+    def __init__(self):
+        self.names = set()
+        self.optional_depth = 0
+    
+    def visit_Import(self, node):
+        if not self.optional_depth:
+            for alias in node.names:
+                self.names.add(alias.name.split('.')[0])
+    
+    def visit_ImportFrom(self, node):
+        # Relative imports are always the app's own modules
+        if not self.optional_depth and node.level == 0 and node.module:
+            self.names.add(node.module.split('.')[0])
+    
+    def visit_Try(self, node):
+        # Only a handler that supplies a fallback makes the imports optional - one that
+        # just prints, exits or re-raises means the app cannot run without them
+        bound = _bound_names(node.body)
+        optional = any(_catches_import_error(handler) and bound & _bound_names(handler.body)
+                       for handler in node.handlers)
+        self.optional_depth += optional
+        for child in node.body:
+            self.visit(child)
+        self.optional_depth -= optional
+        
+        # The fallback imports in the handlers are what runs when the optional one is missing
+        for child in node.handlers + node.orelse + node.finalbody:
+            self.visit(child)
+    
+    visit_TryStar = visit_Try
+
+
+def _catches_import_error(handler):
+    """True for handlers that catch ImportError or ModuleNotFoundError by name"""
+    if handler.type is None:
+        return False
+    types = handler.type.elts if isinstance(handler.type, ast.Tuple) else [handler.type]
+    return any(isinstance(node, ast.Name) and node.id in IMPORT_ERRORS for node in types)
+
+
+def _bound_names(statements):
+    """Names the statements bind - by import, assignment, def or class"""
+    names = set()
+    for statement in statements:
+        for node in ast.walk(statement):
+            if isinstance(node, (ast.Import, ast.ImportFrom)):
+                names.update(alias.asname or alias.name.split('.')[0] for alias in node.names)
+            elif isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store):
+                names.add(node.id)
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                names.add(node.name)
+    return names
+
+
+def source_imports(source):
+    """Top-level names of the modules a source file imports"""
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        text = source.decode('utf-8', errors='replace') if isinstance(source, bytes) else source
+        return set(IMPORT_PATTERN.findall(text))
+    
+    visitor = _ImportVisitor()
+    visitor.visit(tree)
+    return visitor.names
+
+
+class ImportCache:
+    """Imports per file content hash, shared by all apps and kept with the scan index"""
+    
+    def __init__(self, entries=None):
+        self.entries = dict(entries or {})
+        # Hashes looked up or added since load - the rest can be dropped after a full scan
+        self.used = set()
+        self.dirty = False
+        self.lock = threading.Lock()
+    
+    def imports(self, source):
+        """Imports of a file's contents, parsed only the first time those contents are seen"""
+        digest = hashlib.sha256(source).hexdigest()
+        with self.lock:
+            self.used.add(digest)
+            names = self.entries.get(digest)
+        if names is not None:
+            return set(names)
+        
+        names = source_imports(source)
+        with self.lock:
+            self.entries[digest] = sorted(names)
+            self.dirty = True
+        return names
+    
+    def prune(self):
+        """Keep the cache bounded by forgetting files no scan since load has seen"""
+        with self.lock:
+            if len(self.entries) <= MAX_CACHED_FILES:
+                return
+            unused = set(self.entries) - self.used
+            for digest in unused:
+                del self.entries[digest]
+            if unused:
+                self.dirty = True
+
+
+def app_dependencies(folder, import_cache=None, names=None):
+    """Sorted package names for the third-party modules imported anywhere in the app"""
+    if import_cache is None:
+        import_cache = ImportCache()
+    if names is None:
+        names = DISTRIBUTION_NAMES
+    
+    imports = set()
+    local = set()
+    
+    for path, entry in iter_source_files(folder):
+        parts = path.split("/")
+        # Every file and folder on the way is importable from the app itself
+        local.add(parts[0][:-3] if len(parts) == 1 else parts[0])
+        local.add(parts[-1][:-3])
+        
+        if is_test_file(parts[-1]) or TEST_DIRS.intersection(parts[:-1]):
+            continue
+        try:
+            with open(entry.path, 'rb') as f:
+                source = f.read()
+        except OSError:
+            continue
+        imports |= import_cache.imports(source)
+    
+    third_party = imports - local - STDLIB_MODULES
+    return sorted({names.get(module, module) for module in third_party})
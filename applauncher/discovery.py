@@ -0,0 +1,475 @@
+"""
+Project discovery - detects Python apps in the projects roots and keeps an
+on-disk scan index so unchanged folders are not re-analyzed on every refresh
+"""
+
+import fnmatch
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+
+from applauncher.dependencies import (SKIP_DIRS, ImportCache, app_dependencies, iter_source_files,
+                                      names_signature, package_names)
+from applauncher.manifest import (MANIFEST_FILES, MANIFEST_NAME, ManifestError, load_manifest,
+                                  toml_parser_name)
+
+
+# Files checked (in order) when looking for an app's entry point
+ENTRY_POINT_NAMES = ["main.py", "app.py", "run.py", "__main__.py"]
+
+# Folders below the projects folder that are searched for apps (1 = only its direct subfolders)
+DEFAULT_MAX_DEPTH = 3
+
+# Per-folder list of glob patterns for folders discovery should not look into
+IGNORE_FILE = ".launcherignore"
+
+# Bump when the shape of cached app info changes
+INDEX_VERSION = 6
+
+# Folders analyzed at once - scanning is I/O bound, so this mostly hides latency
+SCAN_WORKERS = 8
+
+
+def results_signature(names):
+    """What cached analyze_app results depend on besides the app's files: the Python
+    version (its stdlib modules), the TOML parser manifests are read with and the
+    import -> package table"""
+    python = ".".join(str(part) for part in sys.version_info[:2])
+    return f"{python}/{toml_parser_name()}/{names_signature(names)}"
+
+
+def analyze_app(folder, import_cache=None, names=None):
+    """Analyze a folder to determine if it's a valid Python app
+    
+    An app with a manifest (see applauncher.manifest) is taken as declared,
+    without reading its source; otherwise the entry point is guessed and the
+    dependencies are worked out from the imports in all of its files (see
+    applauncher.dependencies, which import_cache and names are passed on to).
+    """
+    with os.scandir(folder) as entries:
+        python_files = sorted(entry.name for entry in entries
+                              if entry.name.endswith('.py') and entry.is_file())
+    
+    manifest_error = None
+    try:
+        manifest = load_manifest(folder)
+    except ManifestError as e:
+        # Fall back to guessing, but let the card say why
+        manifest, manifest_error = None, str(e)
+    
+    if manifest is not None:
+        return manifest_app_info(folder, python_files, *manifest)
+    
+    if not python_files:
+        return None
+    
+    # Try to find main entry point
+    entry_point = find_entry_point(python_files)
+    
+    return {
+        'folder': folder,
+        'entry_point': entry_point,
+        'python_files': python_files,
+        'dependencies': app_dependencies(folder, import_cache, names),
+        'has_requirements': (folder / "requirements.txt").exists(),
+        'manifest': None,
+        'manifest_error': manifest_error,
+        'args': [],
+        'env': {},
+        'python': None,
+        'limits': {},
+    }
+
+
+def find_entry_point(python_files):
+    """The first of ENTRY_POINT_NAMES in the folder, else its first .py file (None if it has none)"""
+    for name in ENTRY_POINT_NAMES:
+        if name in python_files:
+            return name
+    return python_files[0] if python_files else None
+
+
+def manifest_app_info(folder, python_files, manifest_name, fields):
+    """App info for an app that declares itself in a manifest"""
+    entry_point = fields['entry'] or find_entry_point(python_files)
+    if entry_point is None:
+        return None
+    
+    return {
+        'folder': folder,
+        'entry_point': entry_point,
+        'python_files': python_files,
+        # Declared packages - installed on top of requirements.txt, nothing is guessed
+        'dependencies': fields['dependencies'],
+        'has_requirements': (folder / "requirements.txt").exists(),
+        'manifest': manifest_name,
+        'manifest_error': None,
+        'args': fields['args'],
+        'env': fields['env'],
+        'python': fields['python'],
+        'limits': fields['limits'],
+    }
+
+
+def folder_fingerprint(folder):
+    """Return the name/mtime/size of every file analyze_app depends on, or None if unreadable"""
+    fingerprint = []
+    has_manifest = False
+    
+    try:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                name = entry.name
+                if name == MANIFEST_NAME:
+                    has_manifest = True
+                if not (name.endswith('.py') or name == 'requirements.txt' or name in MANIFEST_FILES):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                fingerprint.append([name, stat.st_mtime_ns, stat.st_size])
+    except OSError:
+        return None
+    
+    if not has_manifest:
+        # Imports anywhere in the app count, so files in its packages do too
+        for path, entry in iter_source_files(folder):
+            if "/" not in path:
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            fingerprint.append([path, stat.st_mtime_ns, stat.st_size])
+    
+    fingerprint.sort()
+    return fingerprint
+
+
+def read_ignore_file(path):
+    """Glob patterns from a .launcherignore file (blank lines and # comments skipped)"""
+    try:
+        text = path.read_text(encoding='utf-8')
+    except (OSError, UnicodeDecodeError):
+        return []
+    
+    patterns = []
+    for line in text.splitlines():
+        line = line.strip()
+        if line and not line.startswith('#'):
+            patterns.append(line.strip('/'))
+    return patterns
+
+
+def is_ignored(rel_path, name, ignore_rules):
+    """True if a folder matches an ignore rule
+    
+    ignore_rules are (prefix, pattern) pairs, prefix being where the rule's
+    .launcherignore lives. Patterns with a / match the path below that folder,
+    others match the folder name at any depth.
+    """
+    for prefix, pattern in ignore_rules:
+        if not rel_path.startswith(prefix):
+            continue
+        if "/" in pattern:
+            if fnmatch.fnmatchcase(rel_path[len(prefix):], pattern):
+                return True
+        elif fnmatch.fnmatchcase(name, pattern):
+            return True
+    return False
+
+
+def looks_like_app(entries):
+    """True for a folder that holds Python files or a manifest itself (from its dirents alone)"""
+    return any((entry.name.endswith('.py') or entry.name in MANIFEST_FILES) and entry.is_file()
+               for entry in entries)
+
+
+def walk_projects(projects_path, max_depth=DEFAULT_MAX_DEPTH):
+    """Return (app folders, category folders) below the projects folder
+    
+    A folder that holds Python files is an app and is not looked into further;
+    any other folder is a category whose subfolders are searched, down to
+    max_depth levels. Hidden folders, SKIP_DIRS, virtualenvs and folders matched
+    by a .launcherignore are skipped without being read. Only dirent types are
+    used, so the walk costs one directory read per folder it visits.
+    """
+    apps, categories = [], []
+    pending = [(Path(projects_path), "", 1, ())]
+    
+    # The projects folder itself must be readable; anything below it is skipped quietly
+    with os.scandir(projects_path) as entries:
+        root_entries = list(entries)
+    
+    while pending:
+        directory, rel_path, depth, ignore_rules = pending.pop()
+        if root_entries is not None:
+            entries, root_entries = root_entries, None
+        else:
+            try:
+                with os.scandir(directory) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            
+            if looks_like_app(entries):
+                apps.append(directory)
+                continue
+            if any(entry.name == "pyvenv.cfg" for entry in entries):
+                continue
+            categories.append(directory)
+        
+        if any(entry.name == IGNORE_FILE for entry in entries):
+            ignore_rules += tuple((rel_path, pattern) for pattern in read_ignore_file(directory / IGNORE_FILE))
+        
+        for entry in entries:
+            name = entry.name
+            if name.startswith('.') or name in SKIP_DIRS or not entry.is_dir():
+                continue
+            child_path = rel_path + name
+            if is_ignored(child_path, name, ignore_rules):
+                continue
+            if depth == max_depth:
+                # Deepest level - every folder is a candidate app, as it always was at depth 1
+                apps.append(directory / name)
+            else:
+                pending.append((directory / name, child_path + "/", depth + 1, ignore_rules))
+    
+    return sorted(apps), sorted(categories)
+
+
+def list_project_folders(projects_path, max_depth=DEFAULT_MAX_DEPTH):
+    """Return the candidate app folders below the projects folder (see walk_projects)"""
+    return walk_projects(projects_path, max_depth)[0]
+
+
+def app_name(folder, projects_path):
+    """Name an app is shown and remembered by: its path below the projects folder, e.g. tools/foo"""
+    try:
+        return Path(folder).relative_to(projects_path).as_posix()
+    except ValueError:
+        return Path(folder).name
+
+
+def root_for(folder, roots):
+    """The root holding a folder (the innermost one if roots are nested), or None"""
+    folder = Path(folder)
+    found = None
+    for root in roots:
+        path = root['path']
+        if path in folder.parents and (found is None or found['path'] in path.parents):
+            found = root
+    return found
+
+
+def merge_root_apps(roots, root_apps):
+    """Merge per-root scan results into {app_name: (root, app_info)}
+    
+    root_apps maps str(root path) to {name below that root: app_info}. A name
+    belongs to the first root (in the given order) that has it; the same name
+    in a later root is shown as "<root name>:<name>".
+    """
+    merged = {}
+    for root in roots:
+        for name, app_info in sorted(root_apps.get(str(root['path']), {}).items()):
+            if name in merged:
+                name = f"{root['name']}:{name}"
+            merged[name] = (root, app_info)
+    return merged
+
+
+def scan_folder(folder, index):
+    """Return app info for a folder, reusing the index when its files are unchanged"""
+    fingerprint = folder_fingerprint(folder)
+    found, app_info = index.lookup(folder, fingerprint)
+    
+    if not found:
+        try:
+            app_info = analyze_app(folder, index.import_cache, index.package_names)
+        except OSError:
+            app_info = None
+        index.store(folder, fingerprint, app_info)
+    
+    return app_info
+
+
+def iter_scan(folders, index, max_workers=SCAN_WORKERS, cancel_event=None):
+    """Analyze folders on a bounded thread pool, yielding (folder, app_info) as each finishes"""
+    # Imported here - it pulls in logging, and commands that analyze one folder never need it
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    
+    def task(folder):
+        if cancel_event is not None and cancel_event.is_set():
+            return folder, None
+        return folder, scan_folder(folder, index)
+    
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scan") as pool:
+        futures = [pool.submit(task, folder) for folder in folders]
+        try:
+            for future in as_completed(futures):
+                if cancel_event is not None and cancel_event.is_set():
+                    break
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def scan_root(projects_path, index, max_depth=DEFAULT_MAX_DEPTH, cancel_event=None):
+    """Scan one projects root, yielding ('total', folder count) once it is walked and
+    then ('app', folder, app_info) per folder
+    
+    A completed scan prunes the index entries below the root (and only those)
+    and saves the index. Raises OSError when the root cannot be read.
+    """
+    folders = list_project_folders(projects_path, max_depth)
+    yield 'total', len(folders)
+    
+    # Folders are analyzed concurrently, only changed ones hit the disk
+    for folder, app_info in iter_scan(folders, index, cancel_event=cancel_event):
+        yield 'app', folder, app_info
+    
+    if cancel_event is None or not cancel_event.is_set():
+        index.prune(folders, projects_path)
+    index.save()
+
+
+class ScanIndex:
+    """Persistent cache of analyze_app results keyed by folder fingerprint
+    
+    names is the import -> package table dependencies are named with (see
+    applauncher.dependencies.package_names); results made with another table,
+    another Python version or another TOML parser are discarded on load (see
+    results_signature). The per-file import cache is kept here too.
+    """
+    
+    def __init__(self, index_file, names=None):
+        self.index_file = Path(index_file)
+        self.package_names = names if names is not None else package_names()
+        self.signature = results_signature(self.package_names)
+        self.import_cache = ImportCache()
+        self.entries = {}
+        self.dirty = False
+        # Scans look up and store entries from worker threads
+        self.lock = threading.Lock()
+        self.save_lock = threading.Lock()
+    
+    def load(self):
+        """Load the index from disk, starting empty if it is missing or corrupt"""
+        self.entries = {}
+        self.dirty = False
+        
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            
+            if data.get('version') != INDEX_VERSION:
+                return
+            
+            # File contents parse to the same imports whatever the package names are
+            # (but not on every Python version)
+            if data.get('python') != list(sys.version_info[:2]):
+                return
+            self.import_cache = ImportCache(data.get('imports'))
+            if data.get('signature') != self.signature:
+                return
+            
+            entries = {}
+            for key, entry in data['folders'].items():
+                if not isinstance(entry['fingerprint'], list):
+                    raise ValueError(f"Bad fingerprint for {key}")
+                if entry['app_info'] is not None and 'entry_point' not in entry['app_info']:
+                    raise ValueError(f"Bad app info for {key}")
+                entries[key] = entry
+            with self.lock:
+                self.entries = entries
+        except Exception:
+            # Missing or corrupt index - everything gets rescanned
+            with self.lock:
+                self.entries = {}
+    
+    def save(self):
+        """Write the index to disk if anything changed"""
+        cache = self.import_cache
+        tmp_file = self.index_file.with_name(self.index_file.name + ".tmp")
+        
+        # Roots finishing at once save concurrently - the snapshot taken last must be written last
+        try:
+            with self.save_lock:
+                with self.lock, cache.lock:
+                    if not (self.dirty or cache.dirty):
+                        return
+                    data = {
+                        'version': INDEX_VERSION,
+                        'python': list(sys.version_info[:2]),
+                        'signature': self.signature,
+                        'folders': dict(self.entries),
+                        'imports': dict(cache.entries),
+                    }
+                    self.dirty = cache.dirty = False
+                
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump(data, f)
+                os.replace(tmp_file, self.index_file)
+        except OSError:
+            # The index is only a cache - a failed write just means a slower next scan
+            with self.lock:
+                self.dirty = True
+    
+    def lookup(self, folder, fingerprint):
+        """Return (found, app_info) for a folder whose fingerprint is unchanged"""
+        with self.lock:
+            entry = self.entries.get(str(folder))
+        
+        if fingerprint is None or entry is None or entry['fingerprint'] != fingerprint:
+            return False, None
+        
+        app_info = entry['app_info']
+        if app_info is None:
+            return True, None
+        
+        app_info = dict(app_info)
+        app_info['folder'] = Path(app_info['folder'])
+        return True, app_info
+    
+    def store(self, folder, fingerprint, app_info):
+        """Remember the analysis result for a folder"""
+        if fingerprint is None:
+            return
+        
+        if app_info is not None:
+            app_info = dict(app_info)
+            app_info['folder'] = str(app_info['folder'])
+        
+        with self.lock:
+            self.entries[str(folder)] = {'fingerprint': fingerprint, 'app_info': app_info}
+            self.dirty = True
+    
+    def remove(self, folder):
+        """Forget a folder that no longer exists, and every folder that was below it"""
+        prefix = os.path.join(str(folder), "")
+        with self.lock:
+            for key in list(self.entries):
+                if key == str(folder) or key.startswith(prefix):
+                    del self.entries[key]
+                    self.dirty = True
+    
+    def prune(self, seen_folders, root=None):
+        """Drop entries for folders that were not seen in the latest scan
+        
+        With root, only entries below that projects root are considered, so
+        scanning one root keeps what is cached for the others.
+        """
+        keep = {str(folder) for folder in seen_folders}
+        prefix = os.path.join(str(root), "") if root is not None else ""
+        
+        with self.lock:
+            for key in list(self.entries):
+                if key not in keep and key.startswith(prefix):
+                    del self.entries[key]
+                    self.dirty = True
+        
+        self.import_cache.prune()
@@ -0,0 +1,364 @@
+"""
+App environments - locating each app's virtualenv and remembering what was
+installed into it, so launches can skip dependency installs that already happened.
+
+Apps normally get their own .venv; in shared mode apps with the same dependency
+set use one environment from a launcher-managed cache, keyed by a hash of that set.
+
+After the first install the exact package versions are written to a lock file in
+the app folder, and later builds `uv pip sync` to it instead of resolving again.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import threading
+
+from applauncher.runner import PHASE_CREATING_ENV, PHASE_INSTALLING, PHASE_LOCATING_UV
+
+
+# Written inside .venv after a successful dependency install
+STAMP_NAME = ".launcher_stamp.json"
+
+# Pinned packages of the app's last resolved install, kept in the app folder
+LOCK_NAME = ".launcher_lock.txt"
+
+# First line of a lock file, followed by the hash of the dependency set it was made for
+LOCK_HEADER = "# launcher lock for "
+
+# Shared environments being set up - one lock per environment path
+_shared_env_locks = {}
+_shared_env_locks_lock = threading.Lock()
+
+
+class UvNotFoundError(Exception):
+    """Raised when the uv executable cannot be found"""
+
+
+class UvTool:
+    """The uv executable, located once per session and reused for every launch"""
+    
+    def __init__(self):
+        self.path = None
+        self.version = None
+        self.lock = threading.Lock()
+    
+    def probe(self):
+        """Look uv up on PATH and ask for its version; returns the path or None"""
+        path = shutil.which("uv")
+        version = None
+        
+        if path is not None:
+            try:
+                result = subprocess.run(
+                    [path, "--version"],
+                    capture_output=True,
+                    text=True,
+                    timeout=30
+                )
+                if result.returncode == 0:
+                    version = result.stdout.strip()
+                else:
+                    path = None
+            except (OSError, subprocess.TimeoutExpired):
+                path = None
+        
+        with self.lock:
+            self.path = path
+            self.version = version
+        return path
+    
+    def command(self, *args):
+        """Build a command line using the cached absolute path to uv"""
+        if self.path is None and self.probe() is None:
+            raise UvNotFoundError("uv is not installed")
+        return [self.path] + list(args)
+    
+    def run(self, args, **kwargs):
+        """Run uv with the given arguments, re-probing once if the cached path went away"""
+        try:
+            return subprocess.run(self.command(*args), **kwargs)
+        except FileNotFoundError:
+            if self.probe() is None:
+                raise UvNotFoundError("uv is not installed")
+            return subprocess.run(self.command(*args), **kwargs)
+
+
+def venv_python(venv_path):
+    """Return the interpreter path inside a virtualenv"""
+    if sys.platform == 'win32':
+        return venv_path / "Scripts" / "python.exe"
+    return venv_path / "bin" / "python"
+
+
+def venv_python_version(venv_path):
+    """Read the interpreter version recorded in pyvenv.cfg (no process spawn)"""
+    try:
+        text = (venv_path / "pyvenv.cfg").read_text(encoding='utf-8')
+    except OSError:
+        return None
+    
+    for line in text.splitlines():
+        key, _, value = line.partition("=")
+        if key.strip() in ("version", "version_info"):
+            return value.strip()
+    return None
+
+
+def normalized_requirements(app_info):
+    """Return the app's requirements without comments or blank lines, sorted and de-duplicated"""
+    if not app_info['has_requirements']:
+        return sorted(set(app_info['dependencies']))
+    
+    try:
+        text = (app_info['folder'] / "requirements.txt").read_text(encoding='utf-8')
+    except OSError:
+        return []
+    
+    # Packages declared in a manifest are installed on top of requirements.txt
+    lines = set(app_info['dependencies']) if app_info['manifest'] else set()
+    for line in text.splitlines():
+        if line.lstrip().startswith('#'):
+            continue
+        line = " ".join(line.split(' #', 1)[0].split())
+        if line:
+            lines.add(line)
+    return sorted(lines)
+
+
+def dependency_spec(app_info):
+    """Return the text that determines what gets installed for an app"""
+    spec = "\n".join(normalized_requirements(app_info))
+    if app_info['python']:
+        # A different interpreter needs its own environment
+        spec = f"python {app_info['python']}\n" + spec
+    return spec
+
+
+def dependency_hash(app_info):
+    """Hash of the app's dependency spec (keys shared environments, stamps and lock files)"""
+    return hashlib.sha256(dependency_spec(app_info).encode('utf-8')).hexdigest()
+
+
+def install_args(app_info):
+    """`uv pip install` arguments for the app's dependencies ([] when there is nothing to install)"""
+    if not app_info['has_requirements']:
+        return list(app_info['dependencies'])
+    
+    args = ["-r", "requirements.txt"]
+    if app_info['manifest']:
+        args += app_info['dependencies']
+    return args
+
+
+def venv_matches_python(venv_path, requested):
+    """False when the app asks for a plain version ("3.11") and the venv has another one"""
+    if not requested or not all(part.isdigit() for part in requested.split(".")):
+        # No version, or a range that uv resolved when the venv was created
+        return True
+    
+    version = venv_python_version(venv_path)
+    return version is None or version == requested or version.startswith(requested + ".")
+
+
+def shared_env_path(app_info, shared_envs_dir):
+    """Return the cached environment for the app's dependency set"""
+    return shared_envs_dir / dependency_hash(app_info)[:16]
+
+
+def app_env_path(app_info, shared_envs_dir=None):
+    """Return the environment an app runs in - its own .venv or a shared one"""
+    if shared_envs_dir is not None:
+        return shared_env_path(app_info, shared_envs_dir)
+    return app_info['folder'] / ".venv"
+
+
+def _env_lock(venv_path):
+    """Lock that serializes setup of one environment across launches"""
+    with _shared_env_locks_lock:
+        return _shared_env_locks.setdefault(str(venv_path), threading.Lock())
+
+
+def env_stamp(app_info, venv_path):
+    """Build the stamp describing the environment an app needs"""
+    return {
+        'dependencies': dependency_hash(app_info),
+        'python': venv_python_version(venv_path),
+    }
+
+
+def env_is_current(app_info, venv_path):
+    """True when the venv exists and its stamp matches the app's current dependencies"""
+    if not venv_python(venv_path).exists():
+        return False
+    
+    try:
+        with open(venv_path / STAMP_NAME, 'r', encoding='utf-8') as f:
+            saved = json.load(f)
+    except (OSError, ValueError):
+        return False
+    
+    return saved == env_stamp(app_info, venv_path)
+
+
+def write_env_stamp(app_info, venv_path):
+    """Record that the app's dependencies are installed in the venv"""
+    try:
+        with open(venv_path / STAMP_NAME, 'w', encoding='utf-8') as f:
+            json.dump(env_stamp(app_info, venv_path), f)
+    except OSError:
+        # Without a stamp the next launch just installs again
+        pass
+
+
+def clear_env_stamp(venv_path):
+    """Forget what was installed so the next launch reinstalls"""
+    try:
+        (venv_path / STAMP_NAME).unlink()
+    except OSError:
+        pass
+
+
+def current_lock(app_info):
+    """The app's lock file if it was made for its current dependencies, else None"""
+    lock_path = app_info['folder'] / LOCK_NAME
+    try:
+        with open(lock_path, 'r', encoding='utf-8') as f:
+            header = f.readline().strip()
+    except OSError:
+        return None
+    return lock_path if header == LOCK_HEADER + dependency_hash(app_info) else None
+
+
+def write_lock(uv, app_info, venv_path, **kwargs):
+    """Save what `uv pip freeze` reports for the environment as the app's lock file"""
+    try:
+        result = uv.run(
+            ["pip", "freeze", "--python", str(venv_python(venv_path))],
+            cwd=app_info['folder'],
+            check=True,
+            capture_output=True,
+            text=True,
+            **kwargs
+        )
+        with open(app_info['folder'] / LOCK_NAME, 'w', encoding='utf-8') as f:
+            f.write(f"{LOCK_HEADER}{dependency_hash(app_info)}\n")
+            f.write("# Regenerated by \"Upgrade Dependencies\" - do not edit\n")
+            f.write(result.stdout)
+    except (subprocess.CalledProcessError, OSError):
+        # Without a lock the next install just resolves again
+        pass
+
+
+def low_priority_kwargs():
+    """subprocess arguments that start a process at below-normal CPU priority"""
+    if sys.platform == 'win32':
+        return {'creationflags': subprocess.BELOW_NORMAL_PRIORITY_CLASS}
+    return {'preexec_fn': lambda: os.nice(10)}
+
+
+def install_packages(uv, args, wheelhouse=None, command="install", **kwargs):
+    """Run `uv pip install args` (or another `uv pip` command), from the wheelhouse when there is one
+    
+    With a wheelhouse (see applauncher.wheelhouse) the install runs offline
+    first, and only goes to the package index if the wheelhouse allows it.
+    """
+    if wheelhouse is not None:
+        try:
+            return uv.run(["pip", command] + args + wheelhouse.install_args(), check=True, **kwargs)
+        except subprocess.CalledProcessError:
+            if not wheelhouse.network_fallback:
+                raise
+    return uv.run(["pip", command] + args, check=True, **kwargs)
+
+
+def prepare_env(uv, app_info, force_install=False, on_phase=None, shared_envs_dir=None,
+                low_priority=False, wheelhouse=None, upgrade=False):
+    """Create the app's venv and install its dependencies unless the stamp says they are current
+    
+    on_phase(phase) is called as each step starts. With shared_envs_dir the app uses
+    the shared environment for its dependency set instead of its own .venv,
+    low_priority runs uv below normal CPU priority and wheelhouse installs from
+    local wheels. upgrade ignores the lock file, installs the newest allowed
+    versions and locks those (as happens too when the lock's pins no longer
+    install, e.g. after a Python upgrade). Returns the venv path; raises
+    UvNotFoundError or subprocess.CalledProcessError when a step fails.
+    """
+    venv_path = app_env_path(app_info, shared_envs_dir)
+    priority = low_priority_kwargs() if low_priority else {}
+    
+    with _env_lock(venv_path):
+        _prepare_env(uv, app_info, venv_path, force_install, on_phase, shared_envs_dir is not None,
+                     priority, wheelhouse, upgrade)
+    return venv_path
+
+
+def _prepare_env(uv, app_info, venv_path, force_install, on_phase, shared, priority, wheelhouse,
+                 upgrade):
+    """Create and fill one environment (caller holds its lock)"""
+    app_folder = app_info['folder']
+    
+    # Shared environments live outside the app folder, so point uv at them explicitly
+    target = ["--python", str(venv_python(venv_path))] if shared else []
+    
+    def report(name):
+        if on_phase is not None:
+            on_phase(name)
+    
+    def phase(name):
+        if uv.path is None:
+            # First uv use this session - time the lookup as its own phase
+            report(PHASE_LOCATING_UV)
+            uv.probe()
+        report(name)
+    
+    # An app that now asks for another Python gets a fresh environment
+    python_version = app_info['python']
+    if venv_path.exists() and not venv_matches_python(venv_path, python_version):
+        shutil.rmtree(venv_path, ignore_errors=True)
+    
+    # Setup UV environment if needed
+    if not venv_path.exists():
+        phase(PHASE_CREATING_ENV)
+        if shared:
+            venv_path.parent.mkdir(parents=True, exist_ok=True)
+        uv.run(
+            (["venv", str(venv_path)] if shared else ["venv"])
+            + (["--python", python_version] if python_version else []),
+            cwd=app_folder,
+            check=True,
+            capture_output=True,
+            **priority
+        )
+    
+    # Skip the install when the stamp says nothing changed since last time
+    if force_install or upgrade:
+        clear_env_stamp(venv_path)
+    
+    needs_install = not env_is_current(app_info, venv_path)
+    reinstall = ["--reinstall"] if force_install else []
+    
+    # Install requirements.txt and/or the declared or detected packages
+    packages = install_args(app_info)
+    if needs_install and packages:
+        phase(PHASE_INSTALLING)
+        lock_path = None if upgrade else current_lock(app_info)
+        if lock_path is not None:
+            # The lock pins every package, so uv has nothing to resolve
+            try:
+                install_packages(uv, [str(lock_path)] + target + reinstall, wheelhouse, command="sync",
+                                 cwd=app_folder, capture_output=True, **priority)
+            except subprocess.CalledProcessError:
+                # Pins that cannot be installed (made for another Python version, or
+                # yanked since) - resolve the requirements again and lock the result
+                lock_path = None
+        if lock_path is None:
+            install_packages(uv, packages + target + reinstall + (["--upgrade"] if upgrade else []),
+                             wheelhouse, cwd=app_folder, capture_output=True, **priority)
+            write_lock(uv, app_info, venv_path, **priority)
+    
+    if needs_install:
+        write_env_stamp(app_info, venv_path)
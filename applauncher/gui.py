@@ -0,0 +1,2161 @@
+"""
+Claude App Launcher GUI - modern card-based interface with professional UX design
+(imported only when the window is requested, so the command line never loads Tk)
+"""
+
+import tkinter as tk
+from tkinter import ttk, messagebox, scrolledtext, filedialog
+from tkinter import font as tkfont
+import subprocess
+from pathlib import Path
+import threading
+import queue
+import shutil
+import time
+
+from applauncher.bundle import build_bundle
+from applauncher.config import (load_config, project_roots_config, project_roots_from_config,
+                                run_logs_dir_from_config, save_config, shared_envs_dir_from_config,
+                                wheelhouse_dir_from_config)
+from applauncher.dependencies import package_names
+from applauncher.discovery import (ScanIndex, analyze_app, app_name, merge_root_apps, root_for,
+                                   scan_folder, scan_root)
+from applauncher.envs import UvNotFoundError, UvTool, prepare_env, venv_python, venv_python_version
+from applauncher.history import RunHistory
+from applauncher.limits import AppLimits, LimitsConfigError, limits_for
+from applauncher.logs import ERROR_PATTERN, LogPager, RunLogStore, TextPattern, split_stream
+from applauncher.monitor import ResourceMonitor, monitoring_available
+from applauncher.prewarm import ENV_BUILDING, ENV_FAILED, ENV_MISSING, ENV_READY, EnvPrewarmer
+from applauncher.runner import (ACTIVE_PHASES, PHASE_CHECKING_ENV, PHASE_CREATING_ENV,
+                                PHASE_EXITED, PHASE_FAILED, PHASE_INSTALLING, PHASE_LIMITED,
+                                PHASE_LOCATING_UV, PHASE_QUEUED, PHASE_RUNNING, PHASE_STOPPED, AppProcess,
+                                ProcessTable, app_command)
+from applauncher.scripts import write_launcher_scripts
+from applauncher.watcher import ProjectWatcher
+from applauncher.wheelhouse import Wheelhouse
+
+# How often (ms) the UI picks up results from a background scan, and how many per pass
+SCAN_POLL_MS = 50
+SCAN_BATCH_SIZE = 100
+
+# Card grid layout - only rows near the viewport get real card widgets
+CARD_COLUMNS = 2
+CARD_PAD = 15
+CARD_OVERSCAN_ROWS = 2
+
+# How often (ms) an output window picks up new lines from the running app
+OUTPUT_POLL_MS = 100
+
+# How often (ms) the runs panel refreshes
+RUNS_POLL_MS = 500
+
+# Runs listed per app in the history window
+HISTORY_ROWS = 200
+
+# Stored runs offered in a card's Past Runs menu
+PAST_RUNS_MENU_ITEMS = 15
+
+
+def format_seconds(seconds):
+    """Short duration for cards and tables"""
+    if seconds is None:
+        return ""
+    if seconds < 1:
+        return f"{seconds * 1000:.0f} ms"
+    return f"{seconds:.1f} s"
+
+
+def format_bytes(size):
+    """Short size for tables"""
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def format_usage(usage, finished=False):
+    """One-line resource summary of a run - live values while it runs, peaks afterwards"""
+    if usage is None or not usage.samples:
+        return ""
+    if finished:
+        return (f"Peak: CPU {usage.peak_cpu_percent:.0f}% · RSS {format_bytes(usage.peak_rss)} · "
+                f"{usage.peak_threads} threads · {usage.peak_fds} open files")
+    processes = f" · {usage.processes} processes" if usage.processes > 1 else ""
+    return (f"CPU {usage.cpu_percent:.0f}% · RSS {format_bytes(usage.rss)} "
+            f"(peak {format_bytes(usage.peak_rss)}) · {usage.threads} threads · "
+            f"{usage.fds} open files{processes}")
+
+
+class AppCard(ttk.Frame):
+    """A beautiful card widget for displaying an app"""
+    
+    def __init__(self, parent, app_name, app_info, launcher):
+        super().__init__(parent, style='Card.TFrame')
+        self.app_name = app_name
+        self.app_info = app_info
+        self.launcher = launcher
+        
+        # Card padding
+        self.configure(padding=20)
+        
+        # App title
+        self.title_label = ttk.Label(
+            self, 
+            text=app_name,
+            font=("Segoe UI", 14, "bold"),
+            foreground="#2c3e50"
+        )
+        self.title_label.grid(row=0, column=0, sticky="w", pady=(0, 10))
+        
+        # Projects root the app comes from (only shown when several roots are enabled)
+        self.root_tag = launcher.root_tag(app_name)
+        self.root_label = ttk.Label(
+            self,
+            text=self.root_tag,
+            font=("Segoe UI", 9, "bold"),
+            foreground=launcher.colors['primary']
+        )
+        self.root_label.grid(row=0, column=1, sticky="ne", padx=(10, 0))
+        
+        # App details
+        self.details_label = ttk.Label(
+            self,
+            text=self.details_text(),
+            font=("Segoe UI", 9),
+            foreground="#7f8c8d",
+            justify=tk.LEFT
+        )
+        self.details_label.grid(row=1, column=0, columnspan=2, sticky="w", pady=(0, 15))
+        
+        # Button frame
+        btn_frame = ttk.Frame(self)
+        btn_frame.grid(row=2, column=0, columnspan=2, sticky="ew")
+        
+        # Run button
+        run_btn = ttk.Button(
+            btn_frame,
+            text="Run Now",
+            command=self.run_app,
+            style='Accent.TButton'
+        )
+        run_btn.pack(side=tk.LEFT, padx=(0, 10))
+        
+        # Create launcher button
+        launcher_btn = ttk.Button(
+            btn_frame,
+            text="Create Script",
+            command=self.create_launcher
+        )
+        launcher_btn.pack(side=tk.LEFT, padx=(0, 10))
+        
+        # Reinstall button - ignores the environment stamp for one run
+        reinstall_btn = ttk.Button(
+            btn_frame,
+            text="Force Reinstall",
+            command=self.force_reinstall
+        )
+        reinstall_btn.pack(side=tk.LEFT, padx=(0, 10))
+        
+        # Past runs - reopens a stored log without running the app again
+        self.past_runs_menu = tk.Menu(self, tearoff=0, postcommand=self.fill_past_runs)
+        past_runs_btn = ttk.Menubutton(
+            btn_frame,
+            text="Past Runs",
+            menu=self.past_runs_menu
+        )
+        past_runs_btn.pack(side=tk.LEFT, padx=(0, 10))
+        
+        # Less common actions
+        more_menu = tk.Menu(self, tearoff=0)
+        more_menu.add_command(label="Upgrade Dependencies", command=self.upgrade_dependencies)
+        more_menu.add_command(label="Vendor Dependencies", command=self.vendor_dependencies)
+        more_menu.add_command(label="Build Bundle", command=self.build_bundle)
+        more_btn = ttk.Menubutton(
+            btn_frame,
+            text="More",
+            menu=more_menu
+        )
+        more_btn.pack(side=tk.LEFT)
+        
+        # Environment badge (filled in by the background pre-warmer)
+        self.env_label = ttk.Label(self, text="", font=("Segoe UI", 9))
+        self.env_label.grid(row=3, column=0, columnspan=2, sticky="w", pady=(10, 0))
+        self.show_env_state(launcher.env_states.get(app_name))
+        
+        # Launch latency from the run history
+        self.latency_label = ttk.Label(
+            self,
+            text="",
+            font=("Segoe UI", 9),
+            foreground=launcher.colors['text_light']
+        )
+        self.latency_label.grid(row=4, column=0, columnspan=2, sticky="w", pady=(2, 0))
+        self.show_latency()
+    
+    def details_text(self):
+        """Build the entry point / dependency summary shown on the card"""
+        app_info = self.app_info
+        details = []
+        entry = " ".join([app_info['entry_point']] + app_info['args'])
+        if app_info['manifest']:
+            details.append(f"Entry: {entry} ({app_info['manifest']})")
+        else:
+            details.append(f"Entry: {entry}")
+        
+        if app_info['has_requirements']:
+            details.append("Dependencies: requirements.txt")
+        elif app_info['dependencies']:
+            details.append(f"Dependencies: {', '.join(app_info['dependencies'][:3])}")
+            if len(app_info['dependencies']) > 3:
+                details.append(f"  (+{len(app_info['dependencies']) - 3} more)")
+        else:
+            details.append("Dependencies: None")
+        
+        if app_info['manifest_error']:
+            details.append(f"Manifest ignored: {app_info['manifest_error']}")
+        
+        return "\n".join(details)
+    
+    def show_app(self, app_name, app_info):
+        """Point this card at another app (cards are recycled while scrolling)"""
+        self.app_name = app_name
+        self.app_info = app_info
+        self.title_label.config(text=app_name)
+        self.root_tag = self.launcher.root_tag(app_name)
+        self.root_label.config(text=self.root_tag)
+        self.details_label.config(text=self.details_text())
+        self.show_env_state(self.launcher.env_states.get(app_name))
+        self.show_latency()
+    
+    def show_latency(self):
+        """Show the app's median and 95th percentile launch time"""
+        stats = self.launcher.history.latency_stats(self.app_name)
+        if stats is None:
+            self.latency_label.config(text="")
+            return
+        
+        launches, p50, p95 = stats
+        self.latency_label.config(
+            text=f"Launch p50 {format_seconds(p50)} · p95 {format_seconds(p95)} "
+                 f"({launches} run{'s' if launches != 1 else ''})"
+        )
+    
+    def fill_past_runs(self):
+        """Rebuild the Past Runs menu from the run history just before it opens"""
+        menu = self.past_runs_menu
+        menu.delete(0, tk.END)
+        
+        entries = [
+            entry for entry in self.launcher.history.runs_for(self.app_name)
+            if entry.get('log') and Path(entry['log']).exists()
+        ][:PAST_RUNS_MENU_ITEMS]
+        
+        if not entries:
+            menu.add_command(label="No stored runs", state=tk.DISABLED)
+            return
+        
+        for entry in entries:
+            started = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(entry['started']))
+            result = entry.get('outcome', "")
+            if entry.get('exit_code') is not None:
+                result += f" (exit {entry['exit_code']})"
+            menu.add_command(
+                label=f"{started}  {result}",
+                command=lambda entry=entry: self.launcher.show_past_run(self.app_name, entry)
+            )
+    
+    def show_env_state(self, state):
+        """Show whether the app's environment is ready to launch"""
+        colors = self.launcher.colors
+        text, color = {
+            ENV_READY: ("● Environment ready", colors['success']),
+            ENV_BUILDING: ("◌ Preparing environment...", colors['warning']),
+            ENV_MISSING: ("○ Environment not built", colors['text_light']),
+            ENV_FAILED: ("✕ Environment setup failed", colors['danger']),
+        }.get(state, ("", colors['text_light']))
+        self.env_label.config(text=text, foreground=color)
+    
+    def run_app(self):
+        """Run this app"""
+        self.launcher.run_app(self.app_name, self.app_info)
+    
+    def create_launcher(self):
+        """Create launcher script for this app"""
+        self.launcher.create_launcher(self.app_name, self.app_info)
+    
+    def force_reinstall(self):
+        """Reinstall this app's dependencies, then run it"""
+        self.launcher.run_app(self.app_name, self.app_info, force_install=True)
+    
+    def upgrade_dependencies(self):
+        """Install the newest versions the app allows, lock them, then run it"""
+        self.launcher.run_app(self.app_name, self.app_info, upgrade=True)
+    
+    def vendor_dependencies(self):
+        """Put wheels for this app's dependencies into the offline wheelhouse"""
+        self.launcher.vendor_dependencies(self.app_name, self.app_info)
+    
+    def build_bundle(self):
+        """Package this app and its dependencies into one .pyz file"""
+        self.launcher.build_bundle(self.app_name, self.app_info)
+
+
+class OutputDialog(tk.Toplevel):
+    """Output window that fills in while the app is still running (used when runs are not logged)"""
+    
+    def __init__(self, launcher, app_name, process, record=None):
+        super().__init__(launcher.root)
+        self.launcher = launcher
+        self.process = process
+        self.record = record
+        self.seq = 0
+        colors = launcher.colors
+        
+        self.title(f"Output - {app_name}")
+        self.geometry("800x600")
+        
+        # Header
+        header_frame = ttk.Frame(self)
+        header_frame.pack(fill=tk.X, padx=20, pady=20)
+        
+        self.status_label = ttk.Label(
+            header_frame,
+            text="Running...",
+            font=("Segoe UI", 12, "bold"),
+            foreground=colors['primary']
+        )
+        self.status_label.pack()
+        
+        # CPU / memory of the app while it runs
+        self.usage_label = ttk.Label(header_frame, text="", foreground=colors['text_light'])
+        self.usage_label.pack()
+        
+        # Output text (stderr in red, notices in gray)
+        self.text_widget = scrolledtext.ScrolledText(
+            self,
+            wrap=tk.WORD,
+            font=("Consolas", 10),
+            bg='#f8f9fa',
+            fg=colors['dark']
+        )
+        self.text_widget.tag_configure('stdout', foreground=colors['dark'])
+        self.text_widget.tag_configure('stderr', foreground=colors['danger'])
+        self.text_widget.tag_configure('notice', foreground=colors['text_light'])
+        self.text_widget.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 20))
+        self.text_widget.config(state=tk.DISABLED)
+        
+        # Close button
+        close_btn = ttk.Button(
+            self,
+            text="Close",
+            command=self.destroy,
+            style='Accent.TButton'
+        )
+        close_btn.pack(pady=(0, 20))
+        
+        self.poll()
+    
+    def poll(self):
+        """Append whatever the app printed since the last poll"""
+        if not self.winfo_exists():
+            return
+        
+        # Check before reading so no lines arrive after the final read (the run
+        # record finishes last, once it knows whether a limit stopped the app)
+        finished = self.process.finished() and (self.record is None or not self.record.active)
+        lines, skipped, self.seq = self.process.lines_since(self.seq)
+        self.append_lines(lines, skipped)
+        if self.record is not None:
+            self.usage_label.config(text=format_usage(self.record.usage, finished))
+        
+        if finished:
+            self.show_exit(self.process.returncode)
+        else:
+            self.after(OUTPUT_POLL_MS, self.poll)
+    
+    def append_lines(self, lines, skipped=0):
+        """Insert a batch of (stream, line) pairs, keeping only the most recent lines"""
+        if not lines and not skipped:
+            return
+        
+        text = self.text_widget
+        at_bottom = text.yview()[1] >= 0.999
+        text.config(state=tk.NORMAL)
+        
+        if skipped:
+            text.insert(tk.END, f"[... {skipped} lines skipped ...]\n", 'notice')
+        
+        # One insert per run of lines from the same stream
+        chunk = []
+        chunk_stream = None
+        for stream, line in lines:
+            if stream != chunk_stream and chunk:
+                text.insert(tk.END, "".join(chunk), chunk_stream)
+                chunk = []
+            chunk_stream = stream
+            chunk.append(line)
+        if chunk:
+            text.insert(tk.END, "".join(chunk), chunk_stream)
+        
+        # Trim from the top so the widget never holds more than the ring buffer
+        line_count = int(text.index("end-1c").split(".")[0])
+        excess = line_count - self.process.buffer_lines
+        if excess > 0:
+            text.delete("1.0", f"{excess + 1}.0")
+        
+        text.config(state=tk.DISABLED)
+        if at_bottom:
+            text.see(tk.END)
+    
+    def show_exit(self, return_code):
+        """Switch the header to the app's final status"""
+        colors = self.launcher.colors
+        if self.record is not None and self.record.limit:
+            self.status_label.config(text=f"Stopped: {self.record.limit}", foreground=colors['danger'])
+            self.append_lines([('notice', f"[launcher] {self.record.limit}\n")])
+            return
+        status_text = "Completed Successfully" if return_code == 0 else f"Exited with code {return_code}"
+        status_color = colors['success'] if return_code == 0 else colors['danger']
+        self.status_label.config(text=status_text, foreground=status_color)
+
+
+class LogViewer(tk.Toplevel):
+    """Paged output window backed by a run's log file
+    
+    Only the lines in view are ever in the text widget, so huge logs open
+    instantly. The line index is built in the background while the window is
+    already usable, and a live run's log is followed as it grows.
+    """
+    
+    def __init__(self, launcher, app_name, record=None, log_entry=None):
+        super().__init__(launcher.root)
+        self.launcher = launcher
+        self.record = record
+        self.log_entry = log_entry
+        self.process = record.process if record is not None else None
+        self.pager = None
+        self.open_attempts = 0
+        
+        self.top_line = 0
+        self.page_lines = 40
+        self.following = self.process is not None
+        self.match_line = None
+        self.shown = None
+        self.search_generation = 0
+        self.search_cancel = None
+        self.search_after = None
+        colors = launcher.colors
+        
+        if log_entry is not None:
+            started = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(log_entry['started']))
+            self.title(f"Output - {app_name} ({started})")
+        else:
+            self.title(f"Output - {app_name}")
+        self.geometry("900x640")
+        
+        # Header
+        header_frame = ttk.Frame(self)
+        header_frame.pack(fill=tk.X, padx=20, pady=(20, 10))
+        
+        self.status_label = ttk.Label(
+            header_frame,
+            text="Running..." if self.process is not None else "Loading...",
+            font=("Segoe UI", 12, "bold"),
+            foreground=colors['primary']
+        )
+        self.status_label.pack(side=tk.LEFT)
+        
+        self.lines_label = ttk.Label(header_frame, text="", foreground=colors['text_light'])
+        self.lines_label.pack(side=tk.RIGHT)
+        
+        # CPU / memory of the app while it runs (peaks once it has exited)
+        self.usage_label = ttk.Label(self, text="", foreground=colors['text_light'])
+        self.usage_label.pack(fill=tk.X, padx=20, pady=(0, 10))
+        
+        # Search bar - searching starts as you type
+        search_frame = ttk.Frame(self)
+        search_frame.pack(fill=tk.X, padx=20, pady=(0, 10))
+        
+        ttk.Label(search_frame, text="Find:").pack(side=tk.LEFT, padx=(0, 5))
+        self.search_var = tk.StringVar()
+        self.search_entry = ttk.Entry(search_frame, textvariable=self.search_var, width=40)
+        self.search_entry.pack(side=tk.LEFT, padx=(0, 10))
+        self.search_var.trace_add("write", lambda *args: self.schedule_search())
+        self.search_entry.bind("<Return>", lambda e: self.search(forward=True, from_match=True))
+        self.search_entry.bind("<Shift-Return>", lambda e: self.search(forward=False, from_match=True))
+        
+        ttk.Button(search_frame, text="Previous",
+                   command=lambda: self.search(forward=False, from_match=True)).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(search_frame, text="Next",
+                   command=lambda: self.search(forward=True, from_match=True)).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(search_frame, text="Jump to Error", command=self.jump_to_error).pack(side=tk.LEFT)
+        
+        self.search_label = ttk.Label(search_frame, text="", foreground=colors['text_light'])
+        self.search_label.pack(side=tk.LEFT, padx=(10, 0))
+        
+        # Output text (stderr in red, the current match highlighted)
+        text_frame = ttk.Frame(self)
+        text_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 10))
+        
+        text_font = ("Consolas", 10)
+        self.line_height = max(1, tkfont.Font(font=text_font).metrics("linespace"))
+        self.text_widget = tk.Text(
+            text_frame,
+            wrap=tk.NONE,
+            font=text_font,
+            bg='#f8f9fa',
+            fg=colors['dark']
+        )
+        self.text_widget.tag_configure('stdout', foreground=colors['dark'])
+        self.text_widget.tag_configure('stderr', foreground=colors['danger'])
+        self.text_widget.tag_configure('notice', foreground=colors['text_light'])
+        self.text_widget.tag_configure('match', background='#fff3b0')
+        
+        # The vertical scrollbar covers the whole log, not just the lines in the widget
+        self.scrollbar = ttk.Scrollbar(text_frame, orient="vertical", command=self.on_scrollbar)
+        x_scrollbar = ttk.Scrollbar(text_frame, orient="horizontal", command=self.text_widget.xview)
+        self.text_widget.configure(xscrollcommand=x_scrollbar.set)
+        
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        x_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
+        self.text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.text_widget.config(state=tk.DISABLED)
+        
+        self.text_widget.bind("<Configure>", lambda e: self.resize())
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.text_widget.bind(sequence, self.on_mousewheel)
+        self.bind("<Prior>", lambda e: self.scroll_to(self.top_line - self.page_lines))
+        self.bind("<Next>", lambda e: self.scroll_to(self.top_line + self.page_lines))
+        self.bind("<Control-Home>", lambda e: self.scroll_to(0))
+        self.bind("<Control-End>", lambda e: self.scroll_to(self.line_count()))
+        self.bind("<Control-f>", lambda e: self.search_entry.focus_set())
+        self.bind("<F8>", lambda e: self.jump_to_error())
+        
+        # Close button
+        close_btn = ttk.Button(
+            self,
+            text="Close",
+            command=self.destroy,
+            style='Accent.TButton'
+        )
+        close_btn.pack(pady=(0, 20))
+        
+        self.open_log()
+    
+    def log_path(self):
+        """The file to page through - the live log while the run is going, the stored one after"""
+        if self.log_entry is not None:
+            return self.log_entry['log']
+        if self.record.log_file is not None:
+            return self.record.log_file
+        return self.process.log_file
+    
+    def open_log(self):
+        """Open the log, retrying briefly while a finished run's log is being compressed"""
+        if not self.winfo_exists():
+            return
+        
+        try:
+            growing = self.process is not None and not self.process.finished()
+            self.pager = LogPager(self.log_path(), growing=growing).start()
+            if self.log_entry is not None:
+                self.launcher.log_store.touch(self.log_entry['log'])
+        except OSError as e:
+            self.open_attempts += 1
+            if self.record is not None and self.record.active and self.open_attempts < 50:
+                self.after(OUTPUT_POLL_MS, self.open_log)
+                return
+            self.status_label.config(text="Log not available", foreground=self.launcher.colors['danger'])
+            self.show_notice(f"Could not read the log:\n{e}\n")
+            return
+        
+        self.poll()
+    
+    def destroy(self):
+        if self.search_cancel is not None:
+            self.search_cancel.set()
+        if self.pager is not None:
+            self.pager.close()
+            self.pager = None
+        super().destroy()
+    
+    def line_count(self):
+        return 0 if self.pager is None else self.pager.line_count
+    
+    def poll(self):
+        """Pick up newly indexed lines (a live log keeps growing until the app exits)"""
+        if not self.winfo_exists() or self.pager is None:
+            return
+        
+        pager = self.pager
+        if self.process is not None and pager.growing.is_set() and self.process.finished():
+            pager.stop_growing()
+        
+        if self.following:
+            self.top_line = max(0, pager.line_count - self.page_lines)
+        self.render()
+        
+        count = f"{pager.line_count:,} lines"
+        self.lines_label.config(text=f"Indexing... {count}" if pager.indexing else count)
+        if self.record is not None:
+            self.usage_label.config(text=format_usage(self.record.usage, not self.record.active))
+        
+        if pager.indexing or (self.record is not None and self.record.active):
+            self.after(OUTPUT_POLL_MS, self.poll)
+        elif self.process is not None:
+            self.show_exit(self.process.returncode)
+        elif self.log_entry is not None:
+            self.show_exit(self.log_entry.get('exit_code'))
+    
+    def render(self, force=False):
+        """Show the lines from top_line down, if they changed since the last render"""
+        pager = self.pager
+        if pager is None:
+            return
+        
+        total = pager.line_count
+        self.top_line = max(0, min(self.top_line, total - self.page_lines))
+        shown = (self.top_line, min(total, self.top_line + self.page_lines), self.match_line)
+        if shown == self.shown and not force:
+            return
+        self.shown = shown
+        
+        lines = pager.read_lines(self.top_line, self.page_lines)
+        text = self.text_widget
+        text.config(state=tk.NORMAL)
+        text.delete("1.0", tk.END)
+        
+        # One insert per run of lines from the same stream
+        chunk = []
+        chunk_stream = None
+        for line in lines:
+            stream, line = split_stream(line)
+            if stream != chunk_stream and chunk:
+                text.insert(tk.END, "".join(chunk), chunk_stream)
+                chunk = []
+            chunk_stream = stream
+            chunk.append(line)
+        if chunk:
+            text.insert(tk.END, "".join(chunk), chunk_stream)
+        
+        if self.match_line is not None and self.top_line <= self.match_line < self.top_line + len(lines):
+            row = self.match_line - self.top_line + 1
+            text.tag_add('match', f"{row}.0", f"{row}.0 lineend")
+        
+        text.config(state=tk.DISABLED)
+        
+        if total:
+            self.scrollbar.set(self.top_line / total, min(1.0, (self.top_line + self.page_lines) / total))
+        else:
+            self.scrollbar.set(0, 1)
+    
+    def show_notice(self, message):
+        text = self.text_widget
+        text.config(state=tk.NORMAL)
+        text.insert(tk.END, message, 'notice')
+        text.config(state=tk.DISABLED)
+    
+    def resize(self):
+        """Fit the page to the widget height"""
+        self.page_lines = max(1, self.text_widget.winfo_height() // self.line_height)
+        self.render()
+    
+    def scroll_to(self, line):
+        """Put a line at the top; scrolling to the end follows a live log again"""
+        self.top_line = max(0, min(line, self.line_count() - self.page_lines))
+        self.following = self.process is not None and self.top_line >= self.line_count() - self.page_lines
+        self.render()
+    
+    def on_scrollbar(self, action, amount, unit=None):
+        if action == "moveto":
+            self.scroll_to(int(float(amount) * self.line_count()))
+        elif unit == "pages":
+            self.scroll_to(self.top_line + int(amount) * self.page_lines)
+        else:
+            self.scroll_to(self.top_line + int(amount))
+    
+    def on_mousewheel(self, event):
+        if getattr(event, 'num', None) == 4:
+            step = -3
+        elif getattr(event, 'num', None) == 5:
+            step = 3
+        else:
+            step = -3 if event.delta > 0 else 3
+        self.scroll_to(self.top_line + step)
+        # Keep the launcher's card grid from scrolling too
+        return "break"
+    
+    # Search
+    
+    def schedule_search(self):
+        """Search a moment after typing stops, from where the view is"""
+        if self.search_after is not None:
+            self.after_cancel(self.search_after)
+        self.search_after = self.after(150, lambda: self.search(forward=True, from_match=False))
+    
+    def search(self, forward=True, from_match=False):
+        """Find the next (or previous) line containing the search text"""
+        self.search_after = None
+        query = self.search_var.get()
+        if not query:
+            self.match_line = None
+            self.search_label.config(text="")
+            self.render()
+            return
+        self.find(TextPattern(query), forward, from_match, query)
+    
+    def jump_to_error(self):
+        """Go to the next traceback or error line after the current one"""
+        self.find(ERROR_PATTERN, True, True, None)
+    
+    def find(self, pattern, forward, from_match, query):
+        """Run a search on a background thread, wrapping around the end of the log"""
+        pager = self.pager
+        if pager is None:
+            return
+        
+        if self.search_cancel is not None:
+            self.search_cancel.set()
+        cancel_event = threading.Event()
+        self.search_cancel = cancel_event
+        self.search_generation += 1
+        generation = self.search_generation
+        
+        if self.match_line is not None and from_match:
+            start = self.match_line + 1 if forward else self.match_line
+        else:
+            start = self.top_line
+        total = pager.line_count
+        self.search_label.config(text="Searching...")
+        
+        def search_thread():
+            try:
+                if forward:
+                    line = pager.find(pattern, start, cancel_event=cancel_event)
+                    if line is None and start > 0:
+                        line = pager.find(pattern, 0, start, cancel_event=cancel_event)
+                else:
+                    line = pager.find(pattern, 0, start, cancel_event=cancel_event, last=True)
+                    if line is None:
+                        line = pager.find(pattern, start, total, cancel_event=cancel_event, last=True)
+            except (OSError, ValueError):
+                line = None
+            
+            if not cancel_event.is_set():
+                self.launcher.root.after(0, lambda: self.show_match(generation, line, query))
+        
+        thread = threading.Thread(target=search_thread, daemon=True)
+        thread.start()
+    
+    def show_match(self, generation, line, query):
+        """Scroll a search result into view"""
+        if generation != self.search_generation or not self.winfo_exists():
+            return
+        
+        if line is None:
+            self.search_label.config(text="No errors found" if query is None else "Not found")
+            return
+        
+        self.search_label.config(text=f"Line {line + 1:,}")
+        self.match_line = line
+        self.following = False
+        self.top_line = max(0, line - self.page_lines // 3)
+        self.render()
+    
+    def show_exit(self, return_code):
+        """Switch the header to the app's final status"""
+        colors = self.launcher.colors
+        limit = self.record.limit if self.record is not None else (self.log_entry or {}).get('limit')
+        if limit:
+            self.status_label.config(text=f"Stopped: {limit}", foreground=colors['danger'])
+            return
+        if return_code is None:
+            self.status_label.config(text="Finished", foreground=colors['text_light'])
+            return
+        status_text = "Completed Successfully" if return_code == 0 else f"Exited with code {return_code}"
+        status_color = colors['success'] if return_code == 0 else colors['danger']
+        self.status_label.config(text=status_text, foreground=status_color)
+
+
+class RunsWindow(tk.Toplevel):
+    """Runs panel - every app launched this session, with Stop and Restart"""
+    
+    def __init__(self, launcher):
+        super().__init__(launcher.root)
+        self.launcher = launcher
+        
+        self.title("Running Apps")
+        self.geometry("1060x400")
+        
+        # Runs table
+        columns = ("app", "pid", "started", "phase", "exit", "cpu", "rss", "threads", "fds")
+        self.tree = ttk.Treeview(self, columns=columns, show="headings", selectmode="browse")
+        for column, heading, width in (
+            ("app", "App", 220),
+            ("pid", "PID", 80),
+            ("started", "Started", 100),
+            ("phase", "Phase", 140),
+            ("exit", "Exit Code", 90),
+            ("cpu", "CPU", 70),
+            ("rss", "Memory (peak)", 150),
+            ("threads", "Threads", 70),
+            ("fds", "Open Files", 80),
+        ):
+            self.tree.heading(column, text=heading)
+            self.tree.column(column, width=width, anchor="w")
+        self.tree.pack(fill=tk.BOTH, expand=True, padx=20, pady=(20, 10))
+        
+        # Buttons act on the selected run
+        btn_frame = ttk.Frame(self)
+        btn_frame.pack(fill=tk.X, padx=20, pady=(0, 20))
+        
+        ttk.Button(btn_frame, text="Stop", command=self.stop_selected).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(btn_frame, text="Restart", command=self.restart_selected).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(btn_frame, text="Show Output", command=self.output_selected).pack(side=tk.LEFT)
+        ttk.Button(btn_frame, text="Close", command=self.destroy).pack(side=tk.RIGHT)
+        
+        self.refresh()
+    
+    def refresh(self):
+        """Update the table from the process table"""
+        if not self.winfo_exists():
+            return
+        
+        for record in self.launcher.process_table.all_runs():
+            iid = str(record.run_id)
+            values = (
+                record.app_name,
+                record.pid or "",
+                time.strftime("%H:%M:%S", time.localtime(record.started)),
+                record.phase,
+                "" if record.exit_code is None else record.exit_code,
+            ) + self.usage_values(record)
+            if self.tree.exists(iid):
+                self.tree.item(iid, values=values)
+            else:
+                self.tree.insert("", 0, iid=iid, values=values)
+        
+        self.after(RUNS_POLL_MS, self.refresh)
+    
+    def usage_values(self, record):
+        """CPU / memory / threads / files columns - live while running, peaks afterwards"""
+        usage = record.usage
+        if usage is None or not usage.samples:
+            return ("", "", "", "")
+        if record.phase == PHASE_RUNNING:
+            return (f"{usage.cpu_percent:.0f}%", f"{format_bytes(usage.rss)} ({format_bytes(usage.peak_rss)})",
+                    usage.threads, usage.fds)
+        return (f"{usage.peak_cpu_percent:.0f}% max", f"{format_bytes(usage.peak_rss)} max",
+                usage.peak_threads, usage.peak_fds)
+    
+    def selected_run(self):
+        """Return the run record for the selected row, if any"""
+        selection = self.tree.selection()
+        if not selection:
+            return None
+        return self.launcher.process_table.get(int(selection[0]))
+    
+    def stop_selected(self):
+        record = self.selected_run()
+        if record is not None and record.active:
+            self.launcher.stop_run(record)
+    
+    def restart_selected(self):
+        record = self.selected_run()
+        if record is not None:
+            self.launcher.restart_run(record)
+    
+    def output_selected(self):
+        record = self.selected_run()
+        if record is not None and record.process is not None:
+            self.launcher.show_run_output(record)
+
+
+class HistoryWindow(tk.Toplevel):
+    """Run history - launch latency per app and the phase timings of each past run"""
+    
+    # Phases shown as columns in the runs table
+    PHASE_COLUMNS = (PHASE_QUEUED, PHASE_CHECKING_ENV, PHASE_LOCATING_UV, PHASE_CREATING_ENV,
+                     PHASE_INSTALLING, PHASE_RUNNING)
+    
+    def __init__(self, launcher):
+        super().__init__(launcher.root)
+        self.launcher = launcher
+        
+        self.title("Run History")
+        self.geometry("1200x560")
+        
+        # Apps table - one row per app with recorded runs
+        columns = ("app", "runs", "p50", "p95", "last")
+        self.apps_tree = ttk.Treeview(self, columns=columns, show="headings", selectmode="browse",
+                                      height=8)
+        for column, heading, width in (
+            ("app", "App", 260),
+            ("runs", "Runs", 70),
+            ("p50", "Launch p50", 110),
+            ("p95", "Launch p95", 110),
+            ("last", "Last Run", 160),
+        ):
+            self.apps_tree.heading(column, text=heading)
+            self.apps_tree.column(column, width=width, anchor="w")
+        self.apps_tree.pack(fill=tk.X, padx=20, pady=(20, 10))
+        self.apps_tree.bind("<<TreeviewSelect>>", lambda e: self.show_runs())
+        
+        # Runs table for the selected app, newest first
+        columns = (("started", "outcome", "exit", "launch") + self.PHASE_COLUMNS +
+                   ("output", "peak_cpu", "peak_rss"))
+        self.runs_tree = ttk.Treeview(self, columns=columns, show="headings", selectmode="browse")
+        for column in columns:
+            heading = {"started": "Started", "outcome": "Result", "exit": "Exit",
+                       "launch": "Launch", "output": "Output", "peak_cpu": "Peak CPU",
+                       "peak_rss": "Peak Memory"}.get(column, column.capitalize())
+            self.runs_tree.heading(column, text=heading)
+            self.runs_tree.column(column, width=140 if column == "started" else 85, anchor="w")
+        self.runs_tree.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 10))
+        
+        btn_frame = ttk.Frame(self)
+        btn_frame.pack(fill=tk.X, padx=20, pady=(0, 20))
+        ttk.Button(btn_frame, text="Close", command=self.destroy).pack(side=tk.RIGHT)
+        
+        self.refresh()
+    
+    def refresh(self):
+        """Rebuild the apps table, keeping the selection"""
+        selected = self.apps_tree.selection()
+        history = self.launcher.history
+        
+        self.apps_tree.delete(*self.apps_tree.get_children())
+        for app_name in history.apps():
+            runs = history.runs_for(app_name)
+            stats = history.latency_stats(app_name)
+            p50 = p95 = ""
+            if stats is not None:
+                p50, p95 = format_seconds(stats[1]), format_seconds(stats[2])
+            last = time.strftime("%Y-%m-%d %H:%M", time.localtime(runs[0]['started']))
+            self.apps_tree.insert("", tk.END, iid=app_name, values=(app_name, len(runs), p50, p95, last))
+        
+        if selected and self.apps_tree.exists(selected[0]):
+            self.apps_tree.selection_set(selected[0])
+        self.show_runs()
+    
+    def show_runs(self):
+        """Fill the runs table for the selected app"""
+        self.runs_tree.delete(*self.runs_tree.get_children())
+        selection = self.apps_tree.selection()
+        if not selection:
+            return
+        
+        for entry in self.launcher.history.runs_for(selection[0])[:HISTORY_ROWS]:
+            phases = entry.get('phases', {})
+            resources = entry.get('resources') or {}
+            values = (
+                time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(entry['started'])),
+                entry.get('outcome', ""),
+                "" if entry.get('exit_code') is None else entry['exit_code'],
+                format_seconds(entry.get('launch_seconds')),
+            ) + tuple(format_seconds(phases.get(phase)) for phase in self.PHASE_COLUMNS) + (
+                format_bytes(entry.get('output_bytes', 0)),
+                f"{resources['peak_cpu_percent']:.0f}%" if resources else "",
+                format_bytes(resources['peak_rss']) if resources else "",
+            )
+            self.runs_tree.insert("", tk.END, values=values)
+
+
+class ProjectRootsWindow(tk.Toplevel):
+    """Projects roots - the folders apps are found in, each with its own on/off switch and Rescan
+    
+    When two roots hold an app with the same name, the root higher in the list
+    keeps the plain name and the other is listed as "<root name>:<app name>".
+    """
+    
+    def __init__(self, launcher):
+        super().__init__(launcher.root)
+        self.launcher = launcher
+        
+        self.title("Projects Roots")
+        self.geometry("900x360")
+        
+        # Roots table, in priority order
+        columns = ("name", "path", "enabled", "apps")
+        self.tree = ttk.Treeview(self, columns=columns, show="headings", selectmode="browse")
+        for column, heading, width in (
+            ("name", "Name", 140),
+            ("path", "Folder", 480),
+            ("enabled", "Enabled", 80),
+            ("apps", "Apps", 80),
+        ):
+            self.tree.heading(column, text=heading)
+            self.tree.column(column, width=width, anchor="w")
+        self.tree.pack(fill=tk.BOTH, expand=True, padx=20, pady=(20, 10))
+        
+        # Buttons act on the selected root
+        btn_frame = ttk.Frame(self)
+        btn_frame.pack(fill=tk.X, padx=20, pady=(0, 20))
+        
+        ttk.Button(btn_frame, text="Add Folder...", command=self.add_root).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(btn_frame, text="Remove", command=self.remove_selected).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(btn_frame, text="Enable / Disable", command=self.toggle_selected).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(btn_frame, text="Move Up", command=self.move_selected_up).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(btn_frame, text="Rescan", command=self.rescan_selected).pack(side=tk.LEFT)
+        ttk.Button(btn_frame, text="Close", command=self.destroy).pack(side=tk.RIGHT)
+        
+        self.refresh()
+    
+    def refresh(self):
+        """Rebuild the table from the launcher's roots, keeping the selection"""
+        selected = self.tree.selection()
+        self.tree.delete(*self.tree.get_children())
+        
+        for index, root in enumerate(self.launcher.roots):
+            key = str(root['path'])
+            if not root['enabled']:
+                apps = ""
+            elif key in self.launcher.scanning_roots:
+                apps = "scanning"
+            elif key in self.launcher.root_errors:
+                apps = self.launcher.root_errors[key]
+            else:
+                apps = sum(1 for app_root in self.launcher.app_roots.values() if str(app_root['path']) == key)
+            values = (root['name'], key, "yes" if root['enabled'] else "no", apps)
+            self.tree.insert("", tk.END, iid=str(index), values=values)
+        
+        if selected and self.tree.exists(selected[0]):
+            self.tree.selection_set(selected[0])
+    
+    def selected_index(self):
+        """Position of the selected root in the list, or None"""
+        selection = self.tree.selection()
+        return int(selection[0]) if selection else None
+    
+    def add_root(self):
+        new_path = filedialog.askdirectory(parent=self, title="Add Projects Folder", mustexist=True)
+        if not new_path:
+            return
+        
+        new_path = Path(new_path)
+        roots = [dict(root) for root in self.launcher.roots]
+        if any(root['path'] == new_path for root in roots):
+            messagebox.showinfo("Already Added", f"{new_path} is already a projects root.", parent=self)
+            return
+        
+        roots.append({'path': new_path, 'enabled': True, 'name': new_path.name})
+        self.launcher.set_project_roots(roots, rescan=[new_path])
+    
+    def remove_selected(self):
+        index = self.selected_index()
+        if index is None:
+            return
+        if len(self.launcher.roots) == 1:
+            messagebox.showinfo("Projects Roots", "The last projects root cannot be removed.", parent=self)
+            return
+        
+        roots = [dict(root) for root in self.launcher.roots]
+        del roots[index]
+        self.launcher.set_project_roots(roots)
+    
+    def toggle_selected(self):
+        index = self.selected_index()
+        if index is None:
+            return
+        
+        roots = [dict(root) for root in self.launcher.roots]
+        root = roots[index]
+        root['enabled'] = not root['enabled']
+        self.launcher.set_project_roots(roots, rescan=[root['path']] if root['enabled'] else [])
+    
+    def move_selected_up(self):
+        index = self.selected_index()
+        if not index:
+            return
+        
+        roots = [dict(root) for root in self.launcher.roots]
+        roots[index - 1], roots[index] = roots[index], roots[index - 1]
+        self.launcher.set_project_roots(roots)
+        self.tree.selection_set(str(index - 1))
+    
+    def rescan_selected(self):
+        index = self.selected_index()
+        if index is not None and self.launcher.roots[index]['enabled']:
+            self.launcher.scan_projects([self.launcher.roots[index]])
+            self.refresh()
+
+
+class ModernLauncher:
+    """Modern, professional Claude App Launcher"""
+    
+    def __init__(self, root, base_path=None):
+        self.root = root
+        self.root.title("Claude® App Launcher \t\t\t\t\t\t\t\t © Mark Eckdahl 2025")
+        self.root.geometry("1000x700")
+        
+        # Setup paths (config and default projects folder live next to launcher.py)
+        self.base_path = Path(base_path) if base_path else Path(__file__).parent.parent
+        self.config_file = self.base_path / ".launcher_config.json"
+        self.index_file = self.base_path / ".launcher_index.json"
+        
+        # Load saved settings and projects path (or use defaults)
+        self.config = load_config(self.config_file)
+        self.roots = project_roots_from_config(self.config, self.base_path)
+        self.projects_path = self.load_projects_path()
+        if not self.config['projects_roots']:
+            self.projects_path.mkdir(exist_ok=True)
+        
+        # Apps found in each root ({str(root path): {name below the root: app_info}}),
+        # merged into the list the cards show and the root each listed app came from
+        self.root_apps = {}
+        self.apps = {}
+        self.app_roots = {}
+        
+        # Cached analysis results so Refresh only re-analyzes changed folders
+        self.scan_index = ScanIndex(self.index_file, package_names(self.config['import_packages']))
+        self.scan_index.load()
+        self.scan_cancel_event = None
+        # Roots the current scan has not finished yet, and why roots could not be scanned
+        self.scanning_roots = set()
+        self.root_errors = {}
+        self.empty_frame = None
+        self.watchers = []
+        
+        # Virtual card grid: cards bound to visible apps, spare cards and their canvas items
+        self.app_order = []
+        self.cards = {}
+        self.card_pool = []
+        self.card_items = {}
+        self.card_row_height = 200
+        
+        # uv is located once per session; the probe runs in the background
+        self.uv = UvTool()
+        
+        # Every launch this session, for the runs panel
+        self.process_table = ProcessTable(self.config['max_starting_apps'])
+        self.runs_window = None
+        self.roots_window = None
+        
+        # Every finished launch, with phase timings, across sessions
+        self.history = RunHistory(self.base_path / ".launcher_history.jsonl")
+        self.history.load()
+        self.history_window = None
+        
+        # CPU / memory sampling of running apps
+        self.monitor = None
+        if self.config['monitor_interval'] > 0 and monitoring_available():
+            self.monitor = ResourceMonitor(self.process_table, self.config['monitor_interval'])
+            self.monitor.start()
+        
+        # Compressed output of past runs, with a size and age limit
+        self.log_store = RunLogStore(
+            run_logs_dir_from_config(self.config, self.base_path),
+            self.config['run_logs_max_mb'] * 1024 * 1024,
+            self.config['run_logs_max_age_days']
+        )
+        
+        # Environments are built in the background after each scan
+        self.env_states = {}
+        self.prewarmer = EnvPrewarmer(
+            self.uv,
+            self._on_env_state,
+            workers=self.config['prewarm_workers'],
+            shared_envs_dir=self.shared_envs_dir,
+            wheelhouse=self.wheelhouse
+        )
+        
+        # Configure styles
+        self.setup_styles()
+        
+        # Create UI
+        self.setup_ui()
+        
+        thread = threading.Thread(target=self._probe_uv, daemon=True)
+        thread.start()
+        
+        # Load apps and keep them up to date
+        self.scan_projects()
+        self.start_watcher()
+    
+    def setup_styles(self):
+        """Setup modern color scheme and styles"""
+        style = ttk.Style()
+        
+        # Colors
+        self.colors = {
+            'primary': '#3498db',      # Blue
+            'success': '#2ecc71',      # Green
+            'warning': '#f39c12',      # Orange
+            'danger': '#e74c3c',       # Red
+            'dark': '#2c3e50',         # Dark blue-gray
+            'light': '#ecf0f1',        # Light gray
+            'white': '#ffffff',
+            'text': '#2c3e50',
+            'text_light': '#7f8c8d'
+        }
+        
+        # Card style
+        style.configure('Card.TFrame', 
+                       background='#ffffff',
+                       relief='raised',
+                       borderwidth=1)
+        
+        # Accent button
+        style.configure('Accent.TButton',
+                       font=('Segoe UI', 10, 'bold'))
+        
+        # Header style
+        style.configure('Header.TLabel',
+                       font=('Segoe UI', 24, 'bold'),
+                       foreground=self.colors['dark'])
+        
+        # Subheader style
+        style.configure('Subheader.TLabel',
+                       font=('Segoe UI', 11),
+                       foreground=self.colors['text_light'])
+    
+    def setup_ui(self):
+        """Create the modern UI"""
+        # Main container with background color
+        main_container = ttk.Frame(self.root)
+        main_container.pack(fill=tk.BOTH, expand=True)
+        
+        # Header section
+        header_frame = ttk.Frame(main_container)
+        header_frame.pack(fill=tk.X, padx=30, pady=(30, 10))
+        
+        # Title and subtitle
+        title_label = ttk.Label(
+            header_frame,
+            text="Claude® App Launcher",
+            style='Header.TLabel'
+        )
+        title_label.pack(anchor="w")
+        
+        subtitle_label = ttk.Label(
+            header_frame,
+            text="Manage and run your Python applications with ease",
+            style='Subheader.TLabel'
+        )
+        subtitle_label.pack(anchor="w", pady=(5, 0))
+        
+        # Toolbar
+        toolbar_frame = ttk.Frame(main_container)
+        toolbar_frame.pack(fill=tk.X, padx=30, pady=(0, 20))
+        
+        # Refresh button (turns into Cancel while a scan is running)
+        self.refresh_btn = ttk.Button(
+            toolbar_frame,
+            text="Refresh Apps",
+            command=self.scan_projects,
+            style='Accent.TButton'
+        )
+        self.refresh_btn.pack(side=tk.LEFT, padx=(0, 10))
+        
+        # Open folder button
+        folder_btn = ttk.Button(
+            toolbar_frame,
+            text="Open Projects Folder",
+            command=self.open_projects_folder
+        )
+        folder_btn.pack(side=tk.LEFT, padx=(0, 10))
+        
+        # Change folder button
+        change_folder_btn = ttk.Button(
+            toolbar_frame,
+            text="Change Projects Folder",
+            command=self.change_projects_folder
+        )
+        change_folder_btn.pack(side=tk.LEFT, padx=(0, 10))
+        
+        # Projects roots button - more folders to find apps in
+        roots_btn = ttk.Button(
+            toolbar_frame,
+            text="Projects Roots",
+            command=self.open_roots_window
+        )
+        roots_btn.pack(side=tk.LEFT, padx=(0, 10))
+        
+        # Runs panel button
+        runs_btn = ttk.Button(
+            toolbar_frame,
+            text="Running Apps",
+            command=self.open_runs_window
+        )
+        runs_btn.pack(side=tk.LEFT, padx=(0, 10))
+        
+        # Run history button
+        history_btn = ttk.Button(
+            toolbar_frame,
+            text="Run History",
+            command=self.open_history_window
+        )
+        history_btn.pack(side=tk.LEFT, padx=(0, 10))
+        
+        # Watch toggle - updates cards automatically when project folders change
+        self.watch_var = tk.BooleanVar(value=self.config['watch_projects'])
+        watch_check = ttk.Checkbutton(
+            toolbar_frame,
+            text="Watch for changes",
+            variable=self.watch_var,
+            command=self.toggle_watcher
+        )
+        watch_check.pack(side=tk.LEFT)
+        
+        # App count label
+        self.app_count_label = ttk.Label(
+            toolbar_frame,
+            text="",
+            font=("Segoe UI", 10),
+            foreground=self.colors['text_light']
+        )
+        self.app_count_label.pack(side=tk.RIGHT)
+        
+        # Scrollable canvas for app cards
+        canvas_frame = ttk.Frame(main_container)
+        canvas_frame.pack(fill=tk.BOTH, expand=True, padx=30, pady=(0, 20))
+        
+        # Canvas and scrollbar
+        self.canvas = tk.Canvas(
+            canvas_frame,
+            bg='#f5f7fa',
+            highlightthickness=0
+        )
+        self.scrollbar = ttk.Scrollbar(canvas_frame, orient="vertical", command=self.canvas.yview)
+        
+        # Every view change goes through here so the visible cards can be re-bound
+        self.canvas.configure(yscrollcommand=self._on_canvas_scroll)
+        self.canvas.bind("<Configure>", lambda e: self.show_cards())
+        
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        # Mouse wheel scrolling
+        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
+        
+        # Status bar
+        status_frame = ttk.Frame(main_container)
+        status_frame.pack(fill=tk.X, side=tk.BOTTOM)
+        
+        self.status_var = tk.StringVar(value="Ready")
+        status_label = ttk.Label(
+            status_frame,
+            textvariable=self.status_var,
+            font=("Segoe UI", 9),
+            foreground=self.colors['text_light'],
+            padding=(30, 10)
+        )
+        status_label.pack(side=tk.LEFT)
+        
+        # uv version (or a warning when it is missing)
+        self.uv_label = ttk.Label(
+            status_frame,
+            text="Checking for uv...",
+            font=("Segoe UI", 9),
+            foreground=self.colors['text_light'],
+            padding=(30, 10)
+        )
+        self.uv_label.pack(side=tk.RIGHT)
+    
+    def _probe_uv(self):
+        """Locate uv (background thread) and report the result in the status bar"""
+        self.uv.probe()
+        self.root.after(0, self.show_uv_status)
+    
+    def show_uv_status(self):
+        """Show the cached uv version, or flag that uv is missing"""
+        if self.uv.path is None:
+            self.uv_label.config(
+                text="uv not found - install it with: pip install uv",
+                foreground=self.colors['danger']
+            )
+        else:
+            self.uv_label.config(text=self.uv.version, foreground=self.colors['text_light'])
+    
+    def _on_mousewheel(self, event):
+        """Handle mouse wheel scrolling"""
+        self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+    
+    def _on_canvas_scroll(self, first, last):
+        """Update the scrollbar and bind cards to whatever rows are now visible"""
+        self.scrollbar.set(first, last)
+        self.render_visible_cards()
+    
+    def enabled_roots(self):
+        """The enabled projects roots, in priority order"""
+        return [root for root in self.roots if root['enabled']]
+    
+    def root_tag(self, app_name):
+        """Name of the root an app comes from, shown on its card when several roots are enabled"""
+        root = self.app_roots.get(app_name)
+        if root is None or len(self.enabled_roots()) < 2:
+            return ""
+        return root['name']
+    
+    def merge_apps(self):
+        """Rebuild the app list from the per-root scan results"""
+        merged = merge_root_apps(self.enabled_roots(), self.root_apps)
+        self.apps = {name: app_info for name, (root, app_info) in merged.items()}
+        self.app_roots = {name: root for name, (root, app_info) in merged.items()}
+    
+    def scan_projects(self, roots=None):
+        """Scan the enabled roots (or just the given ones) in the background and display apps as
+        they are found; each root is scanned on its own thread, so a slow one holds up no other"""
+        if roots is None:
+            roots = self.enabled_roots()
+        else:
+            # Roots a cancelled scan did not finish are scanned again too
+            roots = [root for root in self.enabled_roots()
+                     if root in roots or str(root['path']) in self.scanning_roots]
+        self.cancel_scan()
+        
+        for root in roots:
+            self.root_apps[str(root['path'])] = {}
+        self.merge_apps()
+        
+        # Clear existing cards (the widgets are kept for reuse)
+        self.hide_empty_state()
+        self.show_cards()
+        
+        if not roots:
+            if not self.apps:
+                self.show_empty_state("No projects folder enabled")
+            return
+        
+        results = queue.Queue()
+        cancel_event = threading.Event()
+        self.scan_cancel_event = cancel_event
+        self.scanning_roots = {str(root['path']) for root in roots}
+        for root in roots:
+            self.root_errors.pop(str(root['path']), None)
+        self.refresh_roots_window()
+        scan_index = self.scan_index
+        max_depth = self.config['scan_max_depth']
+        
+        # Even checking that a root exists can hang on a network mount, so it happens here too
+        def scan_thread(root_key, projects_path):
+            try:
+                for event in scan_root(projects_path, scan_index, max_depth, cancel_event):
+                    results.put(event[:1] + (root_key,) + event[1:])
+                results.put(('root_done', root_key, None))
+            except FileNotFoundError:
+                results.put(('root_done', root_key, "folder not found"))
+            except Exception as e:
+                results.put(('root_done', root_key, e))
+        
+        self.refresh_btn.config(text="Cancel Scan", command=self.cancel_scan)
+        self.app_count_label.config(text="Scanning...")
+        self.status_var.set("Scanning projects folder..." if len(roots) == 1 else
+                            f"Scanning {len(roots)} projects folders...")
+        
+        for root in roots:
+            thread = threading.Thread(target=scan_thread, args=(str(root['path']), root['path']),
+                                      daemon=True)
+            thread.start()
+        
+        progress = {'scanned': 0, 'total': 0, 'errors': [], 'prewarmed': False}
+        self.root.after(SCAN_POLL_MS, lambda: self._poll_scan(results, cancel_event, progress))
+    
+    def _poll_scan(self, results, cancel_event, progress):
+        """Move a batch of background scan results into the UI"""
+        if cancel_event is not self.scan_cancel_event:
+            # A newer scan replaced this one
+            return
+        
+        found_apps = False
+        
+        for _ in range(SCAN_BATCH_SIZE):
+            try:
+                item = results.get_nowait()
+            except queue.Empty:
+                break
+            
+            kind, root_key = item[0], item[1]
+            root_apps = self.root_apps.setdefault(root_key, {})
+            if kind == 'total':
+                progress['total'] += item[2]
+            elif kind == 'app':
+                progress['scanned'] += 1
+                folder, app_info = item[2], item[3]
+                if app_info:
+                    root_apps[app_name(folder, Path(root_key))] = app_info
+                    found_apps = True
+            else:
+                self.scanning_roots.discard(root_key)
+                if item[2] is not None:
+                    progress['errors'].append(f"{root_key}: {item[2]}")
+                    self.root_errors[root_key] = str(item[2])
+                elif not cancel_event.is_set():
+                    self._root_scanned(root_key, progress)
+                self.refresh_roots_window()
+        
+        if found_apps:
+            self.merge_apps()
+            self.show_cards()
+        
+        if not self.scanning_roots:
+            self._finish_scan(cancel_event.is_set(), progress['errors'])
+            return
+        
+        if progress['total']:
+            self.app_count_label.config(text=f"{progress['scanned']} of {progress['total']} scanned")
+        
+        self.root.after(SCAN_POLL_MS, lambda: self._poll_scan(results, cancel_event, progress))
+    
+    def _root_scanned(self, root_key, progress):
+        """Start building environments for a root's apps as soon as that root is scanned"""
+        self.merge_apps()
+        apps = [(name, app_info) for name, app_info in self.apps.items()
+                if str(self.app_roots[name]['path']) == root_key]
+        # The first root of a scan drops what earlier scans queued
+        self.prewarm_envs(apps, replace=not progress['prewarmed'])
+        progress['prewarmed'] = True
+    
+    def _finish_scan(self, cancelled, errors):
+        """Restore the toolbar and show the final app count once a scan ends"""
+        self.scan_cancel_event = None
+        self.scanning_roots = set()
+        self.refresh_btn.config(text="Refresh Apps", command=self.scan_projects)
+        self.merge_apps()
+        self.show_cards()
+        
+        if errors and not self.apps:
+            self.show_empty_state("Could not scan projects folder:\n" + "\n".join(errors))
+            self.status_var.set("Ready")
+            return
+        
+        if not self.apps:
+            self.show_empty_state("Scan cancelled" if cancelled else "No apps found in projects folder")
+            self.status_var.set("Ready")
+            return
+        
+        self.update_app_count()
+        if errors:
+            self.status_var.set("Could not scan " + "; ".join(errors))
+        else:
+            self.status_var.set("Scan cancelled" if cancelled else "Ready")
+    
+    def update_app_count(self):
+        """Show how many apps are currently listed"""
+        count = len(self.apps)
+        self.app_count_label.config(
+            text=f"{count} app{'s' if count != 1 else ''} found"
+        )
+    
+    def cancel_scan(self):
+        """Stop the scan in progress, keeping the apps found so far"""
+        if self.scan_cancel_event is not None:
+            self.scan_cancel_event.set()
+    
+    def show_cards(self):
+        """Size the scroll region for every app and lay out the cards in view, in name order"""
+        if self.apps:
+            self.hide_empty_state()
+        
+        self.app_order = sorted(self.apps)
+        
+        # The scrollbar covers the full logical list, not just the cards that exist
+        rows = -(-len(self.app_order) // CARD_COLUMNS)
+        self.canvas.configure(
+            scrollregion=(0, 0, self.canvas.winfo_width(), rows * self.card_row_height)
+        )
+        self.render_visible_cards()
+    
+    def render_visible_cards(self):
+        """Bind card widgets to the apps in (or near) the viewport and park the rest"""
+        if not self.app_order:
+            wanted = range(0)
+        else:
+            top = self.canvas.canvasy(0)
+            bottom = top + self.canvas.winfo_height()
+            rows = -(-len(self.app_order) // CARD_COLUMNS)
+            first_row = max(0, int(top // self.card_row_height) - CARD_OVERSCAN_ROWS)
+            last_row = min(rows - 1, int(bottom // self.card_row_height) + CARD_OVERSCAN_ROWS)
+            wanted = range(first_row * CARD_COLUMNS,
+                           min(len(self.app_order), (last_row + 1) * CARD_COLUMNS))
+        
+        wanted_names = {self.app_order[index] for index in wanted}
+        
+        # Recycle cards that scrolled out of range (or whose app went away)
+        for app_name in list(self.cards):
+            if app_name not in wanted_names:
+                card = self.cards.pop(app_name)
+                self.canvas.coords(self.card_items[card], -10000, -10000)
+                self.card_pool.append(card)
+        
+        col_width = max(self.canvas.winfo_width(), 2 * CARD_PAD + 1) / CARD_COLUMNS
+        new_cards = False
+        
+        for index in wanted:
+            app_name = self.app_order[index]
+            app_info = self.apps[app_name]
+            card = self.cards.get(app_name)
+            
+            if card is None:
+                if self.card_pool:
+                    card = self.card_pool.pop()
+                    card.show_app(app_name, app_info)
+                else:
+                    card = AppCard(self.canvas, app_name, app_info, self)
+                    self.card_items[card] = self.canvas.create_window(0, 0, window=card, anchor="nw")
+                    new_cards = True
+                self.cards[app_name] = card
+            elif card.app_info is not app_info or card.root_tag != self.root_tag(app_name):
+                card.show_app(app_name, app_info)
+            
+            row, col = divmod(index, CARD_COLUMNS)
+            item = self.card_items[card]
+            self.canvas.coords(item, col * col_width + CARD_PAD, row * self.card_row_height + CARD_PAD)
+            self.canvas.itemconfigure(
+                item,
+                width=col_width - 2 * CARD_PAD,
+                height=self.card_row_height - 2 * CARD_PAD
+            )
+        
+        if new_cards:
+            self.root.after_idle(self._measure_cards)
+    
+    def _measure_cards(self):
+        """Grow the row height if a card needs more room than the grid gives it"""
+        if not self.cards:
+            return
+        
+        needed = max(card.winfo_reqheight() for card in self.cards.values()) + 2 * CARD_PAD
+        if needed > self.card_row_height:
+            self.card_row_height = needed
+            self.show_cards()
+    
+    def show_empty_state(self, message):
+        """Show empty state message"""
+        self.hide_empty_state()
+        
+        empty_frame = ttk.Frame(self.canvas, padding=50)
+        self.canvas.create_window(
+            max(self.canvas.winfo_width(), 1) // 2, 0,
+            window=empty_frame,
+            anchor="n",
+            tags="empty_state"
+        )
+        self.empty_frame = empty_frame
+        
+        empty_label = ttk.Label(
+            empty_frame,
+            text=message,
+            font=("Segoe UI", 12),
+            foreground=self.colors['text_light']
+        )
+        empty_label.pack()
+        
+        help_text = ttk.Label(
+            empty_frame,
+            text="\nAdd Python apps to the 'projects' folder\nEach app should be in its own subfolder",
+            font=("Segoe UI", 10),
+            foreground=self.colors['text_light'],
+            justify=tk.CENTER
+        )
+        help_text.pack(pady=10)
+        
+        self.app_count_label.config(text="0 apps found")
+    
+    def hide_empty_state(self):
+        """Remove the empty state message, if one is showing"""
+        if self.empty_frame is not None:
+            self.empty_frame.destroy()
+            self.canvas.delete("empty_state")
+            self.empty_frame = None
+    
+    def start_watcher(self):
+        """Watch the enabled roots so changed apps update without a full refresh"""
+        self.stop_watcher()
+        
+        if not self.config['watch_projects']:
+            return
+        
+        # Each watcher sets itself up on its own thread - walking a slow root blocks nothing else
+        for root in self.enabled_roots():
+            watcher = ProjectWatcher(root['path'], self._on_projects_changed,
+                                     max_depth=self.config['scan_max_depth'])
+            watcher.start()
+            self.watchers.append(watcher)
+    
+    def stop_watcher(self):
+        """Stop the projects folder watchers"""
+        for watcher in self.watchers:
+            watcher.stop()
+        self.watchers = []
+    
+    def toggle_watcher(self):
+        """Turn watch mode on or off and remember the choice"""
+        self.config['watch_projects'] = self.watch_var.get()
+        self.save_config()
+        
+        if self.config['watch_projects']:
+            self.start_watcher()
+            self.scan_projects()
+        else:
+            self.stop_watcher()
+    
+    def _on_projects_changed(self, folders):
+        """Re-analyze changed folders (on the watcher thread) and pass the results to the UI"""
+        results = []
+        missing = []
+        for folder in folders:
+            if folder.is_dir():
+                app_info = scan_folder(folder, self.scan_index)
+            else:
+                # A deleted or moved category takes the apps below it along
+                self.scan_index.remove(folder)
+                missing.append(folder)
+                app_info = None
+            results.append((folder, app_info))
+        
+        self.scan_index.save()
+        self.root.after(0, lambda: self.apply_project_changes(results, missing))
+    
+    def apply_project_changes(self, results, missing=()):
+        """Insert, update or remove only the cards whose folders changed
+        
+        missing are reported folders that no longer exist; every app below one is removed.
+        """
+        for folder in missing:
+            for root_apps in self.root_apps.values():
+                for name, app_info in list(root_apps.items()):
+                    if folder in app_info['folder'].parents:
+                        del root_apps[name]
+        
+        changed_folders = set()
+        for folder, app_info in results:
+            root = root_for(folder, self.enabled_roots())
+            if root is None:
+                # Left over from a root that was removed or disabled since
+                continue
+            
+            root_apps = self.root_apps.setdefault(str(root['path']), {})
+            name = app_name(folder, root['path'])
+            if app_info is None:
+                root_apps.pop(name, None)
+            else:
+                root_apps[name] = app_info
+                changed_folders.add(folder)
+        
+        self.merge_apps()
+        changed_apps = [(name, app_info) for name, app_info in self.apps.items()
+                        if app_info['folder'] in changed_folders]
+        
+        # Changed dependencies may have made the environment stale
+        self.prewarm_envs(changed_apps, replace=False)
+        
+        # Re-laying out keeps the canvas origin, so the scroll position is preserved
+        self.show_cards()
+        if not self.apps and self.empty_frame is None:
+            self.show_empty_state("No apps found in projects folder")
+        
+        if self.scan_cancel_event is None:
+            self.update_app_count()
+    
+    def prewarm_envs(self, apps, replace=True):
+        """Queue (app_name, app_info) pairs for background environment checks/builds"""
+        if self.config['prewarm_envs']:
+            self.prewarmer.enqueue(list(apps), replace=replace)
+    
+    def _on_env_state(self, app_name, state):
+        """Pass an environment state change (any thread) to the UI"""
+        self.root.after(0, lambda: self.set_env_state(app_name, state))
+    
+    def set_env_state(self, app_name, state):
+        """Remember an app's environment state and update its card if one is showing"""
+        self.env_states[app_name] = state
+        card = self.cards.get(app_name)
+        if card is not None:
+            card.show_env_state(state)
+    
+    def analyze_app(self, folder):
+        """Analyze a folder to determine if it's a valid Python app"""
+        return analyze_app(folder, self.scan_index.import_cache, self.scan_index.package_names)
+    
+    def run_app(self, app_name, app_info, force_install=False, upgrade=False):
+        """Run an app (force_install reinstalls dependencies even if the env looks current,
+        upgrade resolves them again and rewrites the app's lock file)"""
+        app_folder = app_info['folder']
+        
+        record = self.process_table.new_run(app_name, app_info)
+        self.set_run_phase(record, PHASE_QUEUED)
+        
+        def run_thread():
+            # Background environment builds wait while a user-started run sets up
+            self.prewarmer.pause()
+            paused = True
+            try:
+                # Only a few apps may be creating environments / installing at once
+                with self.process_table.start_slots:
+                    if record.stop_requested:
+                        self.set_run_phase(record, PHASE_STOPPED)
+                        return
+                    
+                    self.set_run_phase(record, PHASE_CHECKING_ENV)
+                    # Bad limits in the config stop the launch before any setup work
+                    run_limits = limits_for(self.config, app_name, app_info)
+                    venv_path = prepare_env(
+                        self.uv,
+                        app_info,
+                        force_install=force_install,
+                        on_phase=lambda phase: self.set_run_phase(record, phase),
+                        shared_envs_dir=self.shared_envs_dir(),
+                        wheelhouse=self.wheelhouse(),
+                        upgrade=upgrade
+                    )
+                    self._on_env_state(app_name, ENV_READY)
+                    
+                    if record.stop_requested:
+                        self.set_run_phase(record, PHASE_STOPPED)
+                        return
+                    
+                    # Run the app
+                    python_exe = venv_python(venv_path)
+                    if self.config['run_logs']:
+                        log_file = self.log_store.new_log_path(app_name, record.started, record.run_id)
+                    elif self.config['output_log_file']:
+                        log_file = app_folder / ".launcher_output.log"
+                    else:
+                        log_file = None
+                    
+                    limits = AppLimits(run_limits, f"launcher-{int(record.started * 1000)}-{record.run_id}")
+                    limits.prepare()
+                    if limits.cgroup_error:
+                        self.root.after(0, lambda: self.status_var.set(f"{app_name}: {limits.cgroup_error}"))
+                    
+                    # Output streams into the window while the app runs
+                    try:
+                        record.process = AppProcess(
+                            app_command(app_info, python_exe),
+                            app_folder,
+                            buffer_lines=self.config['output_buffer_lines'],
+                            log_file=log_file,
+                            popen_kwargs=limits.popen_kwargs(),
+                            env=app_info['env']
+                        ).start()
+                    except Exception:
+                        limits.finish(None)
+                        raise
+                    limits.start_timer(lambda: self.root.after(0, lambda: self.stop_run(record)))
+                    self.set_run_phase(record, PHASE_RUNNING)
+                
+                self.prewarmer.resume()
+                paused = False
+                self.root.after(0, lambda: self.show_run_output(record))
+                record.exit_code = record.process.wait()
+                record.limit = limits.finish(record.exit_code, record.process, stopped=record.stop_requested)
+                if self.config['run_logs']:
+                    record.log_file = self.store_run_log(log_file, app_folder)
+                
+                if record.limit is not None:
+                    self.set_run_phase(record, PHASE_LIMITED)
+                else:
+                    self.set_run_phase(record, PHASE_STOPPED if record.stop_requested else PHASE_EXITED)
+                
+            except UvNotFoundError:
+                record.error = "UV is not installed"
+                self.set_run_phase(record, PHASE_FAILED)
+                self.root.after(0, self.show_uv_status)
+                self.root.after(0, lambda: messagebox.showerror(
+                    "UV Not Found",
+                    "UV is not installed. Install it with:\n\npip install uv"
+                ))
+            except LimitsConfigError as e:
+                record.error = message = str(e)
+                self.set_run_phase(record, PHASE_FAILED)
+                self.root.after(0, lambda: messagebox.showerror("Config Error", message))
+            except subprocess.CalledProcessError as e:
+                record.error = message = f"Failed to run app:\n{str(e)}"
+                self.set_run_phase(record, PHASE_FAILED)
+                self.root.after(0, lambda: messagebox.showerror("Execution Error", message))
+            except Exception as e:
+                record.error = message = f"Unexpected error:\n{str(e)}"
+                self.set_run_phase(record, PHASE_FAILED)
+                self.root.after(0, lambda: messagebox.showerror("Error", message))
+            finally:
+                if paused:
+                    self.prewarmer.resume()
+        
+        thread = threading.Thread(target=run_thread, daemon=True)
+        thread.start()
+        return record
+    
+    def store_run_log(self, log_file, app_folder):
+        """Compress a finished run's log (copying it into the app folder first if asked to)"""
+        if self.config['output_log_file']:
+            try:
+                shutil.copyfile(log_file, app_folder / ".launcher_output.log")
+            except OSError:
+                pass
+        return self.log_store.finish(log_file)
+    
+    def shared_envs_dir(self):
+        """Return the shared environment cache, or None when apps use their own .venv"""
+        return shared_envs_dir_from_config(self.config, self.base_path)
+    
+    def wheelhouse(self, for_vendoring=False):
+        """Return the wheelhouse installs use, or None when they go to the package index"""
+        if not (for_vendoring or self.config['offline_installs']):
+            return None
+        return Wheelhouse(wheelhouse_dir_from_config(self.config, self.base_path),
+                          self.config['offline_network_fallback'])
+    
+    def vendor_dependencies(self, app_name, app_info):
+        """Fill the wheelhouse with everything an app installs (in the background)"""
+        wheelhouse = self.wheelhouse(for_vendoring=True)
+        self.status_var.set(f"Vendoring dependencies of {app_name}...")
+        
+        def vendor_thread():
+            try:
+                # The app's interpreter decides which wheels fit, so its environment must exist
+                venv_path = prepare_env(self.uv, app_info, shared_envs_dir=self.shared_envs_dir())
+                added, present = wheelhouse.vendor(self.uv, app_info, venv_python(venv_path))
+                message = (f"{len(added)} wheels added, {len(present)} already in the wheelhouse.\n\n"
+                           f"Location: {wheelhouse.path}")
+                if not self.config['offline_installs']:
+                    message += "\n\nTurn on 'offline_installs' in the settings to install from it."
+                self.root.after(0, lambda: self.status_var.set(f"Vendored dependencies of {app_name}"))
+                self.root.after(0, lambda: messagebox.showinfo("Dependencies Vendored", message))
+            except UvNotFoundError:
+                self.root.after(0, lambda: messagebox.showerror(
+                    "UV Not Found",
+                    "UV is not installed. Install it with:\n\npip install uv"
+                ))
+            except subprocess.CalledProcessError as e:
+                details = (e.stderr or b"").decode('utf-8', errors='replace').strip()[-2000:]
+                message = f"Failed to vendor dependencies:\n{e}\n\n{details}"
+                self.root.after(0, lambda: messagebox.showerror("Vendoring Error", message))
+            except Exception as e:
+                message = f"Unexpected error:\n{str(e)}"
+                self.root.after(0, lambda: messagebox.showerror("Error", message))
+        
+        thread = threading.Thread(target=vendor_thread, daemon=True)
+        thread.start()
+    
+    def build_bundle(self, app_name, app_info):
+        """Build a self-contained .pyz of an app (in the background)"""
+        wheelhouse = self.wheelhouse(for_vendoring=True)
+        find_links = wheelhouse.path if wheelhouse.path.is_dir() else None
+        self.status_var.set(f"Building bundle of {app_name}...")
+        
+        def bundle_thread():
+            try:
+                # Wheels are built for the app's interpreter, so its environment must exist
+                venv_path = prepare_env(self.uv, app_info, shared_envs_dir=self.shared_envs_dir())
+                path, pure, native = build_bundle(self.uv, app_info, venv_path, find_links)
+                message = (f"Bundle created: {path.name}\n\n"
+                           f"Send this one file to the user. It runs with:\n\npython {path.name}\n\n"
+                           f"{len(pure)} pure-Python packages run from inside the file")
+                if native:
+                    version = venv_python_version(venv_path) or "the same version"
+                    message += (f"; {len(native)} compiled packages are unpacked on first start "
+                                f"and need Python {'.'.join(version.split('.')[:2])} on this platform")
+                message += f".\n\nLocation: {path.parent}"
+                self.root.after(0, lambda: self.status_var.set(f"Built bundle of {app_name}"))
+                self.root.after(0, lambda: messagebox.showinfo("Bundle Created", message))
+            except UvNotFoundError:
+                self.root.after(0, lambda: messagebox.showerror(
+                    "UV Not Found",
+                    "UV is not installed. Install it with:\n\npip install uv"
+                ))
+            except subprocess.CalledProcessError as e:
+                details = (e.stderr or b"").decode('utf-8', errors='replace').strip()[-2000:]
+                message = f"Failed to build the bundle:\n{e}\n\n{details}"
+                self.root.after(0, lambda: messagebox.showerror("Bundle Error", message))
+            except Exception as e:
+                message = f"Unexpected error:\n{str(e)}"
+                self.root.after(0, lambda: messagebox.showerror("Error", message))
+        
+        thread = threading.Thread(target=bundle_thread, daemon=True)
+        thread.start()
+    
+    def set_run_phase(self, record, phase):
+        """Move a run to its next phase (any thread) and refresh the status bar"""
+        record.enter_phase(phase)
+        self.root.after(0, lambda: self.update_run_status(record))
+        
+        if phase not in ACTIVE_PHASES:
+            self.history.append(record.history_entry())
+            self.root.after(0, lambda: self.show_run_history(record.app_name))
+    
+    def update_run_status(self, record):
+        """Summarize the latest phase change and how many apps are active"""
+        starting, running = self.process_table.counts()
+        
+        if not starting and not running:
+            self.status_var.set(f"{record.app_name}: {record.phase} - Ready")
+            return
+        
+        summary = []
+        if running:
+            summary.append(f"{running} running")
+        if starting:
+            summary.append(f"{starting} starting")
+        self.status_var.set(f"{record.app_name}: {record.phase} ({', '.join(summary)})")
+    
+    def stop_run(self, record):
+        """Stop a run: SIGTERM now, SIGKILL if it outlives the stop timeout"""
+        record.stop(self.config['stop_timeout'])
+        self.status_var.set(f"Stopping {record.app_name}...")
+    
+    def restart_run(self, record):
+        """Stop a run and launch the same app again once it has exited"""
+        self.stop_run(record)
+        
+        def restart_thread():
+            while record.active:
+                time.sleep(0.1)
+            app_info = self.apps.get(record.app_name, record.app_info)
+            self.root.after(0, lambda: self.run_app(record.app_name, app_info))
+        
+        thread = threading.Thread(target=restart_thread, daemon=True)
+        thread.start()
+    
+    def open_runs_window(self):
+        """Show the runs panel (or bring it to the front)"""
+        if self.runs_window is not None and self.runs_window.winfo_exists():
+            self.runs_window.lift()
+            return
+        self.runs_window = RunsWindow(self)
+    
+    def open_history_window(self):
+        """Show the run history (or bring it to the front)"""
+        if self.history_window is not None and self.history_window.winfo_exists():
+            self.history_window.lift()
+            return
+        self.history_window = HistoryWindow(self)
+    
+    def show_run_history(self, app_name):
+        """Refresh the latency shown for an app after one of its runs finished"""
+        card = self.cards.get(app_name)
+        if card is not None:
+            card.show_latency()
+        if self.history_window is not None and self.history_window.winfo_exists():
+            self.history_window.refresh()
+    
+    def show_run_output(self, record):
+        """Open the output of a run from this session - paged from its log when it has one"""
+        if record.log_file is None and record.process.log_file is None:
+            return OutputDialog(self, record.app_name, record.process, record=record)
+        return LogViewer(self, record.app_name, record=record)
+    
+    def show_past_run(self, app_name, entry):
+        """Open the stored output of a finished run"""
+        return LogViewer(self, app_name, log_entry=entry)
+    
+    def create_launcher(self, app_name, app_info):
+        """Create launcher scripts for an app"""
+        app_folder = app_info['folder']
+        
+        try:
+            write_launcher_scripts(app_name, app_info, self.wheelhouse())
+            
+            messagebox.showinfo(
+                "Success",
+                f"Launcher scripts created! (\\*.bat or \\*.sh)\n\n"
+                f"To Distribute, copy entire folder and send to the user. -May need Python installed on their machine.\n"
+                f"(More > Build Bundle makes a single file instead.)\n\n"
+                f"Mac/Linux: run.sh\nWindows: run.bat\n\nLocation: {app_folder}"
+            )
+            
+            self.status_var.set("Launcher scripts created")
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to create scripts:\n{str(e)}")
+    
+    def load_projects_path(self):
+        """The projects folder - the first projects root"""
+        return self.roots[0]['path']
+    
+    def save_projects_path(self, path):
+        """Make path the projects folder (the first root), keeping any other roots"""
+        roots = [dict(root) for root in self.roots]
+        roots[0] = {'path': Path(path), 'enabled': True, 'name': Path(path).name}
+        self.save_project_roots(roots)
+    
+    def save_project_roots(self, roots):
+        """Store the projects roots in the config file"""
+        self.config['projects_path'] = str(roots[0]['path'])
+        if len(roots) > 1 or self.config['projects_roots']:
+            self.config['projects_roots'] = project_roots_config(roots)
+        self.save_config()
+        self.roots = project_roots_from_config(self.config, self.base_path)
+        self.projects_path = self.load_projects_path()
+    
+    def set_project_roots(self, roots, rescan=()):
+        """Save a changed list of projects roots, then rescan the ones whose paths are in rescan
+        (the other roots keep their apps) and update the cards and watchers"""
+        self.save_project_roots(roots)
+        rescan = [root for root in self.enabled_roots() if root['path'] in rescan]
+        
+        if rescan:
+            self.scan_projects(rescan)
+        else:
+            self.merge_apps()
+            self.show_cards()
+            if not self.apps and self.empty_frame is None:
+                self.show_empty_state("No apps found in projects folder")
+            if self.scan_cancel_event is None:
+                self.update_app_count()
+        self.start_watcher()
+        
+        self.refresh_roots_window()
+    
+    def refresh_roots_window(self):
+        """Update the projects roots window, if it is open"""
+        if self.roots_window is not None and self.roots_window.winfo_exists():
+            self.roots_window.refresh()
+    
+    def open_roots_window(self):
+        """Show the projects roots (or bring them to the front)"""
+        if self.roots_window is not None and self.roots_window.winfo_exists():
+            self.roots_window.lift()
+            return
+        self.roots_window = ProjectRootsWindow(self)
+    
+    def save_config(self):
+        """Save all launcher settings to config file"""
+        try:
+            save_config(self.config_file, self.config)
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not save configuration:\n{str(e)}")
+    
+    def change_projects_folder(self):
+        """Allow user to select a different projects folder"""
+        new_path = filedialog.askdirectory(
+            title="Select Projects Folder",
+            initialdir=self.projects_path,
+            mustexist=True
+        )
+        
+        if new_path:
+            new_path = Path(new_path)
+            self.save_projects_path(new_path)
+            self.status_var.set(f"Projects folder changed to: {new_path}")
+            # The other roots keep their apps
+            self.scan_projects([self.roots[0]])
+            self.start_watcher()
+            
+            messagebox.showinfo(
+                "Folder Changed",
+                f"Projects folder is now:\n{new_path}\n\nThe launcher will remember this location."
+            )
+    
+    def open_projects_folder(self):
+        """Open the projects folder"""
+        import platform
+        system = platform.system()
+        
+        try:
+            if system == "Windows":
+                subprocess.run(["explorer", str(self.projects_path)])
+            elif system == "Darwin":
+                subprocess.run(["open", str(self.projects_path)])
+            else:
+                subprocess.run(["xdg-open", str(self.projects_path)])
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not open folder:\n{str(e)}")
+
+
+def main(base_path=None):
+    """GUI entry point"""
+    root = tk.Tk()
+    app = ModernLauncher(root, base_path)
+    root.mainloop()
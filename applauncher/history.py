@@ -0,0 +1,111 @@
+"""
+Run history - one JSON line per finished launch in .launcher_history.jsonl,
+with per-phase timings, so slow apps and slow phases can be found later
+"""
+
+import json
+import math
+import os
+import threading
+from pathlib import Path
+
+
+# Older entries are dropped when the file is loaded with more than this many
+HISTORY_MAX_ENTRIES = 5000
+
+# Launches per app that the latency percentiles are computed over
+LATENCY_WINDOW = 100
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+class RunHistory:
+    """Append-only log of finished runs, with the entries also kept in memory by app"""
+    
+    def __init__(self, history_file):
+        self.history_file = Path(history_file)
+        self.entries = []
+        # The same entries grouped by app, oldest first, so cards can look theirs up cheaply
+        self.by_app = {}
+        self.lock = threading.Lock()
+    
+    def load(self):
+        """Read the history file, skipping damaged lines and trimming it if it grew too long"""
+        entries = []
+        
+        try:
+            with open(self.history_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    if isinstance(entry, dict) and 'app' in entry:
+                        entries.append(entry)
+        except OSError:
+            pass
+        
+        if len(entries) > HISTORY_MAX_ENTRIES:
+            entries = entries[-HISTORY_MAX_ENTRIES:]
+            self._rewrite(entries)
+        
+        by_app = {}
+        for entry in entries:
+            by_app.setdefault(entry['app'], []).append(entry)
+        
+        with self.lock:
+            self.entries = entries
+            self.by_app = by_app
+    
+    def _rewrite(self, entries):
+        """Replace the file with the given entries"""
+        tmp_file = self.history_file.with_name(self.history_file.name + ".tmp")
+        
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                for entry in entries:
+                    f.write(json.dumps(entry) + "\n")
+            os.replace(tmp_file, self.history_file)
+        except OSError:
+            pass
+    
+    def append(self, entry):
+        """Record a finished run (a failed write only loses the file copy)"""
+        with self.lock:
+            self.entries.append(entry)
+            self.by_app.setdefault(entry['app'], []).append(entry)
+            try:
+                with open(self.history_file, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(entry) + "\n")
+            except OSError:
+                pass
+    
+    def runs_for(self, app_name):
+        """All recorded runs of an app, newest first"""
+        with self.lock:
+            return list(reversed(self.by_app.get(app_name, [])))
+    
+    def apps(self):
+        """Names of every app with recorded runs, sorted"""
+        with self.lock:
+            return sorted(self.by_app)
+    
+    def latency_stats(self, app_name):
+        """Return (launches, p50, p95) launch latency in seconds over the app's recent launches
+        
+        Latency is the time from Run until the app process started; runs that never
+        got that far are not counted. Returns None when there are no such runs.
+        """
+        latencies = [
+            entry['launch_seconds'] for entry in self.runs_for(app_name)
+            if entry.get('launch_seconds') is not None
+        ][:LATENCY_WINDOW]
+        
+        if not latencies:
+            return None
+        return len(latencies), percentile(latencies, 0.5), percentile(latencies, 0.95)
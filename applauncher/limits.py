@@ -0,0 +1,246 @@
+"""
+Resource limits for launched apps - wall-clock timeout, memory and CPU time
+caps and nice level, optionally enforced through a cgroup v2 scope, with the
+defaults in the launcher config and overrides per app
+"""
+
+import os
+import signal
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+from applauncher.config import DEFAULT_LIMITS, limits_error
+
+try:
+    import resource
+except ImportError:
+    # Windows - only the timeout and priority apply there
+    resource = None
+
+
+# Seconds between the CPU time soft limit (SIGXCPU) and the hard limit (SIGKILL)
+CPU_KILL_GRACE = 5
+
+# Trailing output lines searched for a MemoryError after the app fails
+MEMORY_ERROR_TAIL_LINES = 50
+
+
+class LimitsConfigError(Exception):
+    """Raised when the launcher config holds limits that cannot be used"""
+
+
+def limits_for(config, app_name, app_info=None):
+    """The limits for one app: the defaults, then config 'limits', then the app's
+    manifest, then its 'app_limits' entry (local settings win over what the app ships)
+    
+    Raises LimitsConfigError when the config's limits are not valid (manifests are
+    checked the same way when they are loaded).
+    """
+    config_limits = config.get('limits') or {}
+    app_limits = config.get('app_limits') or {}
+    if not isinstance(app_limits, dict):
+        raise LimitsConfigError("Launcher config: app_limits must be a table")
+    own_limits = app_limits.get(app_name) or {}
+    
+    for name, table in (('limits', config_limits), (f'app_limits.{app_name}', own_limits)):
+        error = limits_error(table, name)
+        if error is not None:
+            raise LimitsConfigError(f"Launcher config: {error}")
+    
+    limits = dict(DEFAULT_LIMITS)
+    limits.update(config_limits)
+    if app_info is not None:
+        limits.update(app_info['limits'])
+    limits.update(own_limits)
+    return limits
+
+
+def cgroup2_mount():
+    """Where the cgroup v2 hierarchy is mounted, or None"""
+    try:
+        with open("/proc/self/mounts", 'r') as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) > 2 and fields[2] == "cgroup2":
+                    return Path(fields[1])
+    except OSError:
+        pass
+    return None
+
+
+def current_cgroup():
+    """The launcher's own cgroup v2 directory, or None"""
+    mount = cgroup2_mount()
+    if mount is None:
+        return None
+    
+    try:
+        with open("/proc/self/cgroup", 'r') as f:
+            for line in f:
+                if line.startswith("0::"):
+                    path = mount / line[3:].strip().lstrip("/")
+                    return path if (path / "cgroup.controllers").exists() else None
+    except OSError:
+        pass
+    return None
+
+
+class CgroupScope:
+    """A child cgroup the app runs in, capping the memory of the app and everything it starts"""
+    
+    def __init__(self, path):
+        self.path = path
+        # A plain string, so the child between fork and exec does as little as possible
+        self.procs_file = str(path / "cgroup.procs")
+    
+    @classmethod
+    def create(cls, name, memory_bytes):
+        """Create the scope under the launcher's cgroup; raises OSError when that is not allowed"""
+        parent = current_cgroup()
+        if parent is None:
+            raise OSError("no cgroup v2 hierarchy")
+        
+        subtree_control = parent / "cgroup.subtree_control"
+        if "memory" not in subtree_control.read_text().split():
+            # Fails unless the launcher's cgroup is delegated to it and holds no processes itself
+            subtree_control.write_text("+memory")
+        
+        path = parent / name
+        path.mkdir()
+        try:
+            (path / "memory.max").write_text(str(memory_bytes))
+            swap_max = path / "memory.swap.max"
+            if swap_max.exists():
+                swap_max.write_text("0")
+        except OSError:
+            path.rmdir()
+            raise
+        return cls(path)
+    
+    def enter(self):
+        """Move the calling process into the scope (runs in the child before exec)"""
+        fd = os.open(self.procs_file, os.O_WRONLY)
+        try:
+            os.write(fd, b"0")
+        finally:
+            os.close(fd)
+    
+    def oom_killed(self):
+        """True if the kernel killed a process in the scope for going over memory.max"""
+        try:
+            for line in (self.path / "memory.events").read_text().splitlines():
+                key, _, value = line.partition(" ")
+                if key == "oom_kill":
+                    return int(value) > 0
+        except (OSError, ValueError):
+            pass
+        return False
+    
+    def remove(self):
+        """Delete the scope (left behind if something the app started is still in it)"""
+        try:
+            self.path.rmdir()
+        except OSError:
+            pass
+
+
+class AppLimits:
+    """The limits of one launch: applies them to the app and works out which one ended it"""
+    
+    def __init__(self, limits, scope_name):
+        self.timeout = float(limits.get('timeout_seconds') or 0)
+        self.memory_mb = int(limits.get('memory_mb') or 0)
+        self.cpu_seconds = int(limits.get('cpu_seconds') or 0)
+        self.nice = int(limits.get('nice') or 0)
+        self.use_cgroup = bool(limits.get('cgroup'))
+        self.scope_name = scope_name
+        
+        self.cgroup = None
+        # Why the cgroup could not be used (memory_mb then falls back to an address space limit)
+        self.cgroup_error = None
+        self.timer = None
+        self.timed_out = False
+    
+    def prepare(self):
+        """Create the cgroup scope, if one was asked for, before the app starts"""
+        if not (self.use_cgroup and self.memory_mb) or sys.platform == 'win32':
+            return
+        try:
+            self.cgroup = CgroupScope.create(self.scope_name, self.memory_mb * 1024 * 1024)
+        except OSError as e:
+            self.cgroup_error = f"cgroup unavailable ({e}), using an address space limit"
+    
+    def popen_kwargs(self):
+        """subprocess arguments that apply the memory, CPU and priority limits"""
+        if sys.platform == 'win32':
+            if self.nice > 0:
+                return {'creationflags': subprocess.BELOW_NORMAL_PRIORITY_CLASS}
+            return {}
+        
+        if not (self.cgroup or self.memory_mb or self.cpu_seconds or self.nice):
+            return {}
+        return {'preexec_fn': self._apply}
+    
+    def _apply(self):
+        """Runs in the child between fork and exec"""
+        if self.cgroup is not None:
+            self.cgroup.enter()
+        elif self.memory_mb:
+            memory_bytes = self.memory_mb * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (memory_bytes, memory_bytes))
+        
+        if self.cpu_seconds:
+            resource.setrlimit(resource.RLIMIT_CPU,
+                               (self.cpu_seconds, self.cpu_seconds + CPU_KILL_GRACE))
+        if self.nice:
+            os.nice(self.nice)
+    
+    def start_timer(self, on_timeout):
+        """Call on_timeout once the app has run for the wall-clock timeout"""
+        if self.timeout <= 0:
+            return
+        
+        def expire():
+            self.timed_out = True
+            on_timeout()
+        
+        self.timer = threading.Timer(self.timeout, expire)
+        self.timer.daemon = True
+        self.timer.start()
+    
+    def finish(self, return_code, process=None, stopped=False):
+        """Clean up after the app exits; returns a description of the limit that ended it, or None
+        
+        process is the AppProcess, whose last lines are searched for a MemoryError.
+        stopped means the user stopped the run, so a kill signal is not blamed on a limit.
+        """
+        if self.timer is not None:
+            self.timer.cancel()
+        
+        violation = None
+        if self.timed_out:
+            violation = f"Wall-clock timeout ({self.timeout:g} s) exceeded"
+        elif self.cgroup is not None and self.cgroup.oom_killed():
+            violation = f"Memory limit ({self.memory_mb} MB) exceeded"
+        elif not stopped and return_code:
+            violation = self._signal_violation(return_code, process)
+        
+        if self.cgroup is not None:
+            self.cgroup.remove()
+        return violation
+    
+    def _signal_violation(self, return_code, process):
+        """The limit behind a failed exit, judged from the signal or the app's last output"""
+        # Only SIGXCPU is the CPU limit's own signal - a SIGKILL may come from anyone
+        # (the OOM killer, another user), so it is not blamed on a limit
+        if self.cpu_seconds and sys.platform != 'win32':
+            if return_code == -signal.SIGXCPU:
+                return f"CPU time limit ({self.cpu_seconds} s) exceeded"
+        
+        if self.memory_mb and self.cgroup is None and process is not None:
+            lines, _, _ = process.lines_since(max(0, process.line_count - MEMORY_ERROR_TAIL_LINES))
+            if any("MemoryError" in line for _, line in lines):
+                return f"Memory limit ({self.memory_mb} MB) exceeded"
+        return None
@@ -0,0 +1,437 @@
+"""
+Run logs - every run's output is written to a per-app log directory, compressed
+once the run ends, and evicted by age and total size (least recently used first).
+LogPager gives viewers paged access to a log without reading all of it.
+"""
+
+import array
+import gzip
+import itertools
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+
+# A live run writes plain text; finished runs are stored gzip-compressed
+LOG_SUFFIX = ".log"
+COMPRESSED_SUFFIX = ".log.gz"
+
+# stderr lines are stored with this prefix so viewers can tell the streams apart
+STDERR_PREFIX = "[stderr] "
+
+
+def safe_dir_name(app_name):
+    """App name usable as a directory name on every platform"""
+    name = "".join(c if c.isalnum() or c in "-_. " else "_" for c in app_name).strip(". ")
+    return name or "_"
+
+
+def split_stream(line):
+    """Return (stream, text) for a line read back from a log"""
+    if line.startswith(STDERR_PREFIX):
+        return 'stderr', line[len(STDERR_PREFIX):]
+    return 'stdout', line
+
+
+class RunLogStore:
+    """Per-app directories of run logs with a size and age limit"""
+    
+    def __init__(self, logs_dir, max_bytes, max_age_days):
+        self.logs_dir = Path(logs_dir)
+        self.max_bytes = max_bytes
+        self.max_age = max_age_days * 24 * 3600
+        # Only one retention pass at a time
+        self.lock = threading.Lock()
+    
+    def new_log_path(self, app_name, started, run_id):
+        """Path a new run should write its output to"""
+        app_dir = self.logs_dir / safe_dir_name(app_name)
+        app_dir.mkdir(parents=True, exist_ok=True)
+        
+        stem = time.strftime("%Y%m%d-%H%M%S", time.localtime(started)) + f"-{run_id}"
+        path = app_dir / (stem + LOG_SUFFIX)
+        counter = 1
+        while path.exists() or path.with_name(path.name[:-len(LOG_SUFFIX)] + COMPRESSED_SUFFIX).exists():
+            path = app_dir / f"{stem}-{counter}{LOG_SUFFIX}"
+            counter += 1
+        return path
+    
+    def finish(self, log_path):
+        """Compress a finished run's log and apply the retention policy; returns the stored path"""
+        stored = log_path.with_name(log_path.name[:-len(LOG_SUFFIX)] + COMPRESSED_SUFFIX)
+        tmp_file = stored.with_name(stored.name + ".tmp")
+        
+        try:
+            with open(log_path, 'rb') as src, gzip.open(tmp_file, 'wb', compresslevel=6) as dst:
+                shutil.copyfileobj(src, dst, 1024 * 1024)
+            os.replace(tmp_file, stored)
+        except OSError:
+            # Keep the uncompressed log rather than lose it
+            self._delete(tmp_file)
+            return log_path
+        
+        # Fails on Windows while a viewer has it open - the age limit removes it later
+        self._delete(log_path)
+        
+        self.enforce_retention()
+        return stored
+    
+    def touch(self, path):
+        """Mark a stored log as recently used, so eviction takes it last"""
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+    
+    def stored_logs(self):
+        """Return (path, size, last_used) for every stored log (and any live or orphaned one)"""
+        logs = []
+        
+        try:
+            app_dirs = list(os.scandir(self.logs_dir))
+        except OSError:
+            return logs
+        
+        for app_dir in app_dirs:
+            if not app_dir.is_dir():
+                continue
+            try:
+                with os.scandir(app_dir.path) as entries:
+                    for entry in entries:
+                        if not entry.name.endswith((COMPRESSED_SUFFIX, LOG_SUFFIX)):
+                            continue
+                        try:
+                            stat = entry.stat()
+                        except OSError:
+                            continue
+                        logs.append((Path(entry.path), stat.st_size, stat.st_mtime))
+            except OSError:
+                continue
+        
+        return logs
+    
+    def enforce_retention(self):
+        """Delete logs unused for max_age, then the least recently used until under max_bytes"""
+        with self.lock:
+            logs = self.stored_logs()
+            cutoff = time.time() - self.max_age
+            keep = []
+            
+            for path, size, last_used in logs:
+                if self.max_age > 0 and last_used < cutoff:
+                    self._delete(path)
+                elif path.name.endswith(LOG_SUFFIX):
+                    # Possibly still being written - only the age limit applies
+                    continue
+                else:
+                    keep.append((last_used, size, path))
+            
+            if self.max_bytes <= 0:
+                return
+            
+            total = sum(size for _, size, _ in keep)
+            for last_used, size, path in sorted(keep):
+                if total <= self.max_bytes:
+                    break
+                self._delete(path)
+                total -= size
+    
+    def _delete(self, path):
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+# Lines between the saved offsets of a LogPager index (lines in between are found by scanning)
+INDEX_STRIDE = 64
+
+# Bytes read per step while indexing or searching
+CHUNK_SIZE = 1024 * 1024
+
+# Longest part of a single line a pager hands to the viewer
+MAX_DISPLAY_CHARS = 4000
+
+# Lines that "jump to error" stops at
+ERROR_PATTERN = re.compile(
+    rb'^(?:\[stderr\] )?(?:Traceback \(most recent call last\)'
+    rb'|[\w.]*(?:Error|Exception)\b'
+    rb'|.*\b(?:ERROR|CRITICAL|FATAL)\b)',
+    re.MULTILINE
+)
+
+
+class TextPattern:
+    """Case-insensitive plain-text search, with the same finditer() as a compiled bytes regex
+    
+    Lower-casing a chunk and using bytes.find is several times faster than re.IGNORECASE.
+    """
+    
+    def __init__(self, text):
+        self.needle = text.encode('utf-8').lower()
+    
+    def finditer(self, data):
+        if not self.needle:
+            return
+        lowered = data.lower()
+        pos = lowered.find(self.needle)
+        while pos >= 0:
+            yield TextMatch(pos)
+            pos = lowered.find(self.needle, pos + 1)
+
+
+class TextMatch:
+    """Where a TextPattern matched"""
+    
+    def __init__(self, pos):
+        self.pos = pos
+    
+    def start(self):
+        return self.pos
+
+
+class LogPager:
+    """Random access to the lines of a (possibly huge or still growing) log file
+    
+    A background thread records the byte offset of every INDEX_STRIDE-th line, so
+    memory stays small and the first page can be shown before indexing finishes.
+    Compressed logs are first expanded into a temporary file by the same thread.
+    """
+    
+    def __init__(self, path, growing=False):
+        self.path = Path(path)
+        self.compressed = self.path.name.endswith(COMPRESSED_SUFFIX)
+        self.temp_file = None
+        
+        if self.compressed:
+            fd, temp_name = tempfile.mkstemp(prefix="launcher-log-", suffix=LOG_SUFFIX)
+            os.close(fd)
+            self.temp_file = Path(temp_name)
+            self.source = gzip.open(self.path, 'rb')
+            self.data_path = self.temp_file
+        else:
+            self.source = None
+            self.data_path = self.path
+        
+        # Opened now so the log stays readable even if it is compressed and removed later
+        self.index_handle = open(self.data_path, 'rb')
+        self.read_handle = open(self.data_path, 'rb')
+        self.search_handle = open(self.data_path, 'rb')
+        self.search_lock = threading.Lock()
+        
+        self.offsets = array.array('q', [0])
+        self.line_count = 0
+        # End of the last indexed line, and how far the indexer has looked past it
+        self.indexed_to = 0
+        self.scan_pos = 0
+        self.lock = threading.Lock()
+        
+        self.growing = threading.Event()
+        if growing:
+            self.growing.set()
+        self.done = threading.Event()
+        self.closed = False
+        self.thread = None
+    
+    def start(self):
+        """Start indexing in the background"""
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        return self
+    
+    def stop_growing(self):
+        """The writer is finished - index what is left and stop"""
+        self.growing.clear()
+    
+    def close(self):
+        """Release the file handles and any temporary copy"""
+        self.closed = True
+        self.growing.clear()
+        if self.thread is not None:
+            self.thread.join(timeout=2)
+        
+        with self.lock:
+            for handle in (self.index_handle, self.read_handle, self.search_handle, self.source):
+                if handle is not None:
+                    handle.close()
+        
+        if self.temp_file is not None:
+            try:
+                self.temp_file.unlink()
+            except OSError:
+                pass
+    
+    def _run(self):
+        try:
+            if self.compressed:
+                self._expand()
+            else:
+                while not self.closed:
+                    if not self._index_available() and not self.growing.is_set():
+                        break
+                    if self.growing.is_set():
+                        time.sleep(0.1)
+            self._index_available(final=True)
+        except (OSError, ValueError, EOFError):
+            # Unreadable or truncated - show what was indexed
+            pass
+        finally:
+            self.done.set()
+    
+    def _expand(self):
+        """Decompress into the temporary file, indexing as each chunk lands"""
+        with open(self.temp_file, 'ab') as out:
+            while not self.closed:
+                chunk = self.source.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                out.write(chunk)
+                out.flush()
+                self._index_available()
+    
+    def _index_available(self, final=False):
+        """Index the complete lines written since the last call; returns True if any were found
+        
+        With final, a last line without a newline is counted too.
+        """
+        found = False
+        
+        while not self.closed:
+            self.index_handle.seek(self.scan_pos)
+            data = self.index_handle.read(CHUNK_SIZE)
+            
+            if not data:
+                if final and self.scan_pos > self.indexed_to:
+                    self._add_lines([self.scan_pos - self.indexed_to], self.indexed_to)
+                    self.scan_pos = self.indexed_to
+                    found = True
+                return found
+            
+            end = data.rfind(b'\n') + 1
+            if end == 0:
+                # The middle of a line longer than a chunk
+                self.scan_pos += len(data)
+                continue
+            
+            lengths = list(map(len, data[:end - 1].split(b'\n')))
+            # The first line may have started in an earlier chunk
+            lengths[0] += self.scan_pos - self.indexed_to
+            self._add_lines(lengths, self.indexed_to)
+            self.scan_pos = self.indexed_to
+            found = True
+        
+        return found
+    
+    def _add_lines(self, lengths, base):
+        """Record lines of the given lengths (without newlines) starting at byte offset base"""
+        cumulative = list(itertools.accumulate(lengths))
+        
+        with self.lock:
+            first = (-self.line_count) % INDEX_STRIDE
+            for i in range(first, len(lengths), INDEX_STRIDE):
+                if self.line_count + i == 0:
+                    continue
+                self.offsets.append(base + (cumulative[i - 1] if i else 0) + i)
+            self.line_count += len(lengths)
+            self.indexed_to = base + cumulative[-1] + len(lengths)
+    
+    @property
+    def indexing(self):
+        return not self.done.is_set()
+    
+    def _line_offset(self, handle, line):
+        """Byte offset where a line starts, scanning forward from the nearest saved offset"""
+        with self.lock:
+            offset = self.offsets[min(line // INDEX_STRIDE, len(self.offsets) - 1)]
+            skip = line - (line // INDEX_STRIDE) * INDEX_STRIDE
+        
+        handle.seek(offset)
+        while skip > 0:
+            data = handle.read(64 * 1024)
+            if not data:
+                break
+            pos = 0
+            while skip > 0:
+                newline = data.find(b'\n', pos)
+                if newline < 0:
+                    break
+                pos = newline + 1
+                skip -= 1
+            if skip == 0:
+                return offset + pos
+            offset += len(data)
+        return offset
+    
+    def read_lines(self, first, count):
+        """Return up to count lines starting at line number first, as newline-terminated text"""
+        lines = []
+        
+        with self.lock:
+            if self.closed:
+                return lines
+            count = max(0, min(count, self.line_count - first))
+        
+        handle = self.read_handle
+        handle.seek(self._line_offset(handle, first))
+        
+        for _ in range(count):
+            data = handle.readline(MAX_DISPLAY_CHARS)
+            if not data:
+                break
+            if len(data) == MAX_DISPLAY_CHARS and not data.endswith(b'\n'):
+                # Skip the rest of an overlong line
+                rest = data
+                while rest and not rest.endswith(b'\n'):
+                    rest = handle.readline(CHUNK_SIZE)
+                data += b" [...]\n"
+            elif not data.endswith(b'\n'):
+                data += b"\n"
+            lines.append(data.decode('utf-8', errors='replace'))
+        
+        return lines
+    
+    def find(self, pattern, start_line, end_line=None, cancel_event=None, last=False):
+        """Line number of the first (or last) match of a bytes pattern in [start_line, end_line)
+        
+        Returns None if nothing matches. Runs on the caller's thread; searches take turns.
+        """
+        with self.lock:
+            stop = self.indexed_to if end_line is None or end_line >= self.line_count else None
+        
+        result = None
+        with self.search_lock:
+            handle = self.search_handle
+            if self.closed:
+                return None
+            offset = self._line_offset(handle, start_line)
+            if stop is None:
+                stop = self._line_offset(handle, end_line)
+            line = start_line
+            
+            while offset < stop:
+                if cancel_event is not None and cancel_event.is_set():
+                    return None
+                
+                handle.seek(offset)
+                data = handle.read(min(CHUNK_SIZE, stop - offset))
+                if not data:
+                    break
+                
+                # Search whole lines only, so matches never straddle chunks
+                end = data.rfind(b'\n') + 1
+                if end > 0 and offset + len(data) < stop:
+                    data = data[:end]
+                
+                for match in pattern.finditer(data):
+                    result = line + data.count(b'\n', 0, match.start())
+                    if not last:
+                        return result
+                
+                line += data.count(b'\n')
+                offset += len(data)
+        
+        return result
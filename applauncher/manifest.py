@@ -0,0 +1,278 @@
+"""
+App manifests - an optional launcher.toml (or a [tool.launcher] table in the
+app's pyproject.toml) that says how the app runs, so discovery never has to
+open its source files to guess
+    
+    entry = "main.py"
+    args = ["--port", "8080"]
+    python = "3.11"
+    dependencies = ["requests>=2.31"]
+    
+    [env]
+    APP_MODE = "demo"
+    
+    [limits]
+    timeout_seconds = 600
+"""
+
+import ast
+import importlib.util
+import sys
+
+from applauncher.config import limits_error
+
+
+MANIFEST_NAME = "launcher.toml"
+PYPROJECT_NAME = "pyproject.toml"
+
+# Files whose changes can change a manifest (part of the scan fingerprint)
+MANIFEST_FILES = (MANIFEST_NAME, PYPROJECT_NAME)
+
+# Table inside pyproject.toml that holds the manifest
+PYPROJECT_TABLE = "tool.launcher"
+
+
+# tomllib (or tomli before Python 3.11), imported the first time a manifest is
+# parsed since most apps have none; False until then
+_tomllib = False
+
+
+class ManifestError(Exception):
+    """Raised when an app has a manifest that cannot be used"""
+
+
+def toml_module():
+    """tomllib or tomli, or None when neither is available"""
+    global _tomllib
+    if _tomllib is False:
+        try:
+            import tomllib
+        except ImportError:
+            try:
+                import tomli as tomllib
+            except ImportError:
+                # Python < 3.11 without tomli - parse_simple_toml covers what manifests use
+                tomllib = None
+        _tomllib = tomllib
+    return _tomllib
+
+
+def toml_parser_name():
+    """Which parser manifests are read with ("tomllib", "tomli" or "simple"), without importing it"""
+    if _tomllib is not False:
+        return "simple" if _tomllib is None else _tomllib.__name__
+    if sys.version_info >= (3, 11):
+        return "tomllib"
+    return "tomli" if importlib.util.find_spec("tomli") is not None else "simple"
+
+
+def _strip_comment(line):
+    """line without a trailing # comment (a # inside a string is kept)"""
+    quote = None
+    for index, char in enumerate(line):
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in ('"', "'"):
+            quote = char
+        elif char == '#':
+            return line[:index]
+    return line
+
+
+def _bracket_depth(text):
+    """Open [ minus closed ] outside strings - above 0 means an array continues on the next line"""
+    depth = 0
+    quote = None
+    for char in text:
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in ('"', "'"):
+            quote = char
+        elif char == '[':
+            depth += 1
+        elif char == ']':
+            depth -= 1
+    return depth
+
+
+def _open_multiline_string(text):
+    """The triple quotes of a multi-line string that text opens but does not close, or None"""
+    for quotes in ('"""', "'''"):
+        if text.count(quotes) % 2:
+            return quotes
+    return None
+
+
+def _parse_value(text):
+    """A TOML string, number, boolean or array of those"""
+    text = text.strip()
+    if text in ('true', 'false'):
+        return text == 'true'
+    if text[:4] in ('"""\n', "'''\n"):
+        # TOML drops a newline straight after the opening quotes of a multi-line string
+        text = text[:3] + text[4:]
+    return ast.literal_eval(text)
+
+
+def parse_simple_toml(text, table=""):
+    """Parse the subset of TOML that manifests use: tables, strings, numbers, booleans and arrays
+    
+    Only keys in table and the tables below it are parsed; everything else is
+    skipped, so the rest of a pyproject.toml may use any TOML it likes.
+    """
+    data = {}
+    current = None
+    pending = ""
+    
+    lines = iter(text.splitlines())
+    for line in lines:
+        line = _strip_comment(line).strip()
+        if not line:
+            continue
+        
+        # A multi-line string is read whole, so none of its lines is taken for a table or a key
+        quotes = _open_multiline_string(line)
+        while quotes:
+            rest = next(lines, None)
+            if rest is None:
+                raise ManifestError(f"unterminated {quotes} string")
+            line += "\n" + rest
+            if quotes in rest:
+                quotes = _open_multiline_string(line)
+        
+        if pending:
+            pending += " " + line
+        elif line.startswith('['):
+            name = line.strip('[] ')
+            if name == table or name.startswith(table + ".") or not table:
+                current = data
+                for part in name.split('.'):
+                    current = current.setdefault(part.strip().strip('"'), {})
+            else:
+                current = None
+            continue
+        else:
+            pending = line
+        
+        if _bracket_depth(pending) > 0:
+            continue
+        
+        statement, pending = pending, ""
+        if current is None and table:
+            continue
+        
+        key, sep, value = statement.partition('=')
+        if not sep:
+            raise ManifestError(f"expected key = value: {statement}")
+        try:
+            parsed = _parse_value(value)
+        except (ValueError, SyntaxError):
+            raise ManifestError(f"unsupported value for {key.strip()}: {value.strip()}")
+        (data if current is None else current)[key.strip().strip('"')] = parsed
+    
+    if table:
+        for part in table.split('.'):
+            data = data.get(part, {}) if isinstance(data, dict) else {}
+    return data
+
+
+def parse_toml(text, source, table=""):
+    """Parse TOML and return the given (dotted) table, or {} when it is missing"""
+    tomllib = toml_module()
+    if tomllib is None:
+        try:
+            return parse_simple_toml(text, table)
+        except ManifestError as e:
+            raise ManifestError(f"{source}: {e}")
+    
+    try:
+        data = tomllib.loads(text)
+    except tomllib.TOMLDecodeError as e:
+        raise ManifestError(f"{source}: {e}")
+    
+    if table:
+        for part in table.split('.'):
+            data = data.get(part, {}) if isinstance(data, dict) else {}
+    return data
+
+
+def _string_list(data, key, source):
+    value = data.get(key, [])
+    if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+        raise ManifestError(f"{source}: {key} must be a list of strings")
+    return value
+
+
+def _limits(data, source):
+    """The [limits] table, checked against the keys and value types of DEFAULT_LIMITS"""
+    limits = data.get('limits', {})
+    error = limits_error(limits)
+    if error is not None:
+        raise ManifestError(f"{source}: {error}")
+    return limits
+
+
+def manifest_fields(data, source):
+    """Check a parsed manifest and return its fields with defaults filled in"""
+    if not isinstance(data, dict):
+        raise ManifestError(f"{source}: not a table")
+    
+    entry = data.get('entry')
+    if entry is not None and not isinstance(entry, str):
+        raise ManifestError(f"{source}: entry must be a string")
+    
+    python = data.get('python')
+    if python is not None:
+        if isinstance(python, (int, float)):
+            python = str(python)
+        if not isinstance(python, str):
+            raise ManifestError(f"{source}: python must be a version string")
+    
+    env = data.get('env', {})
+    if not isinstance(env, dict):
+        raise ManifestError(f"{source}: env must be a table")
+    
+    return {
+        'entry': entry,
+        'args': _string_list(data, 'args', source),
+        'env': {str(key): str(value) for key, value in env.items()},
+        'python': python,
+        'dependencies': _string_list(data, 'dependencies', source),
+        'limits': _limits(data, source),
+    }
+
+
+def load_manifest(folder):
+    """Return (file name, fields) for an app's manifest, or None when it has none
+    
+    launcher.toml wins over pyproject.toml. Raises ManifestError when the
+    manifest cannot be read or parsed.
+    """
+    try:
+        text = (folder / MANIFEST_NAME).read_text(encoding='utf-8')
+    except FileNotFoundError:
+        text = None
+    except (OSError, UnicodeDecodeError) as e:
+        raise ManifestError(f"{MANIFEST_NAME}: {e}")
+    
+    if text is not None:
+        return MANIFEST_NAME, manifest_fields(parse_toml(text, MANIFEST_NAME), MANIFEST_NAME)
+    
+    try:
+        text = (folder / PYPROJECT_NAME).read_text(encoding='utf-8')
+    except FileNotFoundError:
+        return None
+    except (OSError, UnicodeDecodeError) as e:
+        raise ManifestError(f"{PYPROJECT_NAME}: {e}")
+    
+    # Most pyproject.toml files are for other tools - don't parse those
+    if "[" + PYPROJECT_TABLE not in text:
+        return None
+    
+    source = f"{PYPROJECT_NAME} [{PYPROJECT_TABLE}]"
+    data = parse_toml(text, source, PYPROJECT_TABLE)
+    if not data:
+        return None
+    return PYPROJECT_NAME, manifest_fields(data, source)
@@ -0,0 +1,182 @@
+"""
+Resource monitoring - samples CPU, memory, threads and open files of every
+running app (including processes it started) from /proc on Linux
+"""
+
+import os
+import threading
+import time
+from pathlib import Path
+
+from applauncher.runner import PHASE_RUNNING
+
+
+PROC = Path("/proc")
+
+
+def monitoring_available():
+    """True where per-process stats can be read from /proc"""
+    return (PROC / "self" / "stat").exists()
+
+
+def read_stat(pid):
+    """Return (ppid, cpu_ticks, threads, rss_pages) from /proc/<pid>/stat, or None if it is gone"""
+    try:
+        with open(PROC / str(pid) / "stat", 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+    
+    # The command name may contain spaces and parentheses - fields start after the last ')'
+    fields = data[data.rfind(b')') + 2:].split()
+    try:
+        return int(fields[1]), int(fields[11]) + int(fields[12]), int(fields[17]), int(fields[21])
+    except (IndexError, ValueError):
+        return None
+
+
+def count_fds(pid):
+    """Number of open file descriptors, or 0 if they cannot be listed"""
+    try:
+        return len(os.listdir(PROC / str(pid) / "fd"))
+    except OSError:
+        return 0
+
+
+def process_tree():
+    """Map every pid to the pids of its children"""
+    children = {}
+    try:
+        entries = os.listdir(PROC)
+    except OSError:
+        return children
+    
+    for name in entries:
+        if not name.isdigit():
+            continue
+        stat = read_stat(name)
+        if stat is not None:
+            children.setdefault(stat[0], []).append(int(name))
+    return children
+
+
+def descendants(pid, children):
+    """pid and every process below it"""
+    pids = [pid]
+    index = 0
+    while index < len(pids):
+        pids.extend(children.get(pids[index], ()))
+        index += 1
+    return pids
+
+
+class ResourceUsage:
+    """Latest and peak resource use of one run (an app and everything it started)"""
+    
+    def __init__(self):
+        self.cpu_percent = 0.0
+        self.rss = 0
+        self.threads = 0
+        self.fds = 0
+        self.processes = 0
+        
+        self.peak_cpu_percent = 0.0
+        self.peak_rss = 0
+        self.peak_threads = 0
+        self.peak_fds = 0
+        self.samples = 0
+        
+        # Previous CPU tick count per pid, and when it was taken
+        self.last_ticks = {}
+        self.last_time = None
+    
+    def update(self, cpu_percent, rss, threads, fds, processes):
+        self.cpu_percent = cpu_percent
+        self.rss = rss
+        self.threads = threads
+        self.fds = fds
+        self.processes = processes
+        
+        self.peak_cpu_percent = max(self.peak_cpu_percent, cpu_percent)
+        self.peak_rss = max(self.peak_rss, rss)
+        self.peak_threads = max(self.peak_threads, threads)
+        self.peak_fds = max(self.peak_fds, fds)
+        self.samples += 1
+    
+    def peaks(self):
+        """Peak values for the run history"""
+        return {
+            'peak_cpu_percent': round(self.peak_cpu_percent, 1),
+            'peak_rss': self.peak_rss,
+            'peak_threads': self.peak_threads,
+            'peak_fds': self.peak_fds,
+            'samples': self.samples,
+        }
+
+
+class ResourceMonitor:
+    """Background thread that samples every running app each interval seconds"""
+    
+    def __init__(self, process_table, interval=1.0):
+        self.process_table = process_table
+        self.interval = interval
+        self.page_size = os.sysconf('SC_PAGE_SIZE')
+        self.clock_ticks = os.sysconf('SC_CLK_TCK')
+        self.stop_event = threading.Event()
+        self.thread = None
+    
+    def start(self):
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+    
+    def stop(self):
+        self.stop_event.set()
+    
+    def _run(self):
+        while not self.stop_event.wait(self.interval):
+            records = [
+                record for record in self.process_table.all_runs()
+                if record.phase == PHASE_RUNNING and record.pid is not None
+            ]
+            if not records:
+                continue
+            
+            # One pass over /proc serves every run
+            children = process_tree()
+            for record in records:
+                if record.usage is None:
+                    record.usage = ResourceUsage()
+                self.sample(record.pid, record.usage, children)
+    
+    def sample(self, pid, usage, children):
+        """Add one sample for pid and its descendants to usage"""
+        now = time.monotonic()
+        ticks = {}
+        rss = threads = fds = 0
+        
+        for child in descendants(pid, children):
+            stat = read_stat(child)
+            if stat is None:
+                continue
+            _, cpu_ticks, child_threads, rss_pages = stat
+            ticks[child] = cpu_ticks
+            rss += rss_pages * self.page_size
+            threads += child_threads
+            fds += count_fds(child)
+        
+        if not ticks:
+            # Already exited
+            return
+        
+        cpu_percent = 0.0
+        if usage.last_time is not None:
+            # Only processes seen both times count, so exiting children don't skew it
+            used = sum(max(0, cpu - usage.last_ticks[child])
+                       for child, cpu in ticks.items() if child in usage.last_ticks)
+            elapsed = now - usage.last_time
+            if elapsed > 0:
+                cpu_percent = 100.0 * used / self.clock_ticks / elapsed
+        
+        usage.last_ticks = ticks
+        usage.last_time = now
+        usage.update(cpu_percent, rss, threads, fds, len(ticks))
@@ -0,0 +1,112 @@
+"""
+Environment pre-warming - after a scan, builds missing or stale app environments
+in the background so most launches go straight to running the entry point
+"""
+
+import queue
+import threading
+
+from applauncher.envs import app_env_path, env_is_current, prepare_env
+
+
+# Environment states reported for each app
+ENV_READY = "ready"
+ENV_BUILDING = "building"
+ENV_MISSING = "missing"
+ENV_FAILED = "failed"
+
+
+class _BuildPaused(Exception):
+    """Raised between the steps of a background build when the prewarmer is paused"""
+
+
+class EnvPrewarmer:
+    """Low-priority worker threads that prepare app environments ahead of time
+    
+    on_state(app_name, state) is called from a worker thread whenever an app's
+    environment state is known or changes. Work pauses while pause() calls are
+    outstanding (the launcher pauses it while a user-started run is setting up):
+    queued builds wait, and a build that is already running gives up its
+    environment at its next step and is queued again.
+    """
+    
+    def __init__(self, uv, on_state, workers=1, shared_envs_dir=None, wheelhouse=None):
+        self.uv = uv
+        self.on_state = on_state
+        self.workers = max(1, workers)
+        self.shared_envs_dir = shared_envs_dir
+        self.wheelhouse = wheelhouse
+        
+        self.jobs = queue.Queue()
+        self.generation = 0
+        self.pause_count = 0
+        self.lock = threading.Lock()
+        self.unpaused = threading.Event()
+        self.unpaused.set()
+        self.threads = []
+    
+    def enqueue(self, apps, replace=True):
+        """Queue (app_name, app_info) pairs; replace drops work queued by earlier calls"""
+        with self.lock:
+            if replace:
+                self.generation += 1
+            generation = self.generation
+            
+            # Worker threads are only started once there is something to do
+            while len(self.threads) < self.workers:
+                thread = threading.Thread(target=self._worker, daemon=True)
+                thread.start()
+                self.threads.append(thread)
+        
+        for app_name, app_info in apps:
+            self.jobs.put((generation, app_name, app_info))
+    
+    def pause(self):
+        """Hold off builds until the matching resume() - a running build stops before its next step"""
+        with self.lock:
+            self.pause_count += 1
+            self.unpaused.clear()
+    
+    def resume(self):
+        """Undo one pause()"""
+        with self.lock:
+            self.pause_count = max(0, self.pause_count - 1)
+            if self.pause_count == 0:
+                self.unpaused.set()
+    
+    def _worker(self):
+        """Check and build environments one at a time"""
+        while True:
+            generation, app_name, app_info = self.jobs.get()
+            if generation != self.generation:
+                continue
+            
+            self.unpaused.wait()
+            shared_envs_dir = self.shared_envs_dir() if callable(self.shared_envs_dir) else self.shared_envs_dir
+            
+            try:
+                if env_is_current(app_info, app_env_path(app_info, shared_envs_dir)):
+                    self.on_state(app_name, ENV_READY)
+                    continue
+                
+                if self.uv.path is None and self.uv.probe() is None:
+                    # Nothing can be built without uv
+                    self.on_state(app_name, ENV_MISSING)
+                    continue
+                
+                self.on_state(app_name, ENV_BUILDING)
+                wheelhouse = self.wheelhouse() if callable(self.wheelhouse) else self.wheelhouse
+                prepare_env(self.uv, app_info, on_phase=self._check_paused,
+                            shared_envs_dir=shared_envs_dir, low_priority=True, wheelhouse=wheelhouse)
+                self.on_state(app_name, ENV_READY)
+            except _BuildPaused:
+                # Leaving prepare_env releases the environment's lock, so a user run of the
+                # same app never waits on a paused build; the job is picked up after resume()
+                self.jobs.put((generation, app_name, app_info))
+            except Exception:
+                self.on_state(app_name, ENV_FAILED)
+    
+    def _check_paused(self, phase):
+        """on_phase hook for background builds: stop here if a pause() is outstanding"""
+        if not self.unpaused.is_set():
+            raise _BuildPaused(phase)
@@ -0,0 +1,306 @@
+"""
+App execution - runs an app's entry point, streams its stdout/stderr line by
+line into a bounded buffer the UI drains in batches, and tracks every launch
+"""
+
+import collections
+import itertools
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+
+from applauncher.logs import STDERR_PREFIX
+
+
+# Longest single line kept in memory - longer lines are split
+MAX_LINE_CHARS = 64 * 1024
+
+
+class AppProcess:
+    """A running app whose output is read on background threads"""
+    
+    def __init__(self, command, cwd, buffer_lines=5000, log_file=None, popen_kwargs=None, env=None):
+        self.command = command
+        self.cwd = cwd
+        # Variables set on top of the launcher's environment (an app manifest's [env])
+        self.extra_env = env or {}
+        # Extra subprocess arguments, e.g. the preexec hook that applies resource limits
+        self.popen_kwargs = popen_kwargs or {}
+        self.buffer_lines = buffer_lines
+        self.log_file = log_file
+        
+        # Ring buffer of the most recent (sequence number, stream, line) triples
+        self.recent = collections.deque(maxlen=buffer_lines)
+        self.line_count = 0
+        self.byte_count = 0
+        self.lock = threading.Lock()
+        
+        self.process = None
+        self.readers = []
+        self.log_handle = None
+    
+    def start(self):
+        """Start the app and the threads that read its output"""
+        env = dict(os.environ)
+        # Apps should print as they go instead of when their buffers fill
+        env['PYTHONUNBUFFERED'] = '1'
+        env.update(self.extra_env)
+        
+        if self.log_file is not None:
+            self.log_file.parent.mkdir(parents=True, exist_ok=True)
+            # Line buffered, so a viewer paging the file sees lines as they arrive
+            self.log_handle = open(self.log_file, 'w', encoding='utf-8', errors='replace', buffering=1)
+        
+        # The app leads its own process group, so stopping it reaches whatever it started too
+        popen_kwargs = dict(self.popen_kwargs)
+        if sys.platform == 'win32':
+            popen_kwargs['creationflags'] = (popen_kwargs.get('creationflags', 0)
+                                             | subprocess.CREATE_NEW_PROCESS_GROUP)
+        else:
+            popen_kwargs['start_new_session'] = True
+        
+        self.process = subprocess.Popen(
+            self.command,
+            cwd=self.cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            stdin=subprocess.DEVNULL,
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+            env=env,
+            **popen_kwargs
+        )
+        
+        for name, stream in (('stdout', self.process.stdout), ('stderr', self.process.stderr)):
+            reader = threading.Thread(target=self._read_stream, args=(name, stream), daemon=True)
+            reader.start()
+            self.readers.append(reader)
+        
+        return self
+    
+    def signal_group(self, force=False):
+        """SIGTERM (or with force, SIGKILL) the app and every process in its group"""
+        if sys.platform == 'win32':
+            # taskkill /T walks the app's process tree; /F is what Popen.terminate does as well
+            subprocess.run(["taskkill", "/T", "/F", "/PID", str(self.process.pid)],
+                           capture_output=True)
+            return
+        
+        try:
+            os.killpg(self.process.pid, signal.SIGKILL if force else signal.SIGTERM)
+        except (ProcessLookupError, PermissionError):
+            # The whole group has exited already
+            pass
+    
+    def _read_stream(self, name, stream):
+        """Copy lines from one pipe into the buffers (and the log file)"""
+        for line in iter(lambda: stream.readline(MAX_LINE_CHARS), ''):
+            with self.lock:
+                self.line_count += 1
+                self.byte_count += len(line)
+                self.recent.append((self.line_count, name, line))
+                if self.log_handle is not None:
+                    self.log_handle.write(line if name == 'stdout' else STDERR_PREFIX + line)
+        stream.close()
+    
+    def lines_since(self, seq):
+        """Return (lines, skipped, last_seq) for the output after sequence number seq
+        
+        lines are (stream, line) pairs, oldest first; skipped counts lines that
+        already fell out of the ring buffer. Each viewer keeps its own seq.
+        """
+        with self.lock:
+            if not self.recent:
+                return [], 0, seq
+            first_seq = self.recent[0][0]
+            skipped = max(0, first_seq - seq - 1)
+            start = max(0, seq + 1 - first_seq)
+            lines = [(stream, line) for _, stream, line in itertools.islice(self.recent, start, None)]
+            return lines, skipped, self.line_count
+    
+    def finished(self):
+        """True once the app has exited and all of its output has been read"""
+        return (self.process is not None and self.process.poll() is not None
+                and not any(reader.is_alive() for reader in self.readers))
+    
+    def wait(self):
+        """Wait for the app to exit and its output to be read; returns the exit code"""
+        return_code = self.process.wait()
+        for reader in self.readers:
+            reader.join()
+        
+        with self.lock:
+            if self.log_handle is not None:
+                self.log_handle.close()
+                self.log_handle = None
+        return return_code
+    
+    @property
+    def returncode(self):
+        return None if self.process is None else self.process.returncode
+
+
+# Run phases, in the order a launch goes through them
+PHASE_QUEUED = "queued"
+PHASE_CHECKING_ENV = "checking env"
+PHASE_LOCATING_UV = "locating uv"
+PHASE_CREATING_ENV = "creating env"
+PHASE_INSTALLING = "installing"
+PHASE_RUNNING = "running"
+PHASE_EXITED = "exited"
+PHASE_FAILED = "failed"
+PHASE_STOPPED = "stopped"
+PHASE_LIMITED = "limit exceeded"
+
+STARTING_PHASES = (PHASE_QUEUED, PHASE_CHECKING_ENV, PHASE_LOCATING_UV, PHASE_CREATING_ENV,
+                   PHASE_INSTALLING)
+ACTIVE_PHASES = STARTING_PHASES + (PHASE_RUNNING,)
+
+
+class RunRecord:
+    """One launch of an app, from environment setup until it exits"""
+    
+    def __init__(self, run_id, app_name, app_info):
+        self.run_id = run_id
+        self.app_name = app_name
+        self.app_info = app_info
+        self.started = time.time()
+        self.ended = None
+        self.phase = PHASE_QUEUED
+        # (phase, monotonic time it began) for every phase so far
+        self.phase_log = [(PHASE_QUEUED, time.monotonic())]
+        self.process = None
+        self.exit_code = None
+        self.error = None
+        self.stop_requested = False
+        # Which resource limit ended the run, if one did (see applauncher.limits)
+        self.limit = None
+        # Stored output once the run has finished
+        self.log_file = None
+        # Resource samples while running (see applauncher.monitor)
+        self.usage = None
+    
+    @property
+    def pid(self):
+        if self.process is None or self.process.process is None:
+            return None
+        return self.process.process.pid
+    
+    @property
+    def active(self):
+        return self.phase in ACTIVE_PHASES
+    
+    def enter_phase(self, phase):
+        """Move to the next phase, noting when it began"""
+        self.phase_log.append((phase, time.monotonic()))
+        self.phase = phase
+        if phase not in ACTIVE_PHASES:
+            self.ended = time.time()
+    
+    def phase_durations(self):
+        """Seconds spent in each phase so far (the current phase counts up to now)"""
+        durations = {}
+        log = self.phase_log
+        ends = [started for _, started in log[1:]]
+        if self.phase in ACTIVE_PHASES:
+            ends.append(time.monotonic())
+        
+        for (phase, started), ended in zip(log, ends):
+            durations[phase] = durations.get(phase, 0.0) + ended - started
+        return durations
+    
+    @property
+    def launch_seconds(self):
+        """Seconds from clicking Run until the app was started, or None if it never started"""
+        for phase, started in self.phase_log:
+            if phase == PHASE_RUNNING:
+                return started - self.phase_log[0][1]
+        return None
+    
+    def history_entry(self):
+        """Summary of a finished run for the run history"""
+        process = self.process
+        return {
+            'app': self.app_name,
+            'folder': str(self.app_info['folder']),
+            'started': round(self.started, 3),
+            'ended': None if self.ended is None else round(self.ended, 3),
+            'outcome': self.phase,
+            'phases': {phase: round(seconds, 4) for phase, seconds in self.phase_durations().items()},
+            'launch_seconds': None if self.launch_seconds is None else round(self.launch_seconds, 4),
+            'exit_code': self.exit_code,
+            'error': self.error,
+            'limit': self.limit,
+            'output_lines': 0 if process is None else process.line_count,
+            'output_bytes': 0 if process is None else process.byte_count,
+            'log': None if self.log_file is None else str(self.log_file),
+            'resources': None if self.usage is None else self.usage.peaks(),
+        }
+    
+    def stop(self, timeout):
+        """Ask the app and the processes it started to exit (SIGTERM), killing them if the app
+        is still alive after timeout seconds"""
+        self.stop_requested = True
+        
+        if self.process is None or self.process.process is None:
+            # Still setting up - the launch is abandoned before the app starts
+            return
+        
+        process = self.process
+        popen = process.process
+        if popen.poll() is not None:
+            return
+        
+        process.signal_group()
+        
+        def kill_later():
+            try:
+                popen.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                process.signal_group(force=True)
+        
+        thread = threading.Thread(target=kill_later, daemon=True)
+        thread.start()
+
+
+class ProcessTable:
+    """Every app launched this session, plus a cap on how many may be starting at once"""
+    
+    def __init__(self, max_starting=3):
+        self.runs = {}
+        self.next_id = 1
+        self.lock = threading.Lock()
+        self.start_slots = threading.Semaphore(max(1, max_starting))
+    
+    def new_run(self, app_name, app_info):
+        """Create and register the record for a new launch"""
+        with self.lock:
+            record = RunRecord(self.next_id, app_name, app_info)
+            self.runs[record.run_id] = record
+            self.next_id += 1
+        return record
+    
+    def get(self, run_id):
+        with self.lock:
+            return self.runs.get(run_id)
+    
+    def all_runs(self):
+        """All runs, newest first"""
+        with self.lock:
+            return sorted(self.runs.values(), key=lambda record: record.run_id, reverse=True)
+    
+    def counts(self):
+        """Return (starting, running) counts for the status bar"""
+        runs = self.all_runs()
+        starting = sum(1 for record in runs if record.phase in STARTING_PHASES)
+        running = sum(1 for record in runs if record.phase == PHASE_RUNNING)
+        return starting, running
+
+
+def app_command(app_info, python_exe):
+    """Command line that starts an app's entry point with the given interpreter"""
+    return [str(python_exe), app_info['entry_point']] + list(app_info['args'])
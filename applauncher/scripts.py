@@ -0,0 +1,222 @@
+"""
+Launcher script generation - writes run.sh / run.bat next to an app so it
+can be started without the launcher
+"""
+
+import hashlib
+import shlex
+import stat
+import sys
+
+from applauncher.envs import LOCK_NAME, current_lock, install_args
+
+
+# Written inside .venv by run.sh / run.bat after they install the app's dependencies
+SCRIPT_STAMP_NAME = ".launcher_script_stamp"
+
+
+def bat_quote(arg):
+    """Quote one argument for a batch file command line"""
+    if arg and not any(char in arg for char in ' \t"&|<>^%'):
+        return arg
+    return '"' + arg.replace('"', '""').replace('%', '%%') + '"'
+
+
+def bat_set(name, value):
+    """`set "name=value"` line for a batch file that sets the variable to exactly value"""
+    # cmd turns quoting on and off at every ", so after an odd number of them the
+    # special characters need a ^; % is doubled everywhere (as in bat_quote)
+    quoted = True
+    chars = []
+    for char in f"{name}={value}":
+        if char == '"':
+            quoted = not quoted
+        elif char == '%':
+            char = '%%'
+        elif not quoted and char in '&|<>^':
+            char = '^' + char
+        chars.append(char)
+    return f'set "{"".join(chars)}"\n'
+
+
+def install_line(packages, quote, wheelhouse, command="install", flags=""):
+    """`uv pip install` (or sync) line for a script - offline from the wheelhouse first when there is one"""
+    install = f"uv pip {command} {flags}" + " ".join(quote(arg) for arg in packages)
+    if wheelhouse is None:
+        return install
+    offline = f"{install} {' '.join(quote(arg) for arg in wheelhouse.install_args())}"
+    return f"{offline} || {install}" if wheelhouse.network_fallback else offline
+
+
+def build_launcher_scripts(app_name, app_info, wheelhouse=None):
+    """Return the (run.sh, run.bat) text for an app (installing from wheelhouse if given)
+    
+    The scripts record what they installed in a stamp inside .venv and start
+    the app straight away while it still matches, so uv only runs when the
+    dependencies (or the requirements/lock file) changed. Run them with
+    --offline to install from local caches and wheels only.
+    """
+    entry_point = app_info['entry_point']
+    packages = install_args(app_info)
+    # With a current lock file the scripts install exactly what the launcher does
+    pip_command = "install"
+    if packages and current_lock(app_info) is not None:
+        packages, pip_command = [LOCK_NAME], "sync"
+    python = app_info['python']
+    sh_python = f" --python {shlex.quote(python)}" if python else ""
+    bat_python = f" --python {bat_quote(python)}" if python else ""
+    
+    # The scripts hash the files they install from when they start; the rest is fixed here
+    deps = hashlib.sha256("\n".join([pip_command, python or ""] + packages).encode('utf-8')).hexdigest()[:16]
+    dep_files = []
+    if app_info['has_requirements']:
+        dep_files.append("requirements.txt")
+    if pip_command == "sync":
+        dep_files.append(LOCK_NAME)
+    
+    # Shell script
+    sh_script = f"""#!/bin/bash
+# Launcher for {app_name}
+# Usage: ./run.sh [--offline]  (--offline installs from local caches and wheels only)
+
+cd "$(dirname "$0")"
+
+OFFLINE=""
+if [ "$1" = "--offline" ]; then
+    OFFLINE="--offline "
+fi
+
+# What this script installs - while .venv was set up for it, go straight to the app
+DEPS="{deps}"
+"""
+    for name in dep_files:
+        sh_script += f'DEPS="$DEPS $(cksum < {shlex.quote(name)} 2>/dev/null)"\n'
+    
+    sh_script += f"""STAMP=".venv/{SCRIPT_STAMP_NAME}"
+
+if [ ! -x .venv/bin/python ] || [ "$(cat "$STAMP" 2>/dev/null)" != "$DEPS" ]; then
+    if ! command -v uv &> /dev/null; then
+        echo "UV is not installed. Install it with: pip install uv"
+        exit 1
+    fi
+    if [ ! -d ".venv" ]; then
+        echo "Creating environment..."
+        uv venv $OFFLINE{sh_python} || exit 1
+    fi
+"""
+    
+    if packages:
+        install = install_line(packages, shlex.quote, wheelhouse, pip_command, "$OFFLINE")
+        sh_script += f"""    echo "Installing dependencies..."
+    {install} || {{ echo "Installing dependencies failed"; exit 1; }}
+"""
+    
+    sh_script += """    echo "$DEPS" > "$STAMP"
+fi
+"""
+    
+    if app_info['env']:
+        sh_script += "\n"
+    for name, value in app_info['env'].items():
+        sh_script += f"export {name}={shlex.quote(value)}\n"
+    
+    command = " ".join(shlex.quote(arg) for arg in [entry_point] + app_info['args'])
+    sh_script += f"""
+echo "Running {entry_point}..."
+.venv/bin/python {command}
+"""
+    
+    # Batch script
+    bat_script = f"""@echo off
+REM Launcher for {app_name}
+REM Usage: run.bat [--offline]  (--offline installs from local caches and wheels only)
+
+cd /d "%~dp0"
+
+set "OFFLINE="
+if /i "%~1"=="--offline" set "OFFLINE=--offline "
+
+REM What this script installs - while .venv was set up for it, go straight to the app
+set "DEPS={deps}"
+"""
+    for name in dep_files:
+        bat_script += f"call :add_hash {bat_quote(name)}\n"
+    
+    bat_script += f"""set "STAMP=.venv\\{SCRIPT_STAMP_NAME}"
+set "SAVED="
+if exist "%STAMP%" set /p SAVED=<"%STAMP%"
+if exist ".venv\\Scripts\\python.exe" if "%SAVED%"=="%DEPS%" goto run
+
+where uv >nul 2>nul
+if %ERRORLEVEL% neq 0 (
+    echo UV is not installed. Install it with: pip install uv
+    pause
+    exit /b 1
+)
+
+if not exist ".venv" (
+    echo Creating environment...
+    uv venv %OFFLINE%{bat_python}
+    if errorlevel 1 (
+        echo Creating environment failed
+        pause
+        exit /b 1
+    )
+)
+"""
+    
+    if packages:
+        bat_script += f"""
+echo Installing dependencies...
+{install_line(packages, bat_quote, wheelhouse, pip_command, "%OFFLINE%")}
+if errorlevel 1 (
+    echo Installing dependencies failed
+    pause
+    exit /b 1
+)
+"""
+    
+    bat_script += """
+>"%STAMP%" echo %DEPS%
+
+:run
+"""
+    
+    for name, value in app_info['env'].items():
+        bat_script += bat_set(name, value)
+    
+    command = " ".join(bat_quote(arg) for arg in [entry_point] + app_info['args'])
+    bat_script += f"""
+echo Running {entry_point}...
+.venv\\Scripts\\python.exe {command}
+
+pause
+exit /b
+
+:add_hash
+if not exist "%~1" exit /b
+for /f "skip=1 delims=" %%H in ('certutil -hashfile "%~1" SHA256') do (
+    set "DEPS=%DEPS% %%H"
+    exit /b
+)
+exit /b
+"""
+    
+    return sh_script, bat_script
+
+
+def write_launcher_scripts(app_name, app_info, wheelhouse=None):
+    """Write run.sh and run.bat into the app folder; returns their paths"""
+    app_folder = app_info['folder']
+    sh_script, bat_script = build_launcher_scripts(app_name, app_info, wheelhouse)
+    
+    sh_path = app_folder / "run.sh"
+    bat_path = app_folder / "run.bat"
+    
+    sh_path.write_text(sh_script, encoding='utf-8')
+    bat_path.write_text(bat_script, encoding='utf-8')
+    
+    if sys.platform != 'win32':
+        sh_path.chmod(sh_path.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    
+    return sh_path, bat_path
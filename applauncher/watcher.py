@@ -0,0 +1,333 @@
+"""
+Projects folder watcher - reports added, removed and modified app folders
+so the launcher can update single cards instead of rescanning everything.
+
+Uses inotify on Linux and falls back to polling folder fingerprints elsewhere.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+from pathlib import Path
+
+from applauncher.dependencies import SKIP_DIRS, is_source_dir
+from applauncher.discovery import (DEFAULT_MAX_DEPTH, folder_fingerprint, list_project_folders, looks_like_app,
+                                   walk_projects)
+from applauncher.manifest import MANIFEST_FILES
+
+
+# Seconds between fingerprint checks when inotify is not available
+POLL_INTERVAL = 2.0
+
+# Seconds of quiet to wait for before reporting a burst of changes
+DEBOUNCE = 0.3
+
+# inotify event bits (see inotify(7))
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+ROOT_MASK = IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO | IN_ONLYDIR
+FOLDER_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_CREATE | IN_DELETE |
+               IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR)
+
+EVENT_HEADER = struct.Struct('iIII')
+
+
+def is_watched_file(name):
+    """Only files that analyze_app looks at can change an app's card"""
+    return name.endswith('.py') or name == 'requirements.txt' or name in MANIFEST_FILES
+
+
+class ProjectWatcher:
+    """Background thread that calls on_change(folders) whenever app folders change"""
+    
+    def __init__(self, projects_path, on_change, poll_interval=POLL_INTERVAL, max_depth=DEFAULT_MAX_DEPTH):
+        self.projects_path = Path(projects_path)
+        self.on_change = on_change
+        self.poll_interval = poll_interval
+        self.max_depth = max_depth
+        # The projects folder and the category folders between it and the apps, with their level below it
+        self.category_paths = {self.projects_path: 0}
+        self.mode = None
+        self.stop_event = threading.Event()
+        self.thread = None
+        
+        # inotify state
+        self.libc = None
+        self.fd = None
+        self.watches = {}
+        # Subfolders of apps (their packages), mapped to the app folder they belong to
+        self.source_dirs = {}
+    
+    def start(self):
+        """Start watching on a background thread, which also does the setup"""
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+    
+    def stop(self):
+        """Stop watching (the thread exits at its next wakeup)"""
+        self.stop_event.set()
+    
+    def _run(self):
+        """Watch with inotify when the platform supports it, else by polling
+        
+        Setting up inotify walks the whole projects folder, which can take a
+        while on a network mount - so it runs here and not in start().
+        """
+        if self._init_inotify():
+            self.mode = 'inotify'
+            self._run_inotify()
+        else:
+            self.mode = 'polling'
+            self._run_polling()
+    
+    def _report(self, folders):
+        """Hand a batch of changed folders to the callback"""
+        if folders and not self.stop_event.is_set():
+            self.on_change(sorted(folders))
+    
+    # --- inotify -----------------------------------------------------------
+    
+    def _init_inotify(self):
+        """Set up inotify watches on the root, every category folder and every app folder
+        (with its source subfolders), or return False"""
+        if not sys.platform.startswith('linux'):
+            return False
+        
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (OSError, AttributeError):
+            return False
+        
+        if fd < 0:
+            return False
+        
+        self.libc = libc
+        self.fd = fd
+        
+        try:
+            self._add_watch(self.projects_path, ROOT_MASK)
+            folders, categories = walk_projects(self.projects_path, self.max_depth)
+            for category in categories:
+                self._watch_category(category, len(category.relative_to(self.projects_path).parts))
+            for folder in folders:
+                self._watch_app(folder)
+        except OSError:
+            # Usually the per-user watch limit - polling still works
+            os.close(fd)
+            self.fd = None
+            self.watches = {}
+            self.source_dirs = {}
+            return False
+        
+        return True
+    
+    def _add_watch(self, path, mask):
+        """Register an inotify watch and remember which path it belongs to"""
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(str(path)), mask)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), str(path))
+        self.watches[wd] = Path(path)
+    
+    def _watch_category(self, folder, level):
+        """Watch a category folder for folders (and app files) appearing in it"""
+        self._add_watch(folder, ROOT_MASK)
+        self.category_paths[Path(folder)] = level
+    
+    def _watch_new_folder(self, folder, level):
+        """Watch a folder created in a category and return the app folders in it
+        
+        As in walk_projects, a folder without app files above max_depth is a
+        category; it is walked for the apps (and categories) already inside.
+        """
+        if level < self.max_depth:
+            with os.scandir(folder) as entries:
+                is_app = looks_like_app(list(entries))
+            if not is_app:
+                # Watched before the walk, so nothing created meanwhile is missed
+                self._watch_category(folder, level)
+                apps, categories = walk_projects(folder, self.max_depth - level)
+                for category in categories:
+                    self._watch_category(category, level + len(category.relative_to(folder).parts))
+                for app in apps:
+                    self._watch_app(app)
+                return apps
+        
+        self._watch_app(folder)
+        return [folder]
+    
+    def _watch_app(self, folder):
+        """Watch an app folder and the subfolders its imports are read from"""
+        self._add_watch(folder, FOLDER_MASK)
+        self._watch_sources(folder, folder)
+    
+    def _watch_sources(self, directory, app_folder):
+        """Watch the source subfolders below directory (and directory itself, unless it is the app folder)"""
+        pending = [Path(directory)]
+        while pending:
+            directory = pending.pop()
+            if directory != app_folder:
+                self._add_watch(directory, FOLDER_MASK)
+                self.source_dirs[directory] = app_folder
+            try:
+                with os.scandir(directory) as entries:
+                    pending.extend(Path(entry.path) for entry in entries
+                                   if entry.is_dir(follow_symlinks=False)
+                                   and is_source_dir(entry.path, entry.name))
+            except OSError:
+                continue
+    
+    def _unwatch_below(self, folder):
+        """Drop the watches on a deleted or moved-away folder and everything below it;
+        returns the app folders among them"""
+        apps = []
+        for wd, path in list(self.watches.items()):
+            if path == folder or folder in path.parents:
+                if path not in self.category_paths and path not in self.source_dirs:
+                    apps.append(path)
+                # Fails harmlessly when the folder was deleted and the watch is gone already;
+                # either way IN_IGNORED follows and clears the bookkeeping
+                self.libc.inotify_rm_watch(self.fd, wd)
+        return apps
+    
+    def _run_inotify(self):
+        """Read inotify events, debounce them and report the affected folders"""
+        pending = set()
+        
+        try:
+            while not self.stop_event.is_set():
+                timeout = DEBOUNCE if pending else 0.5
+                ready, _, _ = select.select([self.fd], [], [], timeout)
+                
+                if not ready:
+                    # Quiet period - flush whatever has accumulated
+                    self._report(pending)
+                    pending = set()
+                    continue
+                
+                try:
+                    data = os.read(self.fd, 64 * 1024)
+                except BlockingIOError:
+                    continue
+                
+                pending.update(self._parse_events(data))
+        finally:
+            os.close(self.fd)
+    
+    def _parse_events(self, data):
+        """Turn raw inotify records into the set of app folders they touch"""
+        changed = set()
+        offset = 0
+        
+        while offset + EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].split(b'\0', 1)[0]
+            offset += length
+            name = os.fsdecode(name)
+            
+            if mask & IN_Q_OVERFLOW:
+                # Events were lost - treat every folder as changed
+                try:
+                    changed.update(list_project_folders(self.projects_path, self.max_depth))
+                except OSError:
+                    pass
+                changed.update(path for path in self.watches.values()
+                               if path not in self.category_paths and path not in self.source_dirs)
+                continue
+            
+            path = self.watches.get(wd)
+            if path is None:
+                continue
+            
+            if mask & IN_IGNORED:
+                del self.watches[wd]
+                self.source_dirs.pop(path, None)
+                if path != self.projects_path:
+                    self.category_paths.pop(path, None)
+                continue
+            
+            if path in self.category_paths:
+                if name.startswith('.') or name in SKIP_DIRS:
+                    continue
+                if not mask & IN_ISDIR:
+                    # A new folder is empty when created - its first app file makes it an app
+                    if (path != self.projects_path and mask & (IN_CREATE | IN_MOVED_TO)
+                            and (name.endswith('.py') or name in MANIFEST_FILES)):
+                        del self.category_paths[path]
+                        try:
+                            self._watch_app(path)
+                        except OSError:
+                            pass
+                        changed.add(path)
+                    continue
+                
+                folder = path / name
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    try:
+                        changed.update(self._watch_new_folder(folder, self.category_paths[path] + 1))
+                    except OSError:
+                        pass
+                elif mask & (IN_DELETE | IN_MOVED_FROM):
+                    # A category moved away reports no events for the apps inside it
+                    changed.update(self._unwatch_below(folder))
+                changed.add(folder)
+                continue
+            
+            # Events in an app's packages count for the app
+            app_folder = self.source_dirs.get(path, path)
+            if mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+                changed.add(app_folder)
+            elif mask & IN_ISDIR:
+                if name.startswith('.') or name in SKIP_DIRS:
+                    continue
+                if mask & (IN_CREATE | IN_MOVED_TO) and is_source_dir(str(path / name), name):
+                    try:
+                        self._watch_sources(path / name, app_folder)
+                    except OSError:
+                        pass
+                changed.add(app_folder)
+            elif is_watched_file(name):
+                changed.add(app_folder)
+        
+        return changed
+    
+    # --- polling -----------------------------------------------------------
+    
+    def _snapshot(self):
+        """Fingerprint every app folder"""
+        try:
+            folders = list_project_folders(self.projects_path, self.max_depth)
+        except OSError:
+            return {}
+        return {folder: folder_fingerprint(folder) for folder in folders}
+    
+    def _run_polling(self):
+        """Compare folder fingerprints every poll_interval seconds"""
+        previous = self._snapshot()
+        
+        while not self.stop_event.wait(self.poll_interval):
+            current = self._snapshot()
+            changed = {
+                folder for folder in set(previous) | set(current)
+                if previous.get(folder) != current.get(folder)
+            }
+            previous = current
+            self._report(changed)
@@ -0,0 +1,91 @@
+"""
+Offline wheelhouse - a launcher-managed folder of wheels shared by every app,
+filled once by "Vendor Dependencies" so later installs need no network
+"""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from applauncher.envs import LOCK_NAME, current_lock, install_args
+
+
+WHEEL_SUFFIX = ".whl"
+
+
+class Wheelhouse:
+    """A folder of wheels, one copy of each wheel file no matter how many apps need it
+    
+    With network_fallback, installs that the wheelhouse cannot satisfy are
+    retried against the package index; without it they fail.
+    """
+    
+    def __init__(self, path, network_fallback=True):
+        self.path = Path(path)
+        self.network_fallback = network_fallback
+    
+    def wheel_names(self):
+        """File names of the wheels in the wheelhouse"""
+        try:
+            with os.scandir(self.path) as entries:
+                return {entry.name for entry in entries if entry.name.endswith(WHEEL_SUFFIX)}
+        except OSError:
+            return set()
+    
+    def install_args(self):
+        """Extra `uv pip install` arguments that install from the wheelhouse only"""
+        return ["--offline", "--no-index", "--find-links", str(self.path)]
+    
+    def vendor(self, uv, app_info, python_exe):
+        """Download or build wheels for everything the app installs into the wheelhouse
+        
+        pip (run through `uv tool run`, for the app's interpreter) resolves the
+        app's requirements (the pinned versions of its lock file, when it has a
+        current one), reusing wheels already in the wheelhouse. Returns
+        (added, already present) wheel file names; raises UvNotFoundError or
+        subprocess.CalledProcessError when vendoring fails.
+        """
+        if not install_args(app_info):
+            return [], []
+        
+        self.path.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=".vendor-", dir=self.path))
+        
+        try:
+            build_wheels(uv, app_info, python_exe, staging, find_links=self.path)
+            
+            # Wheel file names carry name, version and platform tags, so equal names are equal wheels
+            existing = self.wheel_names()
+            added, present = [], []
+            for wheel in sorted(staging.glob("*" + WHEEL_SUFFIX)):
+                if wheel.name in existing:
+                    present.append(wheel.name)
+                else:
+                    os.replace(wheel, self.path / wheel.name)
+                    added.append(wheel.name)
+            return added, present
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+
+def build_wheels(uv, app_info, python_exe, wheel_dir, find_links=None):
+    """Have pip write wheels for everything the app installs (for python_exe) into wheel_dir
+    
+    Uses the app's lock file when it is current, and wheels in find_links
+    before downloading. Raises UvNotFoundError or subprocess.CalledProcessError.
+    """
+    packages = install_args(app_info)
+    if current_lock(app_info) is not None:
+        # Exactly the versions the launcher installs (offline syncs need those)
+        packages = ["-r", LOCK_NAME]
+    
+    uv.run(
+        ["tool", "run", "--python", str(python_exe), "--from", "pip", "pip", "wheel",
+         "--wheel-dir", str(wheel_dir)]
+        + (["--find-links", str(find_links)] if find_links is not None else [])
+        + packages,
+        cwd=app_info['folder'],
+        check=True,
+        capture_output=True
+    )
@@ -0,0 +1,514 @@
+#!/usr/bin/env python3
+"""
+Launcher benchmarks - times discovery, card rendering, the run pipeline, the
+generated run.sh scripts and the offline wheelhouse against a generated
+projects folder and prints the results as JSON.
+    
+    python bench/bench_launcher.py --apps 1000 --output bench_output.json
+
+Environments are built by a stub uv on PATH (see synthetic.py), so nothing is
+downloaded and numbers are comparable across commits and machines' network
+conditions. Compare two result files to spot scaling regressions.
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+REPO_ROOT = BENCH_DIR.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from synthetic import make_projects, make_wheel_index, stub_env, write_stub_uv  # noqa: E402
+
+from applauncher.discovery import ScanIndex, analyze_app, iter_scan, list_project_folders  # noqa: E402
+from applauncher.envs import LOCK_NAME, UvTool, prepare_env, venv_python, write_lock  # noqa: E402
+from applauncher.runner import PHASE_RUNNING, AppProcess, app_command  # noqa: E402
+from applauncher.scripts import write_launcher_scripts  # noqa: E402
+from applauncher.wheelhouse import Wheelhouse  # noqa: E402
+
+
+def summarize(samples):
+    """min/median/mean/max of a list of durations, in milliseconds"""
+    if not samples:
+        return None
+    ms = [sample * 1000 for sample in samples]
+    return {
+        'runs': len(ms),
+        'min_ms': round(min(ms), 3),
+        'median_ms': round(statistics.median(ms), 3),
+        'mean_ms': round(statistics.mean(ms), 3),
+        'max_ms': round(max(ms), 3),
+    }
+
+
+def git_commit():
+    """The commit being benchmarked, if this is a git checkout"""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return result.stdout.strip() or None
+
+
+# Discovery
+
+def bench_discovery(projects_path, index_file, repeat):
+    """Cold scans (empty index), warm scans (every folder cached) and analyze_app alone"""
+    cold, warm, per_app = [], [], []
+    found = 0
+    
+    for _ in range(repeat):
+        if index_file.exists():
+            index_file.unlink()
+        
+        start = time.perf_counter()
+        index = ScanIndex(index_file)
+        index.load()
+        folders = list_project_folders(projects_path)
+        found = sum(1 for _, app_info in iter_scan(folders, index) if app_info is not None)
+        index.prune(folders)
+        index.save()
+        cold.append(time.perf_counter() - start)
+        
+        start = time.perf_counter()
+        index = ScanIndex(index_file)
+        index.load()
+        folders = list_project_folders(projects_path)
+        for _ in iter_scan(folders, index):
+            pass
+        index.save()
+        warm.append(time.perf_counter() - start)
+    
+    folders = list_project_folders(projects_path)
+    for folder in folders[:200]:
+        start = time.perf_counter()
+        analyze_app(folder)
+        per_app.append(time.perf_counter() - start)
+    
+    return {
+        'apps_found': found,
+        'cold_scan': summarize(cold),
+        'warm_scan': summarize(warm),
+        'analyze_app': summarize(per_app),
+    }
+
+
+# Rendering
+
+def bench_rendering(base_path, repeat, cards, show_window):
+    """Time the window's scan-to-cards path, card construction and scrolling the grid"""
+    try:
+        import tkinter as tk
+        from applauncher.gui import AppCard, ModernLauncher
+        root = tk.Tk()
+    except Exception as e:
+        return {'skipped': f"Tk is not available: {e}"}
+    
+    if not show_window:
+        # Withdrawn windows have no size, so only the overscan rows get cards
+        root.withdraw()
+    
+    try:
+        startup, show_cards, construct, scroll = [], [], [], []
+        launcher = None
+        
+        for _ in range(repeat):
+            if launcher is not None:
+                for child in root.winfo_children():
+                    child.destroy()
+            
+            # Every repetition starts from an empty scan index
+            index_file = base_path / ".launcher_index.json"
+            if index_file.exists():
+                index_file.unlink()
+            
+            start = time.perf_counter()
+            launcher = ModernLauncher(root, base_path)
+            while launcher.scan_cancel_event is not None:
+                root.update()
+                time.sleep(0.001)
+            root.update_idletasks()
+            startup.append(time.perf_counter() - start)
+            
+            start = time.perf_counter()
+            launcher.show_cards()
+            root.update_idletasks()
+            show_cards.append(time.perf_counter() - start)
+            
+            # Scroll the whole list a page at a time
+            start = time.perf_counter()
+            for step in range(21):
+                launcher.canvas.yview_moveto(step / 20)
+                launcher.render_visible_cards()
+                root.update_idletasks()
+            scroll.append(time.perf_counter() - start)
+        
+        names = list(launcher.apps)[:cards]
+        frame = tk.Frame(root)
+        for app_name in names:
+            start = time.perf_counter()
+            AppCard(frame, app_name, launcher.apps[app_name], launcher)
+            construct.append(time.perf_counter() - start)
+        frame.destroy()
+        
+        return {
+            'apps_listed': len(launcher.apps),
+            'cards_created': len(launcher.cards) + len(launcher.card_pool),
+            'startup_to_cards': summarize(startup),
+            'show_cards': summarize(show_cards),
+            'scroll_full_list': summarize(scroll),
+            'app_card_construct': summarize(construct),
+        }
+    finally:
+        root.destroy()
+
+
+# Launch
+
+def time_launch(uv, app_info):
+    """Run one app through env setup and execution; returns {phase: seconds}"""
+    events = [('checking env', time.perf_counter())]
+    
+    def on_phase(phase):
+        events.append((phase, time.perf_counter()))
+    
+    venv_path = prepare_env(uv, app_info, on_phase=on_phase)
+    
+    events.append((PHASE_RUNNING, time.perf_counter()))
+    process = AppProcess(app_command(app_info, venv_python(venv_path)), app_info['folder']).start()
+    return_code = process.wait()
+    end = time.perf_counter()
+    
+    if return_code != 0:
+        raise RuntimeError(f"{app_info['folder'].name} exited with {return_code}")
+    
+    durations = {}
+    for (phase, started), (_, finished) in zip(events, events[1:] + [(None, end)]):
+        durations[phase] = durations.get(phase, 0.0) + finished - started
+    durations['total'] = end - events[0][1]
+    return durations
+
+
+def bench_launch(projects_path, repeat, launch_apps):
+    """Cold launches (no .venv) and warm launches (stamp current) of a few apps"""
+    uv = UvTool()
+    if uv.probe() is None:
+        return {'skipped': "stub uv not found on PATH"}
+    
+    apps = [app_info for app_info in (analyze_app(folder)
+            for folder in list_project_folders(projects_path)[:launch_apps]) if app_info]
+    results = {'cold': {}, 'warm': {}}
+    
+    for _ in range(repeat):
+        for app_info in apps:
+            shutil.rmtree(app_info['folder'] / ".venv", ignore_errors=True)
+            for kind in ('cold', 'warm'):
+                for phase, seconds in time_launch(uv, app_info).items():
+                    results[kind].setdefault(phase, []).append(seconds)
+    
+    return {
+        'apps': len(apps),
+        'uv': uv.version,
+        'cold': {phase: summarize(samples) for phase, samples in results['cold'].items()},
+        'warm': {phase: summarize(samples) for phase, samples in results['warm'].items()},
+    }
+
+
+# Launcher scripts
+
+def run_script(script, uv_log, *args):
+    """Run a generated run.sh; returns (seconds, the uv commands it ran)"""
+    uv_log.write_text("", encoding='utf-8')
+    env = dict(os.environ, LAUNCHER_BENCH_UV_LOG=str(uv_log))
+    
+    start = time.perf_counter()
+    result = subprocess.run(["bash", str(script)] + list(args), capture_output=True, text=True, env=env)
+    seconds = time.perf_counter() - start
+    
+    if result.returncode != 0:
+        raise RuntimeError(f"{script} exited with {result.returncode}: {result.stderr.strip()}")
+    return seconds, uv_log.read_text(encoding='utf-8').splitlines()
+
+
+def bench_scripts(projects_path, repeat, launch_apps):
+    """run.sh installing into a new .venv, starting on the stamp fast path,
+    installing again after requirements.txt changed and syncing to a lock file;
+    fails if uv runs when it should not (or not when it should)"""
+    if sys.platform == 'win32' or shutil.which("bash") is None:
+        return {'skipped': "bash is not available"}
+    
+    apps = [app_info for app_info in (analyze_app(folder)
+            for folder in list_project_folders(projects_path)[:launch_apps * 2])
+            if app_info and app_info['has_requirements']][:launch_apps]
+    uv = UvTool()
+    uv_log = projects_path.parent / ".bench_uv.log"
+    results = {'install': [], 'fast_path': [], 'changed_requirements': [], 'offline_install': [],
+               'locked_install': []}
+    
+    def expect(kind, commands, install):
+        # With a current lock file the scripts sync to it instead of installing
+        installs = [command for command in commands
+                    if command.startswith("pip install") or command.startswith("pip sync")]
+        if install and not installs:
+            raise RuntimeError(f"run.sh did not install dependencies ({kind})")
+        if kind == 'locked_install' and not any(command.startswith("pip sync") for command in installs):
+            raise RuntimeError(f"run.sh did not sync to the lock file: {commands}")
+        if not install and commands:
+            raise RuntimeError(f"run.sh ran uv on the fast path: {commands}")
+        if kind == 'offline_install' and not all("--offline" in command for command in commands):
+            raise RuntimeError(f"run.sh --offline ran uv without --offline: {commands}")
+    
+    for _ in range(repeat):
+        for app_info in apps:
+            folder = app_info['folder']
+            shutil.rmtree(folder / ".venv", ignore_errors=True)
+            # The launch benchmark leaves lock files behind - start from an unlocked app
+            (folder / LOCK_NAME).unlink(missing_ok=True)
+            script, _ = write_launcher_scripts(folder.name, app_info)
+            requirements = folder / "requirements.txt"
+            original = requirements.read_text(encoding='utf-8')
+            
+            for kind, install in (('install', True), ('fast_path', False)):
+                seconds, commands = run_script(script, uv_log)
+                expect(kind, commands, install)
+                results[kind].append(seconds)
+            
+            requirements.write_text(original + "synth-dep-extra==1.0\n", encoding='utf-8')
+            try:
+                seconds, commands = run_script(script, uv_log)
+                expect('changed_requirements', commands, True)
+                results['changed_requirements'].append(seconds)
+            finally:
+                requirements.write_text(original, encoding='utf-8')
+            
+            shutil.rmtree(folder / ".venv", ignore_errors=True)
+            seconds, commands = run_script(script, uv_log, "--offline")
+            expect('offline_install', commands, True)
+            results['offline_install'].append(seconds)
+            
+            # Lock the environment; scripts written from then on sync to the lock
+            write_lock(uv, app_info, folder / ".venv")
+            script, _ = write_launcher_scripts(folder.name, app_info)
+            shutil.rmtree(folder / ".venv", ignore_errors=True)
+            seconds, commands = run_script(script, uv_log)
+            expect('locked_install', commands, True)
+            results['locked_install'].append(seconds)
+    
+    return {
+        'apps': len(apps),
+        **{kind: summarize(samples) for kind, samples in results.items()},
+    }
+
+
+# Offline wheelhouse
+
+def bench_wheelhouse(base_path, projects_path, repeat, launch_apps):
+    """Vendoring from a local index folder, installs from the wheelhouse only, and the
+    network fallback for a wheel it lacks; fails if an install leaves the wheelhouse
+    when it should not (or does not when it should)"""
+    uv = UvTool()
+    if uv.probe() is None:
+        return {'skipped': "stub uv not found on PATH"}
+    
+    apps = [app_info for app_info in (analyze_app(folder)
+            for folder in list_project_folders(projects_path)[:launch_apps * 2])
+            if app_info and app_info['has_requirements']][:launch_apps]
+    
+    # The stub uv's "package index": a folder of wheels for every requirement
+    index_path = base_path / "index"
+    make_wheel_index(index_path, sorted({
+        line.strip() for app_info in apps
+        for line in (app_info['folder'] / "requirements.txt").read_text(encoding='utf-8').splitlines()
+        if line.strip()
+    }))
+    wheelhouse_path = base_path / "wheelhouse"
+    uv_log = base_path / ".bench_uv.log"
+    results = {'vendor': [], 'vendor_again': [], 'offline_install': [], 'fallback_install': []}
+    
+    def reset(app_info):
+        shutil.rmtree(app_info['folder'] / ".venv", ignore_errors=True)
+        (app_info['folder'] / LOCK_NAME).unlink(missing_ok=True)
+    
+    def install(app_info, network_fallback):
+        """prepare_env from the wheelhouse; returns (seconds, the uv pip install/sync commands)"""
+        uv_log.write_text("", encoding='utf-8')
+        start = time.perf_counter()
+        try:
+            prepare_env(uv, app_info, wheelhouse=Wheelhouse(wheelhouse_path, network_fallback))
+        finally:
+            seconds = time.perf_counter() - start
+            commands = [command for command in uv_log.read_text(encoding='utf-8').splitlines()
+                        if command.startswith("pip install") or command.startswith("pip sync")]
+        return seconds, commands
+    
+    def offline(command):
+        return (" --offline " in f" {command} " and " --no-index " in f" {command} "
+                and f"--find-links {wheelhouse_path}" in command)
+    
+    saved_env = {name: os.environ.get(name) for name in ("LAUNCHER_BENCH_UV_LOG", "LAUNCHER_BENCH_INDEX")}
+    os.environ.update(LAUNCHER_BENCH_UV_LOG=str(uv_log), LAUNCHER_BENCH_INDEX=str(index_path))
+    
+    try:
+        for _ in range(repeat):
+            shutil.rmtree(wheelhouse_path, ignore_errors=True)
+            
+            for app_info in apps:
+                # The app's interpreter decides which wheels fit, so vendoring needs its environment
+                reset(app_info)
+                venv_path = prepare_env(uv, app_info)
+                wheelhouse = Wheelhouse(wheelhouse_path)
+                
+                uv_log.write_text("", encoding='utf-8')
+                start = time.perf_counter()
+                added, present = wheelhouse.vendor(uv, app_info, venv_python(venv_path))
+                results['vendor'].append(time.perf_counter() - start)
+                wheels = added + present
+                if not wheels or not set(wheels) <= wheelhouse.wheel_names():
+                    raise RuntimeError(f"vendoring put no wheels into the wheelhouse: {wheels}")
+                if not all(f"--find-links {wheelhouse_path}" in command
+                           for command in uv_log.read_text(encoding='utf-8').splitlines()
+                           if command.startswith("tool run")):
+                    raise RuntimeError("vendoring did not look in the wheelhouse first")
+                
+                start = time.perf_counter()
+                added, present = wheelhouse.vendor(uv, app_info, venv_python(venv_path))
+                results['vendor_again'].append(time.perf_counter() - start)
+                if added:
+                    raise RuntimeError(f"vendoring again added wheels: {added}")
+                
+                reset(app_info)
+                seconds, commands = install(app_info, network_fallback=False)
+                if len(commands) != 1 or not offline(commands[0]):
+                    raise RuntimeError(f"install did not use only the wheelhouse: {commands}")
+                results['offline_install'].append(seconds)
+                
+                # Take one of the app's wheels away: only the fallback may go to the index for it
+                missing = wheelhouse_path / wheels[0]
+                aside = base_path / wheels[0]
+                os.replace(missing, aside)
+                try:
+                    reset(app_info)
+                    seconds, commands = install(app_info, network_fallback=True)
+                    if len(commands) != 2 or not offline(commands[0]) or "--no-index" in commands[1]:
+                        raise RuntimeError(f"install did not fall back to the index: {commands}")
+                    results['fallback_install'].append(seconds)
+                    
+                    reset(app_info)
+                    try:
+                        _, commands = install(app_info, network_fallback=False)
+                    except subprocess.CalledProcessError:
+                        commands = [command for command in uv_log.read_text(encoding='utf-8').splitlines()
+                                    if command.startswith("pip install") or command.startswith("pip sync")]
+                    else:
+                        raise RuntimeError("install succeeded without the missing wheel")
+                    if len(commands) != 1:
+                        raise RuntimeError(f"install fell back to the index with the fallback off: {commands}")
+                finally:
+                    os.replace(aside, missing)
+    finally:
+        for name, value in saved_env.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+    
+    return {
+        'apps': len(apps),
+        **{kind: summarize(samples) for kind, samples in results.items()},
+    }
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Benchmark the launcher on a synthetic projects folder.")
+    parser.add_argument("--apps", type=int, default=200, help="apps in the projects folder")
+    parser.add_argument("--files-per-app", type=int, default=3, help=".py files per app")
+    parser.add_argument("--entry-size", type=int, default=2048, help="entry file size in bytes")
+    parser.add_argument("--imports", type=int, default=5, help="third-party imports per entry file")
+    parser.add_argument("--requirements", choices=["all", "half", "none"], default="half",
+                        help="which apps get a requirements.txt")
+    parser.add_argument("--repeat", type=int, default=3, help="repetitions of each measurement")
+    parser.add_argument("--launch-apps", type=int, default=5, help="apps put through the run pipeline")
+    parser.add_argument("--install-delay", type=float, default=0.0,
+                        help="seconds the stub uv sleeps per install")
+    parser.add_argument("--cards", type=int, default=100, help="AppCards built for the construction timing")
+    parser.add_argument("--skip", action="append", default=[],
+                        choices=["discovery", "rendering", "launch", "scripts", "wheelhouse"], help="leave out a benchmark")
+    parser.add_argument("--show-window", action="store_true",
+                        help="map the window so the card grid renders at full size")
+    parser.add_argument("--keep", action="store_true", help="keep the generated folder")
+    parser.add_argument("--output", help="write the JSON here instead of stdout")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    work = Path(tempfile.mkdtemp(prefix="launcher-bench-"))
+    
+    try:
+        base_path = work / "base"
+        projects_path = base_path / "projects"
+        bin_dir = work / "bin"
+        
+        make_projects(projects_path, apps=args.apps, files_per_app=args.files_per_app,
+                      entry_size=args.entry_size, imports=args.imports,
+                      requirements=args.requirements)
+        write_stub_uv(bin_dir)
+        
+        # The window should not watch, pre-warm or pick up the user's settings
+        (base_path / ".launcher_config.json").write_text(
+            json.dumps({'watch_projects': False, 'prewarm_envs': False}), encoding='utf-8'
+        )
+        
+        os.environ.update(stub_env(bin_dir, install_delay=args.install_delay))
+        
+        results = {
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'params': {key: value for key, value in vars(args).items() if key not in ('output', 'keep')},
+        }
+        
+        if "discovery" not in args.skip:
+            results['discovery'] = bench_discovery(projects_path, base_path / ".bench_index.json",
+                                                   args.repeat)
+        if "rendering" not in args.skip:
+            results['rendering'] = bench_rendering(base_path, args.repeat, args.cards,
+                                                   args.show_window)
+        if "launch" not in args.skip:
+            results['launch'] = bench_launch(projects_path, args.repeat, args.launch_apps)
+        if "scripts" not in args.skip:
+            results['scripts'] = bench_scripts(projects_path, args.repeat, args.launch_apps)
+        if "wheelhouse" not in args.skip:
+            results['wheelhouse'] = bench_wheelhouse(base_path, projects_path, args.repeat,
+                                                     args.launch_apps)
+    finally:
+        if args.keep:
+            print(f"Kept {work}", file=sys.stderr)
+        else:
+            shutil.rmtree(work, ignore_errors=True)
+    
+    text = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding='utf-8')
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,292 @@
+"""
+Synthetic benchmark fixtures - generated projects folders and a stub uv that
+creates fake environments instantly, so benchmarks run offline and repeatably
+"""
+
+import os
+import stat
+import sys
+import textwrap
+import zipfile
+from pathlib import Path
+
+
+# Run by the stub uv; understands just enough of `uv venv` / `uv pip` / `uv tool run pip wheel`
+# for the launcher
+STUB_UV_SOURCE = '''
+import os
+import shutil
+import sys
+import time
+from pathlib import Path
+
+VERSION = "uv 0.0.0 (launcher benchmark stub)"
+
+# Options whose value is not a package
+VALUE_OPTIONS = {"--python", "--find-links", "--wheel-dir", "--from", "-r", "--requirement"}
+
+# Packages "installed" into a stub venv, one requirement per line (what pip freeze reports)
+INSTALLED_NAME = "stub-installed.txt"
+
+
+def make_venv(path):
+    """Lay out a venv whose interpreter is the Python running this stub"""
+    path.mkdir(parents=True, exist_ok=True)
+    if sys.platform == "win32":
+        bin_dir, python = path / "Scripts", "python.exe"
+    else:
+        bin_dir, python = path / "bin", "python"
+    bin_dir.mkdir(exist_ok=True)
+    
+    target = bin_dir / python
+    if not target.exists():
+        if sys.platform == "win32":
+            import shutil
+            shutil.copy2(sys.executable, target)
+        else:
+            os.symlink(sys.executable, target)
+    
+    version = "%d.%d.%d" % sys.version_info[:3]
+    (path / "pyvenv.cfg").write_text(
+        "home = %s\\ninclude-system-site-packages = false\\nversion = %s\\n"
+        % (os.path.dirname(sys.executable), version)
+    )
+
+
+def dist_name(requirement):
+    """Normalized distribution name of a requirement, or of a wheel file name"""
+    name = requirement.split("-")[0] if requirement.endswith(".whl") else requirement
+    for sep in "<>=!~;[ @":
+        name = name.split(sep)[0]
+    return name.strip().lower().replace("-", "_").replace(".", "_")
+
+
+def read_requirements(path):
+    """Requirement lines of a requirements or lock file"""
+    with open(path) as f:
+        lines = [line.split("#")[0].strip() for line in f]
+    return [line for line in lines if line and not line.startswith("-")]
+
+
+def parse_pip_args(args, files_are_positional=False):
+    """(requirements, {option: [values]}) from `pip install/sync/wheel` arguments"""
+    requirements, options = [], {}
+    args = iter(args)
+    for arg in args:
+        if arg in VALUE_OPTIONS:
+            value = next(args)
+            if arg in ("-r", "--requirement"):
+                requirements += read_requirements(value)
+            else:
+                options.setdefault(arg, []).append(value)
+        elif arg.startswith("-"):
+            options.setdefault(arg, [])
+        elif files_are_positional:
+            requirements += read_requirements(arg)
+        else:
+            requirements.append(arg)
+    return requirements, options
+
+
+def find_wheels(requirements, folders):
+    """{name: wheel path} for the requirements that have a wheel in one of folders"""
+    names = {dist_name(requirement) for requirement in requirements}
+    found = {}
+    for folder in folders:
+        if not os.path.isdir(folder):
+            continue
+        for file_name in sorted(os.listdir(folder)):
+            name = dist_name(file_name)
+            if file_name.endswith(".whl") and name in names and name not in found:
+                found[name] = os.path.join(folder, file_name)
+    return found
+
+
+def venv_dir(options):
+    """The venv a `uv pip` command works on (--python's, else ./.venv)"""
+    if "--python" in options:
+        return Path(options["--python"][0]).parent.parent
+    return Path(".venv")
+
+
+def wheel(args):
+    """`pip wheel` - wheels come from --find-links, then the folder LAUNCHER_BENCH_INDEX names"""
+    requirements, options = parse_pip_args(args)
+    index = os.environ.get("LAUNCHER_BENCH_INDEX")
+    found = find_wheels(requirements, options.get("--find-links", []) + ([index] if index else []))
+    missing = sorted({dist_name(requirement) for requirement in requirements} - set(found))
+    if missing:
+        print("stub uv: no wheel for %s" % ", ".join(missing), file=sys.stderr)
+        return 1
+    for path in found.values():
+        shutil.copy(path, options["--wheel-dir"][0])
+    return 0
+
+
+def install(command, args):
+    """`pip install` / `pip sync` - with --no-index only the --find-links wheels are available"""
+    requirements, options = parse_pip_args(args, files_are_positional=command == "sync")
+    # Tests name pins the "index" cannot provide (e.g. made for another Python) here
+    unavailable = set(os.environ.get("LAUNCHER_BENCH_UNAVAILABLE", "").split())
+    if unavailable.intersection(requirements):
+        print("stub uv: cannot install %s" % ", ".join(sorted(unavailable.intersection(requirements))),
+              file=sys.stderr)
+        return 1
+    if "--no-index" in options:
+        found = find_wheels(requirements, options.get("--find-links", []))
+        missing = sorted({dist_name(requirement) for requirement in requirements} - set(found))
+        if missing:
+            print("stub uv: no wheel for %s in --find-links" % ", ".join(missing), file=sys.stderr)
+            return 1
+    
+    # Nothing is downloaded; the delay stands in for resolver/install time
+    time.sleep(float(os.environ.get("LAUNCHER_BENCH_INSTALL_DELAY", "0")))
+    
+    installed = venv_dir(options) / INSTALLED_NAME
+    previous = [] if command == "sync" or not installed.exists() else read_requirements(installed)
+    names = {dist_name(requirement) for requirement in requirements}
+    lines = [line for line in previous if dist_name(line) not in names] + requirements
+    installed.write_text("".join(line + "\\n" for line in lines))
+    return 0
+
+
+def main(args):
+    # Benchmarks that check which uv commands ran point this at a file
+    log = os.environ.get("LAUNCHER_BENCH_UV_LOG")
+    if log:
+        with open(log, "a") as f:
+            f.write(" ".join(args) + "\\n")
+    
+    if args[:1] == ["--version"]:
+        print(VERSION)
+        return 0
+    
+    if args[:1] == ["venv"]:
+        positional = [arg for arg in args[1:] if not arg.startswith("-")]
+        make_venv(Path(positional[0]) if positional else Path(".venv"))
+        time.sleep(float(os.environ.get("LAUNCHER_BENCH_VENV_DELAY", "0")))
+        return 0
+    
+    if args[:2] == ["pip", "freeze"]:
+        installed = venv_dir(parse_pip_args(args[2:])[1]) / INSTALLED_NAME
+        if installed.exists():
+            print(installed.read_text(), end="")
+        return 0
+    
+    if args[:2] in (["pip", "install"], ["pip", "sync"]):
+        return install(args[1], args[2:])
+    
+    if args[:2] == ["tool", "run"] and "wheel" in args:
+        return wheel(args[args.index("wheel") + 1:])
+    
+    print("stub uv: unsupported command: %s" % " ".join(args), file=sys.stderr)
+    return 2
+
+
+sys.exit(main(sys.argv[1:]))
+'''
+
+
+def write_stub_uv(bin_dir):
+    """Install the stub uv into bin_dir (put it first on PATH); returns the command path"""
+    bin_dir = Path(bin_dir)
+    bin_dir.mkdir(parents=True, exist_ok=True)
+    
+    script = bin_dir / "uv_stub.py"
+    script.write_text(STUB_UV_SOURCE, encoding='utf-8')
+    
+    if sys.platform == 'win32':
+        command = bin_dir / "uv.cmd"
+        command.write_text(f'@"{sys.executable}" "{script}" %*\r\n', encoding='utf-8')
+    else:
+        command = bin_dir / "uv"
+        command.write_text(f"#!/bin/sh\nexec '{sys.executable}' '{script}' \"$@\"\n", encoding='utf-8')
+        command.chmod(command.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    
+    return command
+
+
+def entry_source(app_index, imports, size):
+    """Entry file that imports `imports` packages and is padded to about size bytes
+    
+    The app exits before reaching its imports, so it runs without them being
+    installed while discovery still sees every one.
+    """
+    lines = [
+        f'"""Synthetic benchmark app {app_index}"""',
+        "import sys",
+        f"print('synthetic app {app_index} ran')",
+        "sys.exit(0)",
+    ]
+    lines += [f"import synth_dep_{n}" for n in range(imports)]
+    
+    source = "\n".join(lines) + "\n"
+    filler = "# " + "x" * 76 + "\n"
+    while len(source) + len(filler) <= size:
+        source += filler
+    return source
+
+
+def make_projects(projects_path, apps=100, files_per_app=3, entry_size=2048, imports=5,
+                  requirements="half"):
+    """Create a synthetic projects folder
+    
+    requirements is "all", "none" or "half" (every other app gets a requirements.txt).
+    Returns the list of app folders.
+    """
+    projects_path = Path(projects_path)
+    projects_path.mkdir(parents=True, exist_ok=True)
+    folders = []
+    
+    for index in range(apps):
+        folder = projects_path / f"app_{index:05d}"
+        folder.mkdir(exist_ok=True)
+        
+        (folder / "main.py").write_text(entry_source(index, imports, entry_size), encoding='utf-8')
+        for n in range(1, files_per_app):
+            (folder / f"module_{n}.py").write_text(
+                textwrap.dedent(f'''\
+                    """Helper module {n}"""
+                    
+                    def helper_{n}():
+                        return {n}
+                    '''),
+                encoding='utf-8'
+            )
+        
+        if requirements == "all" or (requirements == "half" and index % 2 == 0):
+            (folder / "requirements.txt").write_text(
+                "".join(f"synth-dep-{n}=={n}.0\n" for n in range(imports)),
+                encoding='utf-8'
+            )
+        
+        folders.append(folder)
+    
+    return folders
+
+
+def make_wheel_index(index_path, requirements):
+    """Write a placeholder pure-Python wheel for each "name==version" requirement into
+    index_path, a local stand-in for the package index; returns the wheel paths"""
+    index_path = Path(index_path)
+    index_path.mkdir(parents=True, exist_ok=True)
+    wheels = []
+    
+    for requirement in requirements:
+        name, _, version = requirement.partition("==")
+        name = name.strip().lower().replace("-", "_").replace(".", "_")
+        wheel = index_path / f"{name}-{version or '1.0'}-py3-none-any.whl"
+        with zipfile.ZipFile(wheel, 'w') as archive:
+            archive.writestr(f"{name}/__init__.py", "")
+        wheels.append(wheel)
+    
+    return wheels
+
+
+def stub_env(bin_dir, install_delay=0.0, venv_delay=0.0):
+    """Environment variables that put the stub uv first on PATH"""
+    env = dict(os.environ)
+    env['PATH'] = str(bin_dir) + os.pathsep + env.get('PATH', '')
+    env['LAUNCHER_BENCH_INSTALL_DELAY'] = str(install_delay)
+    env['LAUNCHER_BENCH_VENV_DELAY'] = str(venv_delay)
+    return env
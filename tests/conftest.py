@@ -0,0 +1,55 @@
+"""
+Shared test setup - the launcher package and the bench helpers (synthetic
+projects, the stub uv) are imported straight from the checkout
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "bench"))
+sys.path.insert(0, str(REPO_ROOT))
+
+from synthetic import write_stub_uv  # noqa: E402
+
+from applauncher.envs import UvTool  # noqa: E402
+
+
+class StubUv:
+    """The bench's stub uv on PATH, with a log of every command it was given"""
+    
+    def __init__(self, bin_dir, log):
+        self.path = write_stub_uv(bin_dir)
+        self.log = log
+        self.log.write_text("", encoding='utf-8')
+        self.tool = UvTool()
+    
+    def take_commands(self, *prefixes):
+        """uv commands run since the last call (only those starting with one of prefixes, if given)"""
+        commands = self.log.read_text(encoding='utf-8').splitlines()
+        self.log.write_text("", encoding='utf-8')
+        return [command for command in commands
+                if not prefixes or any(command.startswith(prefix) for prefix in prefixes)]
+
+
+@pytest.fixture
+def stub_uv(tmp_path, monkeypatch):
+    bin_dir = tmp_path / "bin"
+    monkeypatch.setenv("PATH", str(bin_dir) + os.pathsep + os.environ.get("PATH", ""))
+    monkeypatch.setenv("LAUNCHER_BENCH_UV_LOG", str(tmp_path / "uv.log"))
+    monkeypatch.delenv("LAUNCHER_BENCH_INDEX", raising=False)
+    return StubUv(bin_dir, tmp_path / "uv.log")
+
+
+def make_app(folder, source="print('hello')\n", requirements=None):
+    """Write an app folder with a main.py (and a requirements.txt); returns the folder"""
+    folder.mkdir(parents=True)
+    (folder / "main.py").write_text(source, encoding='utf-8')
+    if requirements is not None:
+        (folder / "requirements.txt").write_text("".join(line + "\n" for line in requirements),
+                                                 encoding='utf-8')
+    return folder
@@ -0,0 +1,45 @@
+"""
+Single-file bundles - compiled wheels are unpacked into a shared cache on first run
+"""
+
+import os
+import subprocess
+import sys
+import zipfile
+
+from conftest import make_app
+
+from applauncher.bundle import build_bundle
+from applauncher.discovery import analyze_app
+
+
+NATIVE_WHEEL = "nat-1.0-cp311-cp311-linux_x86_64.whl"
+
+
+def make_native_wheel(folder):
+    """A wheel is_pure_wheel rejects, with a script the bootstrap must leave out"""
+    folder.mkdir(exist_ok=True)
+    with zipfile.ZipFile(folder / NATIVE_WHEEL, 'w') as wheel:
+        wheel.writestr("nat/__init__.py", "VALUE = 42\n")
+        wheel.writestr("nat-1.0.data/scripts/nat-tool", "")
+
+
+def test_bundles_with_the_same_compiled_wheels_share_one_copy(tmp_path, stub_uv):
+    links = tmp_path / "links"
+    make_native_wheel(links)
+    env = dict(os.environ, XDG_CACHE_HOME=str(tmp_path / "cache"))
+    
+    for name in ("first", "second"):
+        folder = make_app(tmp_path / name, f"import nat\nprint('{name}', nat.VALUE)\n", ["nat==1.0"])
+        stub_uv.tool.run(["venv"], cwd=folder, check=True)
+        target, pure, native = build_bundle(stub_uv.tool, analyze_app(folder), folder / ".venv",
+                                            find_links=links)
+        assert (pure, native) == ([], [NATIVE_WHEEL])
+        
+        result = subprocess.run([sys.executable, str(target)], capture_output=True, text=True, env=env)
+        assert result.returncode == 0, result.stderr
+        assert result.stdout == f"{name} 42\n"
+    
+    extracted = list((tmp_path / "cache" / "launcher-bundles").iterdir())
+    assert len(extracted) == 1
+    assert not (extracted[0] / "nat-tool").exists()
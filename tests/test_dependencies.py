@@ -0,0 +1,74 @@
+"""
+Dependency detection - which imports count as required
+"""
+
+import textwrap
+
+from conftest import REPO_ROOT
+
+from applauncher.dependencies import source_imports
+
+
+def imports_of(source):
+    return source_imports(textwrap.dedent(source))
+
+
+def test_import_guarded_by_exit_is_required():
+    # The pattern example_quotes uses: without requests the app just quits
+    names = imports_of("""
+        try:
+            import requests
+        except ImportError:
+            print("This app requires the 'requests' library.")
+            import sys
+            sys.exit(1)
+    """)
+    assert 'requests' in names
+
+
+def test_example_quotes_needs_requests():
+    source = (REPO_ROOT / "projects" / "example_quotes" / "main.py").read_text(encoding='utf-8')
+    assert {'requests', 'urllib3'} <= source_imports(source)
+
+
+def test_reraised_import_error_is_required():
+    names = imports_of("""
+        try:
+            import yaml
+        except ImportError as e:
+            raise SystemExit(f"missing dependency: {e}")
+    """)
+    assert 'yaml' in names
+
+
+def test_import_with_fallback_module_is_optional():
+    names = imports_of("""
+        try:
+            import simplejson as json
+        except ImportError:
+            import json
+    """)
+    assert 'simplejson' not in names
+    assert 'json' in names
+
+
+def test_import_with_fallback_value_is_optional():
+    names = imports_of("""
+        try:
+            import numpy as np
+            HAVE_NUMPY = True
+        except ModuleNotFoundError:
+            HAVE_NUMPY = False
+    """)
+    assert 'numpy' not in names
+
+
+def test_broad_handlers_do_not_make_imports_optional():
+    for handler in ("except:", "except Exception:", "except BaseException:"):
+        names = imports_of(f"""
+            try:
+                import numpy as np
+            {handler}
+                np = None
+        """)
+        assert 'numpy' in names, handler
@@ -0,0 +1,43 @@
+"""
+Environment setup - installs from the app's lock file
+"""
+
+import pytest
+
+from conftest import make_app
+
+from applauncher.discovery import analyze_app
+from applauncher.envs import LOCK_HEADER, LOCK_NAME, dependency_hash, prepare_env
+
+
+@pytest.fixture
+def app_info(tmp_path):
+    return analyze_app(make_app(tmp_path / "app", "import alpha\n", ["alpha"]))
+
+
+def write_lock(app_info, pins):
+    """A lock file made for the app's current requirements"""
+    lock = app_info['folder'] / LOCK_NAME
+    lock.write_text(f"{LOCK_HEADER}{dependency_hash(app_info)}\n" + "".join(pin + "\n" for pin in pins),
+                    encoding='utf-8')
+    return lock
+
+
+def test_current_lock_is_synced(stub_uv, app_info):
+    write_lock(app_info, ["alpha==1.0"])
+    prepare_env(stub_uv.tool, app_info)
+    assert [command.split()[:2] for command in stub_uv.take_commands("pip")] == [["pip", "sync"]]
+
+
+def test_lock_that_no_longer_installs_is_resolved_again(stub_uv, app_info, monkeypatch):
+    # e.g. pins made for the Python version the app used before
+    monkeypatch.setenv("LAUNCHER_BENCH_UNAVAILABLE", "alpha==1.0")
+    lock = write_lock(app_info, ["alpha==1.0"])
+    
+    prepare_env(stub_uv.tool, app_info)
+    commands = [command.split()[:2] for command in stub_uv.take_commands("pip")]
+    assert commands == [["pip", "sync"], ["pip", "install"], ["pip", "freeze"]]
+    
+    text = lock.read_text(encoding='utf-8')
+    assert text.startswith(LOCK_HEADER + dependency_hash(app_info))
+    assert "alpha==1.0" not in text
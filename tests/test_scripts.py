@@ -0,0 +1,72 @@
+"""
+run.sh / run.bat - uv runs only when the app's dependencies changed
+"""
+
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+from conftest import make_app
+
+from applauncher.discovery import analyze_app
+from applauncher.envs import LOCK_NAME, write_lock
+from applauncher.scripts import build_launcher_scripts, write_launcher_scripts
+
+
+needs_bash = pytest.mark.skipif(sys.platform == 'win32' or shutil.which("bash") is None,
+                                reason="run.sh needs bash")
+
+
+@pytest.fixture
+def app_info(tmp_path):
+    return analyze_app(make_app(tmp_path / "app", requirements=["alpha==1.0"]))
+
+
+def run_sh(script, stub_uv):
+    """Run a generated run.sh; returns the `uv pip` commands it ran"""
+    result = subprocess.run(["bash", str(script)], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert "hello" in result.stdout
+    return [command.split()[1] for command in stub_uv.take_commands() if command.startswith("pip")]
+
+
+@needs_bash
+def test_run_sh_installs_only_when_requirements_change(stub_uv, app_info):
+    script, _ = write_launcher_scripts("app", app_info)
+    assert run_sh(script, stub_uv) == ["install"]
+    
+    # The stamp matches, so the app starts without running uv at all
+    assert run_sh(script, stub_uv) == []
+    assert stub_uv.take_commands() == []
+    
+    requirements = app_info['folder'] / "requirements.txt"
+    requirements.write_text(requirements.read_text() + "beta==2.0\n")
+    assert run_sh(script, stub_uv) == ["install"]
+    assert run_sh(script, stub_uv) == []
+
+
+@needs_bash
+def test_run_sh_syncs_again_when_the_lock_changes(stub_uv, app_info):
+    script, _ = write_launcher_scripts("app", app_info)
+    run_sh(script, stub_uv)
+    
+    # Scripts written once the app is locked sync to the lock file
+    write_lock(stub_uv.tool, app_info, app_info['folder'] / ".venv")
+    stub_uv.take_commands()
+    script, _ = write_launcher_scripts("app", app_info)
+    assert run_sh(script, stub_uv) == ["sync"]
+    assert run_sh(script, stub_uv) == []
+    
+    lock = app_info['folder'] / LOCK_NAME
+    lock.write_text(lock.read_text() + "gamma==3.0\n")
+    assert run_sh(script, stub_uv) == ["sync"]
+    assert run_sh(script, stub_uv) == []
+
+
+def test_run_bat_sets_env_values_literally(app_info):
+    app_info = dict(app_info, env={'GREETING': '100% "done" & more', 'PIPE': 'a"b|c'})
+    _, bat_script = build_launcher_scripts("app", app_info)
+    assert 'set "GREETING=100%% "done" & more"\n' in bat_script
+    assert 'set "PIPE=a"b^|c"\n' in bat_script
@@ -0,0 +1,85 @@
+"""
+Projects folder watcher - removed and moved category folders
+"""
+
+import queue
+import shutil
+import time
+
+import pytest
+
+from conftest import make_app
+
+from applauncher.discovery import ScanIndex
+from applauncher.watcher import ProjectWatcher
+
+
+@pytest.fixture
+def projects(tmp_path):
+    root = tmp_path / "projects"
+    make_app(root / "tools" / "alpha")
+    make_app(root / "tools" / "nested" / "beta")
+    make_app(root / "gamma")
+    return root
+
+
+def start_watcher(root):
+    """A started watcher and the queue its reports arrive on"""
+    reports = queue.Queue()
+    watcher = ProjectWatcher(root, reports.put, poll_interval=0.2)
+    watcher.start()
+    deadline = time.monotonic() + 5
+    while watcher.mode is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    # Let polling take its first snapshot before anything changes
+    time.sleep(0.3)
+    return watcher, reports
+
+
+def reported_until(reports, expected, timeout=5.0):
+    """Every folder reported until the expected ones have all been seen (or the timeout)"""
+    seen = set()
+    deadline = time.monotonic() + timeout
+    while not expected <= seen:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        try:
+            seen.update(reports.get(timeout=remaining))
+        except queue.Empty:
+            break
+    return seen
+
+
+def test_removing_a_category_reports_its_apps(projects):
+    watcher, reports = start_watcher(projects)
+    try:
+        shutil.rmtree(projects / "tools")
+        expected = {projects / "tools" / "alpha", projects / "tools" / "nested" / "beta"}
+        assert expected <= reported_until(reports, expected)
+    finally:
+        watcher.stop()
+
+
+def test_moving_a_category_away_reports_its_apps(projects, tmp_path):
+    watcher, reports = start_watcher(projects)
+    try:
+        (projects / "tools").rename(tmp_path / "elsewhere")
+        expected = {projects / "tools" / "alpha", projects / "tools" / "nested" / "beta"}
+        assert expected <= reported_until(reports, expected)
+        
+        # The moved folders are no longer watched, so changes there are not reported
+        (tmp_path / "elsewhere" / "alpha" / "main.py").write_text("print('moved')\n")
+        assert not reported_until(reports, {projects / "gamma"}, timeout=1.0)
+    finally:
+        watcher.stop()
+
+
+def test_index_forgets_folders_below_a_removed_one(projects, tmp_path):
+    index = ScanIndex(tmp_path / "index.json", names={})
+    for folder in (projects / "tools" / "alpha", projects / "tools" / "nested" / "beta",
+                   projects / "gamma", projects / "toolsmith"):
+        index.store(folder, [1], None)
+    
+    index.remove(projects / "tools")
+    assert sorted(index.entries) == [str(projects / "gamma"), str(projects / "toolsmith")]
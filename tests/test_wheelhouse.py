@@ -0,0 +1,88 @@
+"""
+Offline wheelhouse - vendoring from local wheels and offline-first installs
+"""
+
+import subprocess
+
+import pytest
+
+from conftest import make_app
+from synthetic import make_wheel_index
+
+from applauncher.discovery import analyze_app
+from applauncher.envs import install_packages, venv_python
+from applauncher.wheelhouse import Wheelhouse, build_wheels
+
+
+REQUIREMENTS = ["alpha==1.0", "beta==2.0"]
+WHEELS = {"alpha-1.0-py3-none-any.whl", "beta-2.0-py3-none-any.whl"}
+
+
+@pytest.fixture
+def app(tmp_path, stub_uv):
+    """(app_info, interpreter of its venv) for an app that needs REQUIREMENTS"""
+    folder = make_app(tmp_path / "projects" / "app", "import alpha\nimport beta\n", REQUIREMENTS)
+    stub_uv.tool.run(["venv"], cwd=folder, check=True)
+    stub_uv.take_commands()
+    return analyze_app(folder), venv_python(folder / ".venv")
+
+
+def is_offline(command, wheelhouse):
+    words = command.split()
+    return "--offline" in words and "--no-index" in words and f"--find-links {wheelhouse.path}" in command
+
+
+def test_wheelhouse_is_built_from_find_links(tmp_path, stub_uv, app):
+    app_info, python_exe = app
+    links = tmp_path / "links"
+    make_wheel_index(links, REQUIREMENTS)
+    wheelhouse = Wheelhouse(tmp_path / "wheelhouse")
+    wheelhouse.path.mkdir()
+    
+    build_wheels(stub_uv.tool, app_info, python_exe, wheelhouse.path, find_links=links)
+    assert wheelhouse.wheel_names() == WHEELS
+    commands = stub_uv.take_commands("tool run")
+    assert commands and all(f"--find-links {links}" in command for command in commands)
+    
+    # Vendoring finds every wheel in the wheelhouse already, with no index to download from
+    added, present = wheelhouse.vendor(stub_uv.tool, app_info, python_exe)
+    assert added == []
+    assert set(present) == WHEELS
+
+
+def test_install_uses_only_the_wheelhouse_when_it_has_everything(tmp_path, stub_uv, app):
+    app_info, python_exe = app
+    wheelhouse = Wheelhouse(tmp_path / "wheelhouse", network_fallback=True)
+    make_wheel_index(wheelhouse.path, REQUIREMENTS)
+    
+    install_packages(stub_uv.tool, ["-r", "requirements.txt", "--python", str(python_exe)], wheelhouse,
+                     cwd=app_info['folder'], capture_output=True)
+    commands = stub_uv.take_commands("pip")
+    assert len(commands) == 1
+    assert is_offline(commands[0], wheelhouse)
+
+
+def test_missing_wheel_fails_without_network_fallback(tmp_path, stub_uv, app):
+    app_info, python_exe = app
+    wheelhouse = Wheelhouse(tmp_path / "wheelhouse", network_fallback=False)
+    make_wheel_index(wheelhouse.path, REQUIREMENTS[:1])
+    
+    with pytest.raises(subprocess.CalledProcessError):
+        install_packages(stub_uv.tool, ["-r", "requirements.txt", "--python", str(python_exe)], wheelhouse,
+                         cwd=app_info['folder'], capture_output=True)
+    commands = stub_uv.take_commands("pip")
+    assert len(commands) == 1
+    assert is_offline(commands[0], wheelhouse)
+
+
+def test_missing_wheel_goes_to_the_index_with_network_fallback(tmp_path, stub_uv, app):
+    app_info, python_exe = app
+    wheelhouse = Wheelhouse(tmp_path / "wheelhouse", network_fallback=True)
+    make_wheel_index(wheelhouse.path, REQUIREMENTS[:1])
+    
+    install_packages(stub_uv.tool, ["-r", "requirements.txt", "--python", str(python_exe)], wheelhouse,
+                     cwd=app_info['folder'], capture_output=True)
+    commands = stub_uv.take_commands("pip")
+    assert len(commands) == 2
+    assert is_offline(commands[0], wheelhouse)
+    assert not is_offline(commands[1], wheelhouse)